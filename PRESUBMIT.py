@@ -13,9 +13,17 @@ for more details about the presubmit API built into gcl.
 `git cl presubmit -v -v` to debug presubmit checks.
 """
 
+import atexit
+import collections
+import concurrent.futures
+import hashlib
+import json
+import os
 import re
 import sys
 import six
+import tempfile
+import threading
 import time
 
 from pathlib import Path
@@ -55,23 +63,43 @@ def _ExecuteSubProcess(input_api,
                        script_path,
                        script_arguments=None,
                        message=None):
+    command = _SubProcessCommand(input_api, script_path, script_arguments)
+    returncode, out, time_difference = _RunSubProcess(input_api, command)
+    return _SubProcessResults(
+        output_api, message if message is not None else script_path,
+        returncode, out, time_difference)
+
+
+def _SubProcessCommand(input_api, script_path, script_arguments=None):
     if isinstance(script_path, six.string_types):
         script_path = [input_api.python3_executable, script_path]
+    return script_path + (script_arguments or [])
+
 
+def _RunSubProcess(input_api, command, processes=None):
+    """Runs `command` and returns its exit code, output and duration.
+
+    The process is in `processes` while it runs, if given."""
     start_time = time.time()
-    process = input_api.subprocess.Popen(script_path +
-                                         (script_arguments or []),
+    process = input_api.subprocess.Popen(command,
                                          stdout=input_api.subprocess.PIPE,
                                          stderr=input_api.subprocess.STDOUT)
-    out, _ = process.communicate()
-    end_time = time.time()
-    time_difference = end_time - start_time
+    if processes is not None:
+        processes.add(process)
+    try:
+        out, _ = process.communicate()
+    finally:
+        if processes is not None:
+            processes.discard(process)
+    return process.returncode, out, time.time() - start_time
+
+
+def _SubProcessResults(output_api, message, returncode, out, time_difference):
     return [
         output_api.PresubmitError(
             "%s (%.1fs): %s" %
-            (message if message is not None else script_path, time_difference,
-             out.decode('utf-8').strip()))
-    ] if process.returncode != 0 else []
+            (message, time_difference, out.decode('utf-8').strip()))
+    ] if returncode != 0 else []
 
 
 def _IsEnvCog(input_api):
@@ -94,27 +122,117 @@ def _GetAffectedFiles(input_api, parent_directories, excluded_actions,
     """Return absolute file paths of affected files (not due to an excluded action)
        under a parent directory with an accepted file ending.
     """
-    local_paths = [
-        f.AbsoluteLocalPath() for f in input_api.AffectedFiles()
-        if all(f.Action() != action for action in excluded_actions)
-    ]
-    affected_files = [
-        file_name for file_name in local_paths
-        if any(parent_directory in file_name
-               for parent_directory in parent_directories) and (
-                   len(accepted_endings) == 0 or any(
-                       file_name.endswith(accepted_ending)
-                       for accepted_ending in accepted_endings))
-    ]
-    return affected_files
+    if isinstance(parent_directories, six.string_types):
+        parent_directories = [parent_directories]
+    return _GetAffectedFileIndex(input_api).Files(parent_directories,
+                                                  excluded_actions,
+                                                  accepted_endings)
+
 
+_affected_file_index = None
 
-def _CheckWithNodeScript(input_api,
-                         output_api,
-                         script_path,
-                         script_arguments=None,
-                         allow_typescript=False,
-                         message=None):
+
+def _GetAffectedFileIndex(input_api):
+    """Returns the _AffectedFileIndex of the change, built once per run."""
+    global _affected_file_index
+    if (_affected_file_index is None
+            or _affected_file_index[0] is not input_api):
+        _affected_file_index = (input_api,
+                                _AffectedFileIndex(input_api.AffectedFiles()))
+    return _affected_file_index[1]
+
+
+def _PathComponents(path):
+    return [c for c in os.path.normpath(path).split(os.sep) if c]
+
+
+def _FileExtension(name):
+    dot = name.rfind('.')
+    return name[dot:] if dot != -1 else ''
+
+
+class _AffectedFileIndex(object):
+    """The affected files of a change, in a trie of their path components.
+
+    Files are kept by extension in the node of their directory, so finding
+    the files under a path only walks the components of that path and the
+    directories below it that have affected files.
+    """
+
+    class _Node(object):
+        __slots__ = ('children', 'files')
+
+        def __init__(self):
+            self.children = {}
+            # The (index, path, action) of the files in the directory, by
+            # extension.
+            self.files = {}
+
+    def __init__(self, affected_files):
+        self._root = self._Node()
+        directories = {}
+        for index, f in enumerate(affected_files):
+            path = f.AbsoluteLocalPath()
+            directory, name = os.path.split(os.path.normpath(path))
+            node = directories.get(directory)
+            if node is None:
+                node = directories[directory] = self._Insert(directory)
+            # Files are also nodes, so that they can be parents themselves.
+            node = node.children.get(name) or node.children.setdefault(
+                name, self._Node())
+            node.files.setdefault(_FileExtension(name), []).append(
+                (index, path, f.Action()))
+
+    def _Insert(self, path):
+        node = self._root
+        for component in _PathComponents(path):
+            child = node.children.get(component)
+            if child is None:
+                child = node.children[component] = self._Node()
+            node = child
+        return node
+
+    def _Find(self, path):
+        node = self._root
+        for component in _PathComponents(path):
+            node = node.children.get(component)
+            if node is None:
+                return None
+        return node
+
+    def Files(self, parent_paths, excluded_actions=(), accepted_endings=()):
+        """Returns the paths of the files at or below any of `parent_paths`
+        that end with any of `accepted_endings` (or with anything, if it is
+        empty), in the order of the affected files."""
+        extensions = set()
+        other_endings = []
+        for ending in accepted_endings:
+            if ending.startswith('.') and '.' not in ending[1:]:
+                extensions.add(ending)
+            else:
+                other_endings.append(ending)
+        other_endings = tuple(other_endings)
+
+        entries = {}
+        nodes = [self._Find(parent_path) for parent_path in parent_paths]
+        while nodes:
+            node = nodes.pop()
+            if node is None:
+                continue
+            nodes.extend(node.children.values())
+            for extension, files in node.files.items():
+                if not accepted_endings or extension in extensions:
+                    entries.update((entry[0], entry) for entry in files)
+                elif other_endings:
+                    entries.update((entry[0], entry) for entry in files
+                                   if entry[1].endswith(other_endings))
+        return [
+            path for _, path, action in sorted(entries.values())
+            if action not in excluded_actions
+        ]
+
+
+def _NodeScriptCommand(input_api, script_path, script_arguments=None):
     original_sys_path = sys.path
     try:
         sys.path = sys.path + [
@@ -124,13 +242,7 @@ def _CheckWithNodeScript(input_api,
     finally:
         sys.path = original_sys_path
 
-    process = [devtools_paths.node_path(), script_path]
-
-    return _ExecuteSubProcess(input_api,
-                              output_api,
-                              process,
-                              script_arguments=script_arguments,
-                              message=message)
+    return [devtools_paths.node_path(), script_path] + (script_arguments or [])
 
 
 def _GetFilesToLint(input_api, lint_config_files, accepted_endings):
@@ -162,6 +274,229 @@ def _CheckFormat(input_api, output_api):
                               message='Format')
 
 
+# Checks that each run one subprocess and do not depend on each other are
+# scheduled together: the first of them that presubmit calls starts all of
+# them, at most _MAX_PARALLEL_CHECKS at a time, and every check then waits
+# for its own result, so that results are reported in the usual order.
+# Passing checks are cached in the checkout's git directory by a digest of
+# the checkout, so running presubmit again on an unchanged tree does not run
+# them again. The scheduler is closed once every check got its result, or
+# when presubmit exits if some checks were not called: checks that did not
+# start are cancelled, running ones are killed and the cache is saved.
+_MAX_PARALLEL_CHECKS = 4
+_scheduler = None
+
+
+def _ScheduledCheckResults(input_api, output_api, message):
+    """Returns the results of the scheduled check named `message`."""
+    global _scheduler
+    if _scheduler is None:
+        _scheduler = _CheckScheduler(input_api, output_api,
+                                     _SCHEDULED_CHECKS)
+    results = _scheduler.Results(message)
+    if _scheduler.Done():
+        _scheduler = None
+    return results
+
+
+def _WaitForScheduledChecks():
+    """Waits until no scheduled check is running, without reporting them."""
+    if _scheduler is not None:
+        _scheduler.Wait()
+
+
+def _CheckoutDigest(input_api):
+    """Returns a digest of the tracked and untracked files of the checkout, or
+    None outside of git.
+
+    Untracked files are hashed by size and modification time, as they can be
+    large build outputs."""
+    if _IsEnvCog(input_api):
+        return None
+    digest = hashlib.sha256()
+    outputs = []
+    for command in (['git', 'rev-parse', 'HEAD^{tree}'],
+                    ['git', 'diff', 'HEAD', '--binary'],
+                    ['git', 'ls-files', '--others', '--exclude-standard',
+                     '-z']):
+        process = input_api.subprocess.Popen(
+            command,
+            cwd=input_api.PresubmitLocalPath(),
+            stdout=input_api.subprocess.PIPE,
+            stderr=input_api.subprocess.PIPE)
+        out, _ = process.communicate()
+        if process.returncode != 0:
+            return None
+        digest.update(out)
+        digest.update(b'\0')
+        outputs.append(out)
+    # `git diff` does not include untracked files, which checks see as well.
+    for name in outputs[-1].split(b'\0'):
+        if not name:
+            continue
+        try:
+            stat = os.stat(
+                os.path.join(input_api.PresubmitLocalPath(),
+                             os.fsdecode(name)))
+            digest.update(b'%d %d\0' % (stat.st_size, stat.st_mtime_ns))
+        except OSError:
+            digest.update(b'-\0')
+    return digest.hexdigest()
+
+
+def _CheckCacheFile(input_api):
+    """Returns the cache file of this checkout, or None if it has none."""
+    original_sys_path = sys.path
+    try:
+        sys.path = sys.path + [
+            input_api.os_path.join(input_api.PresubmitLocalPath(), 'scripts')
+        ]
+        import devtools_paths
+    finally:
+        sys.path = original_sys_path
+    return devtools_paths.checkout_cache_path('presubmit_cache.json')
+
+
+def _LoadCheckCache(cache_file):
+    if cache_file is None:
+        return {}
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+        return cache if isinstance(cache, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def _SaveCheckCache(cache_file, entries):
+    if cache_file is None:
+        return
+    try:
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(cache_file))
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(entries, f, indent=1)
+        os.replace(temp_path, cache_file)
+    except OSError:
+        # The cache only saves time.
+        pass
+
+
+class _CheckScheduler(object):
+
+    def __init__(self, input_api, output_api, planners):
+        self._input_api = input_api
+        self._output_api = output_api
+        self._start_time = time.time()
+        self._checkout_digest = _CheckoutDigest(input_api)
+        self._cache_file = _CheckCacheFile(input_api)
+        self._cache = _LoadCheckCache(self._cache_file)
+        self._cache_changed = False
+        self._closed = False
+        self._pending = {}
+        self._timings = []
+        self._queue = collections.deque()
+        self._processes = set()
+        for message, planner in planners:
+            command = planner(input_api)
+            if command is None:
+                self._pending[message] = None
+                continue
+            digest = self._Digest(message, command)
+            if digest is not None and self._cache.get(message) == digest:
+                self._pending[message] = None
+                self._timings.append((message, 'cached'))
+                continue
+            future = concurrent.futures.Future()
+            self._queue.append((command, future))
+            self._pending[message] = (digest, future)
+        # The workers are daemon threads, so that presubmit can exit, and
+        # Close() run, while checks that were not called are still queued.
+        workers = max(1, min(_MAX_PARALLEL_CHECKS, input_api.cpu_count))
+        for _ in range(min(workers, len(self._queue))):
+            threading.Thread(target=self._Work, daemon=True).start()
+        atexit.register(self.Close)
+
+    def _Work(self):
+        while True:
+            try:
+                command, future = self._queue.popleft()
+            except IndexError:
+                return
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(
+                    _RunSubProcess(self._input_api, command, self._processes))
+            except Exception as e:
+                future.set_exception(e)
+
+    def _Digest(self, message, command):
+        if self._checkout_digest is None:
+            return None
+        return hashlib.sha256(
+            json.dumps([self._checkout_digest, message,
+                        command]).encode('utf-8')).hexdigest()
+
+    def Results(self, message):
+        planned = self._pending.pop(message)
+        results = []
+        if planned is not None:
+            digest, future = planned
+            returncode, out, time_difference = future.result()
+            self._timings.append((message, '%.1fs' % time_difference))
+            results = _SubProcessResults(self._output_api, message,
+                                         returncode, out, time_difference)
+            if returncode == 0 and digest is not None:
+                self._cache[message] = digest
+                self._cache_changed = True
+            elif self._cache.pop(message, None) is not None:
+                self._cache_changed = True
+        if self.Done():
+            self.Close()
+            if self._timings:
+                results.append(self._TimingTable())
+        return results
+
+    def Close(self):
+        """Cancels and kills the checks whose results were not asked for, and
+        saves the cache. Does nothing if already closed."""
+        if self._closed:
+            return
+        self._closed = True
+        atexit.unregister(self.Close)
+        for planned in self._pending.values():
+            if planned is not None:
+                planned[1].cancel()
+        for process in list(self._processes):
+            try:
+                process.kill()
+            except OSError:
+                pass
+        if self._cache_changed:
+            _SaveCheckCache(self._cache_file, self._cache)
+            self._cache_changed = False
+
+    def Wait(self):
+        concurrent.futures.wait([
+            planned[1] for planned in self._pending.values()
+            if planned is not None
+        ])
+
+    def Done(self):
+        return not self._pending
+
+    def _TimingTable(self):
+        width = max([len(message) for message, _ in self._timings] + [9])
+        lines = ['Scheduled presubmit checks:']
+        lines.extend('  %-*s %8s' % (width, message, timing)
+                     for message, timing in self._timings)
+        lines.append('  %-*s %8s' %
+                     (width, 'Wall time', '%.1fs' %
+                      (time.time() - self._start_time)))
+        return self._output_api.PresubmitNotifyResult('\n'.join(lines))
+
+
 def CheckBugAssociationOnCommit(input_api, output_api):
     results = []
     bugs = input_api.change.BugsFromDescription()
@@ -181,6 +516,11 @@ def CheckBugAssociationOnCommit(input_api, output_api):
 
 
 def CheckExperimentTelemetry(input_api, output_api):
+    return _ScheduledCheckResults(input_api, output_api,
+                                  'Experiment telemetry')
+
+
+def _PlanExperimentTelemetry(input_api):
     experiment_telemetry_files = [
         input_api.os_path.join(input_api.PresubmitLocalPath(), 'front_end',
                                'entrypoints', 'main', 'MainImpl.ts'),
@@ -191,27 +531,34 @@ def CheckExperimentTelemetry(input_api, output_api):
                                             experiment_telemetry_files, [],
                                             ['.ts'])
     if len(affected_main_files) == 0:
-        return []
+        return None
 
     script_path = input_api.os_path.join(input_api.PresubmitLocalPath(),
                                          'scripts', 'check_experiments.js')
-    return _CheckWithNodeScript(input_api,
-                                output_api,
-                                script_path,
-                                message='Experiment telemetry')
+    return _NodeScriptCommand(input_api, script_path)
 
 
 def CheckESBuildVersion(input_api, output_api):
+    return _ScheduledCheckResults(input_api, output_api, 'ESBuild version')
+
+
+def _PlanESBuildVersion(input_api):
     script_path = input_api.os_path.join(input_api.PresubmitLocalPath(),
                                          'scripts',
                                          'check_esbuild_versions.js')
-    return _CheckWithNodeScript(input_api,
-                                output_api,
-                                script_path,
-                                message='ESBuild version')
+    return _NodeScriptCommand(input_api, script_path)
 
 
 def CheckDevToolsLint(input_api, output_api):
+    results = _ScheduledCheckResults(input_api, output_api, 'Lint')
+    # The formatter rewrites files, so it only runs once no other check is
+    # reading them.
+    _WaitForScheduledChecks()
+    results.extend(_CheckFormat(input_api, output_api))
+    return results
+
+
+def _PlanDevToolsLint(input_api):
     lint_path = input_api.os_path.join(input_api.PresubmitLocalPath(),
                                        'scripts', 'test', 'run_lint_check.mjs')
 
@@ -236,30 +583,22 @@ def CheckDevToolsLint(input_api, output_api):
     should_bail_out, files_to_lint = _GetFilesToLint(
         input_api, lint_config_files, ['.css', '.mjs', '.js', '.ts'])
     if should_bail_out:
-        # Run the formatter on all non-js like files
-        results = []
-        results.extend(_CheckFormat(input_api, output_api))
-        return results
+        # Only the formatter runs on all non-js like files.
+        return None
 
     # If there are more than 50 files to check, don't bother and check
     # everything, so as to not run into command line length limits on Windows.
     if len(files_to_lint) > 50:
         files_to_lint = []
 
-    results = []
-    results.extend(
-        _CheckWithNodeScript(input_api,
-                             output_api,
-                             lint_path,
-                             script_arguments=files_to_lint,
-                             allow_typescript=True,
-                             message="Lint"))
-
-    results.extend(_CheckFormat(input_api, output_api))
-    return results
+    return _NodeScriptCommand(input_api, lint_path, files_to_lint)
 
 
 def CheckGeneratedFiles(input_api, output_api):
+    return _ScheduledCheckResults(input_api, output_api, 'Generated files')
+
+
+def _PlanGeneratedFiles(input_api):
     v8_directory_path = input_api.os_path.join(input_api.PresubmitLocalPath(),
                                                'v8')
     blink_directory_path = input_api.os_path.join(
@@ -275,6 +614,10 @@ def CheckGeneratedFiles(input_api, output_api):
         scripts_build_path, 'generate_supported_css.py')
     generated_deprecation_path = input_api.os_path.join(
         scripts_build_path, 'generate_deprecations.py')
+    json5_generator_path = input_api.os_path.join(scripts_build_path,
+                                                  'json5_generator.py')
+    generated_files_path = input_api.os_path.join(scripts_build_path,
+                                                  'generated_files.py')
     generated_protocol_path = input_api.os_path.join(
         scripts_build_path, 'code_generator_frontend.py')
     generated_protocol_typescript_path = input_api.os_path.join(
@@ -283,7 +626,12 @@ def CheckGeneratedFiles(input_api, output_api):
         input_api.PresubmitLocalPath(), 'third_party', 'inspector_protocol',
         'concatenate_protocols.py')
 
+    generate_protocol_resources_path = input_api.os_path.join(
+        input_api.PresubmitLocalPath(), 'scripts', 'deps',
+        'generate_protocol_resources.py')
+
     affected_files = _GetAffectedFiles(input_api, [
+        generate_protocol_resources_path,
         v8_directory_path,
         blink_directory_path,
         input_api.os_path.join(input_api.PresubmitLocalPath(), 'third_party',
@@ -291,6 +639,8 @@ def CheckGeneratedFiles(input_api, output_api):
         generated_aria_path,
         generated_supported_css_path,
         generated_deprecation_path,
+        json5_generator_path,
+        generated_files_path,
         concatenate_protocols_path,
         generated_protocol_path,
         scripts_generated_output_path,
@@ -298,19 +648,22 @@ def CheckGeneratedFiles(input_api, output_api):
     ], [], ['.pdl', '.json5', '.py', '.js', '.ts'])
 
     if len(affected_files) == 0:
-        return []
+        return None
 
-    generate_protocol_resources_path = input_api.os_path.join(
-        input_api.PresubmitLocalPath(), 'scripts', 'deps',
-        'generate_protocol_resources.py')
+    # Only the generators that use the affected files are run, unless there
+    # are so many that the command line could get too long.
+    if len(affected_files) > 50:
+        affected_files = []
 
-    return _ExecuteSubProcess(input_api,
-                              output_api,
-                              generate_protocol_resources_path,
-                              message='Generated files')
+    return _SubProcessCommand(input_api, generate_protocol_resources_path,
+                              ['--check'] + affected_files)
 
 
 def CheckL10nStrings(input_api, output_api):
+    return _ScheduledCheckResults(input_api, output_api, 'l10n strings')
+
+
+def _PlanL10nStrings(input_api):
     devtools_root = input_api.PresubmitLocalPath()
     devtools_front_end = input_api.os_path.join(devtools_root, 'front_end')
     script_path = input_api.os_path.join(devtools_root, 'third_party', 'i18n',
@@ -318,11 +671,8 @@ def CheckL10nStrings(input_api, output_api):
     affected_front_end_files = _GetAffectedFiles(
         input_api, [devtools_front_end, script_path], [], ['.js', '.ts'])
     if len(affected_front_end_files) == 0:
-        return []
-    return _CheckWithNodeScript(input_api,
-                                output_api,
-                                script_path, [devtools_front_end],
-                                message='l10n strings')
+        return None
+    return _NodeScriptCommand(input_api, script_path, [devtools_front_end])
 
 
 def CheckForTooLargeFiles(input_api, output_api):
@@ -356,28 +706,42 @@ def CheckForTooLargeFiles(input_api, output_api):
 
 
 def CheckObsoleteScreenshotGoldens(input_api, output_api):
+    return _ScheduledCheckResults(input_api, output_api,
+                                  'Obsolete screenshot images')
+
+
+def _PlanObsoleteScreenshotGoldens(input_api):
     script_path = input_api.os_path.join(input_api.PresubmitLocalPath(),
                                          'scripts', 'test',
                                          'check_obsolete_goldens.js')
-    return _CheckWithNodeScript(input_api,
-                                output_api,
-                                script_path,
-                                script_arguments=[],
-                                message='Obsolete screenshot images')
+    return _NodeScriptCommand(input_api, script_path)
 
 
 def CheckTestExpectations(input_api, output_api):
+    return _ScheduledCheckResults(input_api, output_api, 'Test expectations')
+
+
+def _PlanTestExpectations(input_api):
     script_path = input_api.os_path.join(input_api.PresubmitLocalPath(),
                                          'scripts', 'test',
                                          'check_test_expectations.js')
     expectations_path = input_api.os_path.join(input_api.PresubmitLocalPath(),
                                                'test', 'TestExpectations')
-    return _CheckWithNodeScript(
-        input_api,
-        output_api,
-        script_path,
-        script_arguments=['--expectations-file', expectations_path],
-        message='Test expectations')
+    return _NodeScriptCommand(input_api, script_path,
+                              ['--expectations-file', expectations_path])
+
+
+# The checks run by _CheckScheduler, with the functions that return their
+# command, or None if they have nothing to check.
+_SCHEDULED_CHECKS = [
+    ('Experiment telemetry', _PlanExperimentTelemetry),
+    ('ESBuild version', _PlanESBuildVersion),
+    ('Lint', _PlanDevToolsLint),
+    ('Generated files', _PlanGeneratedFiles),
+    ('l10n strings', _PlanL10nStrings),
+    ('Obsolete screenshot images', _PlanObsoleteScreenshotGoldens),
+    ('Test expectations', _PlanTestExpectations),
+]
 
 
 _UPDATE_NODE_DEPENDENCIES_FOOTER = 'Update-Node-Dependencies'
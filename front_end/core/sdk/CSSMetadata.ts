@@ -39,56 +39,22 @@ import * as SupportedCSSProperties from '../../generated/SupportedCSSProperties.
 import * as Common from '../common/common.js';
 
 export class CSSMetadata {
-  readonly #values: string[] = [];
-  readonly #longhands = new Map<string, string[]>();
-  readonly #shorthands = new Map<string, string[]>();
-  readonly #inherited = new Set<string>();
-  readonly #svgProperties = new Set<string>();
+  readonly #values: string[];
+  readonly #table: CSSPropertyTable;
   readonly #propertyValues = new Map<string, string[]>();
   readonly #aliasesFor = new Map<string, string>();
   readonly #nameValuePresets: string[] = [];
   readonly #nameValuePresetsIncludingSVG: string[] = [];
-  #valuesSet: Set<string>;
 
-  constructor(properties: CSSPropertyDefinition[], aliasesFor: Map<string, string>) {
+  /**
+   * `table` is generated by scripts/build/generate_supported_css.py, which
+   * already filters out descriptors and properties behind unstable runtime
+   * flags and sorts the properties, so nothing is indexed at startup.
+   */
+  constructor(table: CSSPropertyTable, aliasesFor: Map<string, string>) {
     this.#aliasesFor = aliasesFor;
-    for (let i = 0; i < properties.length; ++i) {
-      const property = properties[i];
-      const propertyName = property.name;
-      if ('is_descriptor' in property && 'is_property' in property) {
-        if (property.is_descriptor && !property.is_property) {
-          continue;
-        }
-      }
-      const runtimeFlagStatus = property.runtime_flag_status;
-      if (Boolean(runtimeFlagStatus) && runtimeFlagStatus !== 'stable') {
-        continue;
-      }
-      this.#values.push(propertyName);
-
-      if (property.inherited) {
-        this.#inherited.add(propertyName);
-      }
-      if (property.svg) {
-        this.#svgProperties.add(propertyName);
-      }
-
-      const longhands = properties[i].longhands;
-      if (longhands) {
-        this.#longhands.set(propertyName, longhands);
-        for (let j = 0; j < longhands.length; ++j) {
-          const longhandName = longhands[j];
-          let shorthands = this.#shorthands.get(longhandName);
-          if (!shorthands) {
-            shorthands = [];
-            this.#shorthands.set(longhandName, shorthands);
-          }
-          shorthands.push(propertyName);
-        }
-      }
-    }
-    this.#values.sort(CSSMetadata.sortPrefixesAndCSSWideKeywordsToEnd);
-    this.#valuesSet = new Set(this.#values);
+    this.#table = table;
+    this.#values = Object.keys(table.flags);
 
     // Reads in auto-generated property names and #values from blink/public/renderer/core/css/css_properties.json5
     // treats _generatedPropertyValues as basis
@@ -107,16 +73,12 @@ export class CSSMetadata {
     }
     // and add common keywords for shorthands
     const commonKeywordSet = new Set(CommonKeywords);
-    for (const propertyName of this.#longhands.keys()) {
+    for (const [propertyName, longhands] of Object.entries(this.#table.longhands)) {
       // skip "all" because it is a CSS-wide keyword
       // skip shorthands that are defined in generatedPropertyValues because they have their own value sets
       if (propertyName === 'all' || propertyName in SupportedCSSProperties.generatedPropertyValues) {
         continue;
       }
-      const longhands = this.#longhands.get(propertyName);
-      if (!longhands) {
-        continue;
-      }
       const values = new Array<string>();
       const propertyValueSet = propertyValueSets.get(propertyName);
       if (propertyValueSet) {
@@ -148,7 +110,7 @@ export class CSSMetadata {
       this.#propertyValues.set(propertyName, [...values]);
     }
 
-    for (const name of this.#valuesSet) {
+    for (const name of this.#values) {
       const values = this.specificPropertyValues(name)
                          .filter(value => {
                            // Filter out values which are just the function name (e.g. 'url', 'radial-gradient', etc.)
@@ -213,17 +175,25 @@ export class CSSMetadata {
     return includeSVG ? this.#nameValuePresetsIncludingSVG : this.#nameValuePresets;
   }
 
+  #flags(name: string): number {
+    return ownValue(this.#table.flags, name) ?? 0;
+  }
+
+  #isSupported(name: string): boolean {
+    return ownValue(this.#table.flags, name) !== null;
+  }
+
   isSVGProperty(name: string): boolean {
     name = name.toLowerCase();
-    return this.#svgProperties.has(name);
+    return (this.#flags(name) & PropertyFlag.SVG) !== 0;
   }
 
   getLonghands(shorthand: string): string[]|null {
-    return this.#longhands.get(shorthand) || null;
+    return ownValue(this.#table.longhands, shorthand);
   }
 
   getShorthands(longhand: string): string[]|null {
-    return this.#shorthands.get(longhand) || null;
+    return ownValue(this.#table.shorthands, longhand);
   }
 
   isColorAwareProperty(propertyName: string): boolean {
@@ -312,7 +282,7 @@ export class CSSMetadata {
       return name;
     }
     const match = name.match(/(?:-webkit-)(.+)/);
-    if (!match || !this.#valuesSet.has(match[1])) {
+    if (!match || !this.#isSupported(match[1])) {
       return name;
     }
     return match[1];
@@ -324,13 +294,14 @@ export class CSSMetadata {
         propertyName.startsWith('-ms-') || propertyName.startsWith('-o-') || propertyName.startsWith('-webkit-')) {
       return true;
     }
-    return this.#valuesSet.has(propertyName);
+    return this.#isSupported(propertyName);
   }
 
   isPropertyInherited(propertyName: string): boolean {
     propertyName = propertyName.toLowerCase();
-    return propertyName.startsWith('--') || this.#inherited.has(this.canonicalPropertyName(propertyName)) ||
-        this.#inherited.has(propertyName);
+    return propertyName.startsWith('--') ||
+        (this.#flags(this.canonicalPropertyName(propertyName)) & PropertyFlag.INHERITED) !== 0 ||
+        (this.#flags(propertyName) & PropertyFlag.INHERITED) !== 0;
   }
 
   private specificPropertyValues(propertyName: string): string[] {
@@ -459,8 +430,8 @@ let cssMetadataInstance: CSSMetadata|null = null;
 
 export function cssMetadata(): CSSMetadata {
   if (!cssMetadataInstance) {
-    const supportedProperties = (SupportedCSSProperties.generatedProperties as CSSPropertyDefinition[]);
-    cssMetadataInstance = new CSSMetadata(supportedProperties, SupportedCSSProperties.generatedAliasesFor);
+    cssMetadataInstance =
+        new CSSMetadata(SupportedCSSProperties.generatedPropertyTable, SupportedCSSProperties.generatedAliasesFor);
   }
   return cssMetadataInstance;
 }
@@ -1901,15 +1872,25 @@ const Weight = new Map([
 // Common keywords to CSS properties
 const CommonKeywords = ['auto', 'none'];
 
-export interface CSSPropertyDefinition {
-  name: string;
-  longhands: string[]|null;
-  inherited: boolean|null;
-  svg: boolean|null;
-  // eslint-disable-next-line @typescript-eslint/naming-convention
-  is_descriptor?: boolean;
-  // eslint-disable-next-line @typescript-eslint/naming-convention
-  is_property?: boolean;
-  // eslint-disable-next-line @typescript-eslint/naming-convention
-  runtime_flag_status?: string;
+/** Bits of the flags in `CSSPropertyTable`. **/
+const enum PropertyFlag {
+  INHERITED = 1,
+  SVG = 2,
+}
+
+/**
+ * Lookup tables over the supported CSS properties, see
+ * `property_table()` in scripts/build/generate_supported_css.py.
+ */
+export interface CSSPropertyTable {
+  /** Flags of every supported property, in the order they are listed. **/
+  flags: Record<string, number>;
+  /** The longhands of every shorthand. **/
+  longhands: Record<string, string[]>;
+  /** The shorthands that include every longhand. **/
+  shorthands: Record<string, string[]>;
+}
+
+function ownValue<T>(table: Record<string, T>, key: string): T|null {
+  return Object.prototype.hasOwnProperty.call(table, key) ? table[key] : null;
 }
@@ -9788,3 +9788,3731 @@ export const generatedAliasesFor = new Map([
   "overflow-wrap"
  ]
 ]);
+export const generatedPropertyTable: {
+ flags: Record<string, number>,
+ longhands: Record<string, string[]>,
+ shorthands: Record<string, string[]>,
+} = {
+ "flags": {
+  "accent-color": 1,
+  "align-content": 0,
+  "align-items": 0,
+  "align-self": 0,
+  "alignment-baseline": 0,
+  "all": 0,
+  "anchor-name": 0,
+  "anchor-scope": 0,
+  "animation": 0,
+  "animation-composition": 0,
+  "animation-delay": 0,
+  "animation-direction": 0,
+  "animation-duration": 0,
+  "animation-fill-mode": 0,
+  "animation-iteration-count": 0,
+  "animation-name": 0,
+  "animation-play-state": 0,
+  "animation-range": 0,
+  "animation-range-end": 0,
+  "animation-range-start": 0,
+  "animation-timeline": 0,
+  "animation-timing-function": 0,
+  "animation-trigger": 0,
+  "app-region": 0,
+  "appearance": 0,
+  "aspect-ratio": 0,
+  "backdrop-filter": 0,
+  "backface-visibility": 0,
+  "background": 0,
+  "background-attachment": 0,
+  "background-blend-mode": 0,
+  "background-clip": 0,
+  "background-color": 0,
+  "background-image": 0,
+  "background-origin": 0,
+  "background-position": 0,
+  "background-position-x": 0,
+  "background-position-y": 0,
+  "background-repeat": 0,
+  "background-size": 0,
+  "baseline-shift": 0,
+  "baseline-source": 0,
+  "block-size": 0,
+  "border": 0,
+  "border-block": 0,
+  "border-block-color": 0,
+  "border-block-end": 0,
+  "border-block-end-color": 0,
+  "border-block-end-style": 0,
+  "border-block-end-width": 0,
+  "border-block-start": 0,
+  "border-block-start-color": 0,
+  "border-block-start-style": 0,
+  "border-block-start-width": 0,
+  "border-block-style": 0,
+  "border-block-width": 0,
+  "border-bottom": 0,
+  "border-bottom-color": 0,
+  "border-bottom-left-radius": 0,
+  "border-bottom-right-radius": 0,
+  "border-bottom-style": 0,
+  "border-bottom-width": 0,
+  "border-collapse": 1,
+  "border-color": 0,
+  "border-end-end-radius": 0,
+  "border-end-start-radius": 0,
+  "border-image": 0,
+  "border-image-outset": 0,
+  "border-image-repeat": 0,
+  "border-image-slice": 0,
+  "border-image-source": 0,
+  "border-image-width": 0,
+  "border-inline": 0,
+  "border-inline-color": 0,
+  "border-inline-end": 0,
+  "border-inline-end-color": 0,
+  "border-inline-end-style": 0,
+  "border-inline-end-width": 0,
+  "border-inline-start": 0,
+  "border-inline-start-color": 0,
+  "border-inline-start-style": 0,
+  "border-inline-start-width": 0,
+  "border-inline-style": 0,
+  "border-inline-width": 0,
+  "border-left": 0,
+  "border-left-color": 0,
+  "border-left-style": 0,
+  "border-left-width": 0,
+  "border-radius": 0,
+  "border-right": 0,
+  "border-right-color": 0,
+  "border-right-style": 0,
+  "border-right-width": 0,
+  "border-shape": 0,
+  "border-spacing": 1,
+  "border-start-end-radius": 0,
+  "border-start-start-radius": 0,
+  "border-style": 0,
+  "border-top": 0,
+  "border-top-color": 0,
+  "border-top-left-radius": 0,
+  "border-top-right-radius": 0,
+  "border-top-style": 0,
+  "border-top-width": 0,
+  "border-width": 0,
+  "bottom": 0,
+  "box-decoration-break": 0,
+  "box-shadow": 0,
+  "box-sizing": 0,
+  "break-after": 0,
+  "break-before": 0,
+  "break-inside": 0,
+  "buffered-rendering": 0,
+  "caption-side": 1,
+  "caret-animation": 1,
+  "caret-color": 1,
+  "caret-shape": 1,
+  "clear": 0,
+  "clip": 0,
+  "clip-path": 0,
+  "clip-rule": 1,
+  "color": 1,
+  "color-interpolation": 1,
+  "color-interpolation-filters": 1,
+  "color-rendering": 1,
+  "color-scheme": 1,
+  "column-count": 0,
+  "column-fill": 0,
+  "column-gap": 0,
+  "column-height": 0,
+  "column-rule": 0,
+  "column-rule-break": 0,
+  "column-rule-color": 0,
+  "column-rule-inset": 0,
+  "column-rule-inset-cap": 0,
+  "column-rule-inset-cap-end": 0,
+  "column-rule-inset-cap-start": 0,
+  "column-rule-inset-end": 0,
+  "column-rule-inset-junction": 0,
+  "column-rule-inset-junction-end": 0,
+  "column-rule-inset-junction-start": 0,
+  "column-rule-inset-start": 0,
+  "column-rule-style": 0,
+  "column-rule-visibility-items": 0,
+  "column-rule-width": 0,
+  "column-span": 0,
+  "column-width": 0,
+  "column-wrap": 0,
+  "columns": 0,
+  "contain": 0,
+  "contain-intrinsic-block-size": 0,
+  "contain-intrinsic-height": 0,
+  "contain-intrinsic-inline-size": 0,
+  "contain-intrinsic-size": 0,
+  "contain-intrinsic-width": 0,
+  "container": 0,
+  "container-name": 0,
+  "container-type": 0,
+  "content": 0,
+  "content-visibility": 0,
+  "corner-block-end-shape": 0,
+  "corner-block-start-shape": 0,
+  "corner-bottom-left-shape": 0,
+  "corner-bottom-right-shape": 0,
+  "corner-bottom-shape": 0,
+  "corner-end-end-shape": 0,
+  "corner-end-start-shape": 0,
+  "corner-inline-end-shape": 0,
+  "corner-inline-start-shape": 0,
+  "corner-left-shape": 0,
+  "corner-right-shape": 0,
+  "corner-shape": 0,
+  "corner-start-end-shape": 0,
+  "corner-start-start-shape": 0,
+  "corner-top-left-shape": 0,
+  "corner-top-right-shape": 0,
+  "corner-top-shape": 0,
+  "counter-increment": 0,
+  "counter-reset": 0,
+  "counter-set": 0,
+  "cursor": 1,
+  "cx": 0,
+  "cy": 0,
+  "d": 0,
+  "direction": 1,
+  "display": 0,
+  "dominant-baseline": 1,
+  "dynamic-range-limit": 1,
+  "empty-cells": 1,
+  "field-sizing": 0,
+  "fill": 1,
+  "fill-opacity": 1,
+  "fill-rule": 1,
+  "filter": 0,
+  "flex": 0,
+  "flex-basis": 0,
+  "flex-direction": 0,
+  "flex-flow": 0,
+  "flex-grow": 0,
+  "flex-line-count": 0,
+  "flex-shrink": 0,
+  "flex-wrap": 0,
+  "float": 0,
+  "flood-color": 0,
+  "flood-opacity": 0,
+  "font": 1,
+  "font-family": 1,
+  "font-feature-settings": 1,
+  "font-kerning": 1,
+  "font-language-override": 1,
+  "font-optical-sizing": 1,
+  "font-palette": 1,
+  "font-size": 1,
+  "font-size-adjust": 1,
+  "font-stretch": 1,
+  "font-style": 1,
+  "font-synthesis": 1,
+  "font-synthesis-small-caps": 1,
+  "font-synthesis-style": 1,
+  "font-synthesis-weight": 1,
+  "font-variant": 1,
+  "font-variant-alternates": 1,
+  "font-variant-caps": 1,
+  "font-variant-east-asian": 1,
+  "font-variant-emoji": 1,
+  "font-variant-ligatures": 1,
+  "font-variant-numeric": 1,
+  "font-variant-position": 1,
+  "font-variation-settings": 1,
+  "font-weight": 1,
+  "forced-color-adjust": 1,
+  "gap": 0,
+  "grid": 0,
+  "grid-area": 0,
+  "grid-auto-columns": 0,
+  "grid-auto-flow": 0,
+  "grid-auto-rows": 0,
+  "grid-column": 0,
+  "grid-column-end": 0,
+  "grid-column-start": 0,
+  "grid-row": 0,
+  "grid-row-end": 0,
+  "grid-row-start": 0,
+  "grid-template": 0,
+  "grid-template-areas": 0,
+  "grid-template-columns": 0,
+  "grid-template-rows": 0,
+  "height": 0,
+  "hyphenate-character": 1,
+  "hyphenate-limit-chars": 1,
+  "hyphens": 1,
+  "image-orientation": 1,
+  "image-rendering": 1,
+  "initial-letter": 0,
+  "inline-size": 0,
+  "inset": 0,
+  "inset-block": 0,
+  "inset-block-end": 0,
+  "inset-block-start": 0,
+  "inset-inline": 0,
+  "inset-inline-end": 0,
+  "inset-inline-start": 0,
+  "interactivity": 1,
+  "interest-delay": 0,
+  "interest-delay-end": 0,
+  "interest-delay-start": 0,
+  "interpolate-size": 1,
+  "isolation": 0,
+  "justify-content": 0,
+  "justify-items": 0,
+  "justify-self": 0,
+  "left": 0,
+  "letter-spacing": 1,
+  "lighting-color": 0,
+  "line-break": 1,
+  "line-height": 1,
+  "list-style": 1,
+  "list-style-image": 1,
+  "list-style-position": 1,
+  "list-style-type": 1,
+  "margin": 0,
+  "margin-block": 0,
+  "margin-block-end": 0,
+  "margin-block-start": 0,
+  "margin-bottom": 0,
+  "margin-inline": 0,
+  "margin-inline-end": 0,
+  "margin-inline-start": 0,
+  "margin-left": 0,
+  "margin-right": 0,
+  "margin-top": 0,
+  "marker": 1,
+  "marker-end": 1,
+  "marker-mid": 1,
+  "marker-start": 1,
+  "mask": 0,
+  "mask-clip": 0,
+  "mask-composite": 0,
+  "mask-image": 0,
+  "mask-mode": 0,
+  "mask-origin": 0,
+  "mask-position": 0,
+  "mask-repeat": 0,
+  "mask-size": 0,
+  "mask-type": 0,
+  "math-depth": 1,
+  "math-shift": 1,
+  "math-style": 1,
+  "max-block-size": 0,
+  "max-height": 0,
+  "max-inline-size": 0,
+  "max-width": 0,
+  "min-block-size": 0,
+  "min-height": 0,
+  "min-inline-size": 0,
+  "min-width": 0,
+  "mix-blend-mode": 0,
+  "object-fit": 0,
+  "object-position": 0,
+  "object-view-box": 0,
+  "offset": 0,
+  "offset-anchor": 0,
+  "offset-distance": 0,
+  "offset-path": 0,
+  "offset-position": 0,
+  "offset-rotate": 0,
+  "opacity": 0,
+  "order": 0,
+  "origin-trial-test-property": 0,
+  "orphans": 1,
+  "outline": 0,
+  "outline-color": 0,
+  "outline-offset": 0,
+  "outline-style": 0,
+  "outline-width": 0,
+  "overflow": 0,
+  "overflow-anchor": 0,
+  "overflow-block": 0,
+  "overflow-clip-margin": 0,
+  "overflow-inline": 0,
+  "overflow-wrap": 1,
+  "overflow-x": 0,
+  "overflow-y": 0,
+  "overlay": 0,
+  "overscroll-behavior": 0,
+  "overscroll-behavior-block": 0,
+  "overscroll-behavior-inline": 0,
+  "overscroll-behavior-x": 0,
+  "overscroll-behavior-y": 0,
+  "padding": 0,
+  "padding-block": 0,
+  "padding-block-end": 0,
+  "padding-block-start": 0,
+  "padding-bottom": 0,
+  "padding-inline": 0,
+  "padding-inline-end": 0,
+  "padding-inline-start": 0,
+  "padding-left": 0,
+  "padding-right": 0,
+  "padding-top": 0,
+  "page": 0,
+  "page-break-after": 0,
+  "page-break-before": 0,
+  "page-break-inside": 0,
+  "page-margin-safety": 0,
+  "page-orientation": 0,
+  "paint-order": 1,
+  "perspective": 0,
+  "perspective-origin": 0,
+  "place-content": 0,
+  "place-items": 0,
+  "place-self": 0,
+  "pointer-events": 1,
+  "position": 0,
+  "position-anchor": 0,
+  "position-area": 0,
+  "position-try": 0,
+  "position-try-fallbacks": 0,
+  "position-try-order": 0,
+  "position-visibility": 0,
+  "print-color-adjust": 1,
+  "quotes": 1,
+  "r": 0,
+  "reading-flow": 0,
+  "reading-order": 0,
+  "resize": 0,
+  "right": 0,
+  "rotate": 0,
+  "row-gap": 0,
+  "row-rule": 0,
+  "row-rule-break": 0,
+  "row-rule-color": 0,
+  "row-rule-inset": 0,
+  "row-rule-inset-cap": 0,
+  "row-rule-inset-cap-end": 0,
+  "row-rule-inset-cap-start": 0,
+  "row-rule-inset-end": 0,
+  "row-rule-inset-junction": 0,
+  "row-rule-inset-junction-end": 0,
+  "row-rule-inset-junction-start": 0,
+  "row-rule-inset-start": 0,
+  "row-rule-style": 0,
+  "row-rule-visibility-items": 0,
+  "row-rule-width": 0,
+  "ruby-align": 1,
+  "ruby-overhang": 1,
+  "ruby-position": 1,
+  "rule": 0,
+  "rule-break": 0,
+  "rule-color": 0,
+  "rule-inset": 0,
+  "rule-inset-cap": 0,
+  "rule-inset-end": 0,
+  "rule-inset-junction": 0,
+  "rule-inset-start": 0,
+  "rule-overlap": 0,
+  "rule-style": 0,
+  "rule-visibility-items": 0,
+  "rule-width": 0,
+  "rx": 0,
+  "ry": 0,
+  "scale": 0,
+  "scroll-axis-lock": 0,
+  "scroll-behavior": 0,
+  "scroll-initial-target": 0,
+  "scroll-margin": 0,
+  "scroll-margin-block": 0,
+  "scroll-margin-block-end": 0,
+  "scroll-margin-block-start": 0,
+  "scroll-margin-bottom": 0,
+  "scroll-margin-inline": 0,
+  "scroll-margin-inline-end": 0,
+  "scroll-margin-inline-start": 0,
+  "scroll-margin-left": 0,
+  "scroll-margin-right": 0,
+  "scroll-margin-top": 0,
+  "scroll-marker-group": 0,
+  "scroll-padding": 0,
+  "scroll-padding-block": 0,
+  "scroll-padding-block-end": 0,
+  "scroll-padding-block-start": 0,
+  "scroll-padding-bottom": 0,
+  "scroll-padding-inline": 0,
+  "scroll-padding-inline-end": 0,
+  "scroll-padding-inline-start": 0,
+  "scroll-padding-left": 0,
+  "scroll-padding-right": 0,
+  "scroll-padding-top": 0,
+  "scroll-snap-align": 0,
+  "scroll-snap-stop": 0,
+  "scroll-snap-type": 0,
+  "scroll-target-group": 0,
+  "scroll-timeline": 0,
+  "scroll-timeline-axis": 0,
+  "scroll-timeline-name": 0,
+  "scrollbar-color": 1,
+  "scrollbar-gutter": 0,
+  "scrollbar-width": 0,
+  "shape-image-threshold": 0,
+  "shape-margin": 0,
+  "shape-outside": 0,
+  "shape-rendering": 1,
+  "size": 0,
+  "speak": 1,
+  "stop-color": 0,
+  "stop-opacity": 0,
+  "stroke": 1,
+  "stroke-dasharray": 1,
+  "stroke-dashoffset": 1,
+  "stroke-linecap": 1,
+  "stroke-linejoin": 1,
+  "stroke-miterlimit": 1,
+  "stroke-opacity": 1,
+  "stroke-width": 1,
+  "tab-size": 1,
+  "table-layout": 0,
+  "text-align": 1,
+  "text-align-last": 1,
+  "text-anchor": 1,
+  "text-autospace": 1,
+  "text-box": 0,
+  "text-box-edge": 1,
+  "text-box-trim": 0,
+  "text-combine-upright": 1,
+  "text-decoration": 0,
+  "text-decoration-color": 0,
+  "text-decoration-line": 0,
+  "text-decoration-skip-ink": 1,
+  "text-decoration-style": 0,
+  "text-decoration-thickness": 0,
+  "text-emphasis": 1,
+  "text-emphasis-color": 1,
+  "text-emphasis-position": 1,
+  "text-emphasis-style": 1,
+  "text-fit": 1,
+  "text-indent": 1,
+  "text-justify": 1,
+  "text-orientation": 1,
+  "text-overflow": 0,
+  "text-rendering": 1,
+  "text-shadow": 1,
+  "text-size-adjust": 1,
+  "text-spacing-trim": 1,
+  "text-transform": 1,
+  "text-underline-offset": 1,
+  "text-underline-position": 1,
+  "text-wrap": 1,
+  "text-wrap-mode": 1,
+  "text-wrap-style": 1,
+  "timeline-scope": 0,
+  "timeline-trigger": 0,
+  "timeline-trigger-activation-range": 0,
+  "timeline-trigger-activation-range-end": 0,
+  "timeline-trigger-activation-range-start": 0,
+  "timeline-trigger-active-range": 0,
+  "timeline-trigger-active-range-end": 0,
+  "timeline-trigger-active-range-start": 0,
+  "timeline-trigger-name": 0,
+  "timeline-trigger-source": 0,
+  "top": 0,
+  "touch-action": 0,
+  "transform": 0,
+  "transform-box": 0,
+  "transform-origin": 0,
+  "transform-style": 0,
+  "transition": 0,
+  "transition-behavior": 0,
+  "transition-delay": 0,
+  "transition-duration": 0,
+  "transition-property": 0,
+  "transition-timing-function": 0,
+  "translate": 0,
+  "trigger-scope": 0,
+  "unicode-bidi": 0,
+  "user-select": 1,
+  "vector-effect": 0,
+  "vertical-align": 0,
+  "view-timeline": 0,
+  "view-timeline-axis": 0,
+  "view-timeline-inset": 0,
+  "view-timeline-name": 0,
+  "view-transition-class": 0,
+  "view-transition-group": 0,
+  "view-transition-name": 0,
+  "view-transition-scope": 0,
+  "visibility": 1,
+  "white-space": 1,
+  "white-space-collapse": 1,
+  "widows": 1,
+  "width": 0,
+  "will-change": 0,
+  "window-drag": 1,
+  "word-break": 1,
+  "word-spacing": 1,
+  "writing-mode": 1,
+  "x": 0,
+  "y": 0,
+  "z-index": 0,
+  "zoom": 0,
+  "-webkit-border-horizontal-spacing": 1,
+  "-webkit-border-image": 0,
+  "-webkit-border-vertical-spacing": 1,
+  "-webkit-box-align": 0,
+  "-webkit-box-decoration-break": 0,
+  "-webkit-box-direction": 0,
+  "-webkit-box-flex": 0,
+  "-webkit-box-ordinal-group": 0,
+  "-webkit-box-orient": 0,
+  "-webkit-box-pack": 0,
+  "-webkit-box-reflect": 0,
+  "-webkit-column-break-after": 0,
+  "-webkit-column-break-before": 0,
+  "-webkit-column-break-inside": 0,
+  "-webkit-font-smoothing": 1,
+  "-webkit-line-break": 0,
+  "-webkit-line-clamp": 0,
+  "-webkit-locale": 1,
+  "-webkit-mask-box-image": 0,
+  "-webkit-mask-box-image-outset": 0,
+  "-webkit-mask-box-image-repeat": 0,
+  "-webkit-mask-box-image-slice": 0,
+  "-webkit-mask-box-image-source": 0,
+  "-webkit-mask-box-image-width": 0,
+  "-webkit-mask-position-x": 0,
+  "-webkit-mask-position-y": 0,
+  "-webkit-perspective-origin-x": 0,
+  "-webkit-perspective-origin-y": 0,
+  "-webkit-rtl-ordering": 1,
+  "-webkit-ruby-position": 1,
+  "-webkit-tap-highlight-color": 1,
+  "-webkit-text-combine": 1,
+  "-webkit-text-decorations-in-effect": 1,
+  "-webkit-text-fill-color": 1,
+  "-webkit-text-orientation": 1,
+  "-webkit-text-security": 1,
+  "-webkit-text-stroke": 1,
+  "-webkit-text-stroke-color": 1,
+  "-webkit-text-stroke-width": 1,
+  "-webkit-transform-origin-x": 0,
+  "-webkit-transform-origin-y": 0,
+  "-webkit-transform-origin-z": 0,
+  "-webkit-user-drag": 0,
+  "-webkit-user-modify": 1,
+  "-webkit-writing-mode": 1
+ },
+ "longhands": {
+  "-webkit-column-break-after": [
+   "break-after"
+  ],
+  "-webkit-column-break-before": [
+   "break-before"
+  ],
+  "-webkit-column-break-inside": [
+   "break-inside"
+  ],
+  "-webkit-mask-box-image": [
+   "-webkit-mask-box-image-source",
+   "-webkit-mask-box-image-slice",
+   "-webkit-mask-box-image-width",
+   "-webkit-mask-box-image-outset",
+   "-webkit-mask-box-image-repeat"
+  ],
+  "-webkit-text-stroke": [
+   "-webkit-text-stroke-width",
+   "-webkit-text-stroke-color"
+  ],
+  "all": [
+   "-alternative-webkit-line-clamp-longhand",
+   "-webkit-border-horizontal-spacing",
+   "-webkit-border-vertical-spacing",
+   "-webkit-box-align",
+   "-webkit-box-decoration-break",
+   "-webkit-box-direction",
+   "-webkit-box-flex",
+   "-webkit-box-ordinal-group",
+   "-webkit-box-orient",
+   "-webkit-box-pack",
+   "-webkit-box-reflect",
+   "-webkit-font-smoothing",
+   "-webkit-line-break",
+   "-webkit-line-clamp",
+   "-webkit-locale",
+   "-webkit-mask-box-image-outset",
+   "-webkit-mask-box-image-repeat",
+   "-webkit-mask-box-image-slice",
+   "-webkit-mask-box-image-source",
+   "-webkit-mask-box-image-width",
+   "-webkit-mask-position-x",
+   "-webkit-mask-position-y",
+   "-webkit-rtl-ordering",
+   "-webkit-ruby-position",
+   "-webkit-tap-highlight-color",
+   "-webkit-text-combine",
+   "-webkit-text-decorations-in-effect",
+   "-webkit-text-fill-color",
+   "-webkit-text-orientation",
+   "-webkit-text-security",
+   "-webkit-text-stroke-color",
+   "-webkit-text-stroke-width",
+   "-webkit-user-drag",
+   "-webkit-writing-mode",
+   "accent-color",
+   "additive-symbols",
+   "align-content",
+   "align-items",
+   "align-self",
+   "alignment-baseline",
+   "anchor-name",
+   "anchor-scope",
+   "animation-composition",
+   "animation-delay",
+   "animation-direction",
+   "animation-duration",
+   "animation-fill-mode",
+   "animation-iteration-count",
+   "animation-name",
+   "animation-play-state",
+   "animation-range-end",
+   "animation-range-start",
+   "animation-timeline",
+   "animation-timing-function",
+   "animation-trigger",
+   "app-region",
+   "appearance",
+   "ascent-override",
+   "aspect-ratio",
+   "backdrop-filter",
+   "backface-visibility",
+   "background-attachment",
+   "background-blend-mode",
+   "background-clip",
+   "background-color",
+   "background-image",
+   "background-origin",
+   "background-position-x",
+   "background-position-y",
+   "background-repeat",
+   "background-size",
+   "base-palette",
+   "base-url",
+   "baseline-shift",
+   "baseline-source",
+   "block-ellipsis",
+   "block-size",
+   "border-block-end-color",
+   "border-block-end-style",
+   "border-block-end-width",
+   "border-block-start-color",
+   "border-block-start-style",
+   "border-block-start-width",
+   "border-bottom-color",
+   "border-bottom-left-radius",
+   "border-bottom-right-radius",
+   "border-bottom-style",
+   "border-bottom-width",
+   "border-collapse",
+   "border-end-end-radius",
+   "border-end-start-radius",
+   "border-image-outset",
+   "border-image-repeat",
+   "border-image-slice",
+   "border-image-source",
+   "border-image-width",
+   "border-inline-end-color",
+   "border-inline-end-style",
+   "border-inline-end-width",
+   "border-inline-start-color",
+   "border-inline-start-style",
+   "border-inline-start-width",
+   "border-left-color",
+   "border-left-style",
+   "border-left-width",
+   "border-right-color",
+   "border-right-style",
+   "border-right-width",
+   "border-shape",
+   "border-start-end-radius",
+   "border-start-start-radius",
+   "border-top-color",
+   "border-top-left-radius",
+   "border-top-right-radius",
+   "border-top-style",
+   "border-top-width",
+   "bottom",
+   "box-decoration-break",
+   "box-shadow",
+   "box-sizing",
+   "break-after",
+   "break-before",
+   "break-inside",
+   "buffered-rendering",
+   "caption-side",
+   "caret-animation",
+   "caret-color",
+   "caret-shape",
+   "clear",
+   "clip",
+   "clip-path",
+   "clip-rule",
+   "color",
+   "color-interpolation",
+   "color-interpolation-filters",
+   "color-rendering",
+   "color-scheme",
+   "column-count",
+   "column-fill",
+   "column-gap",
+   "column-height",
+   "column-rule-break",
+   "column-rule-color",
+   "column-rule-inset-cap-end",
+   "column-rule-inset-cap-start",
+   "column-rule-inset-junction-end",
+   "column-rule-inset-junction-start",
+   "column-rule-style",
+   "column-rule-visibility-items",
+   "column-rule-width",
+   "column-span",
+   "column-width",
+   "column-wrap",
+   "contain",
+   "contain-intrinsic-block-size",
+   "contain-intrinsic-height",
+   "contain-intrinsic-inline-size",
+   "contain-intrinsic-width",
+   "container-name",
+   "container-type",
+   "content",
+   "content-visibility",
+   "continue",
+   "corner-bottom-left-shape",
+   "corner-bottom-right-shape",
+   "corner-end-end-shape",
+   "corner-end-start-shape",
+   "corner-start-end-shape",
+   "corner-start-start-shape",
+   "corner-top-left-shape",
+   "corner-top-right-shape",
+   "counter-increment",
+   "counter-reset",
+   "counter-set",
+   "cursor",
+   "cx",
+   "cy",
+   "d",
+   "descent-override",
+   "display",
+   "dominant-baseline",
+   "dynamic-range-limit",
+   "empty-cells",
+   "fallback",
+   "field-sizing",
+   "fill",
+   "fill-opacity",
+   "fill-rule",
+   "filter",
+   "flex-basis",
+   "flex-direction",
+   "flex-grow",
+   "flex-line-count",
+   "flex-shrink",
+   "flex-wrap",
+   "float",
+   "flood-color",
+   "flood-opacity",
+   "flow-tolerance",
+   "font-display",
+   "font-family",
+   "font-feature-settings",
+   "font-kerning",
+   "font-language-override",
+   "font-optical-sizing",
+   "font-palette",
+   "font-size",
+   "font-size-adjust",
+   "font-stretch",
+   "font-style",
+   "font-synthesis-small-caps",
+   "font-synthesis-style",
+   "font-synthesis-weight",
+   "font-variant-alternates",
+   "font-variant-caps",
+   "font-variant-east-asian",
+   "font-variant-emoji",
+   "font-variant-ligatures",
+   "font-variant-numeric",
+   "font-variant-position",
+   "font-variation-settings",
+   "font-weight",
+   "forced-color-adjust",
+   "frame-sizing",
+   "grid-auto-columns",
+   "grid-auto-flow",
+   "grid-auto-rows",
+   "grid-column-end",
+   "grid-column-start",
+   "grid-lanes-direction",
+   "grid-lanes-pack",
+   "grid-row-end",
+   "grid-row-start",
+   "grid-template-areas",
+   "grid-template-columns",
+   "grid-template-rows",
+   "hanging-punctuation",
+   "hash",
+   "height",
+   "hostname",
+   "hyphenate-character",
+   "hyphenate-limit-chars",
+   "hyphens",
+   "image-animation",
+   "image-orientation",
+   "image-rendering",
+   "inherits",
+   "initial-letter",
+   "initial-value",
+   "inline-size",
+   "inset-block-end",
+   "inset-block-start",
+   "inset-inline-end",
+   "inset-inline-start",
+   "interactivity",
+   "interest-delay-end",
+   "interest-delay-start",
+   "interpolate-size",
+   "isolation",
+   "justify-content",
+   "justify-items",
+   "justify-self",
+   "left",
+   "letter-spacing",
+   "lighting-color",
+   "line-break",
+   "line-clamp",
+   "line-gap-override",
+   "line-height",
+   "list-style-image",
+   "list-style-position",
+   "list-style-type",
+   "margin-block-end",
+   "margin-block-start",
+   "margin-bottom",
+   "margin-inline-end",
+   "margin-inline-start",
+   "margin-left",
+   "margin-right",
+   "margin-top",
+   "margin-trim",
+   "marker-end",
+   "marker-mid",
+   "marker-start",
+   "mask-clip",
+   "mask-composite",
+   "mask-image",
+   "mask-mode",
+   "mask-origin",
+   "mask-repeat",
+   "mask-size",
+   "mask-type",
+   "math-depth",
+   "math-shift",
+   "math-style",
+   "max-block-size",
+   "max-content-sizing",
+   "max-height",
+   "max-inline-size",
+   "max-lines",
+   "max-width",
+   "min-block-size",
+   "min-height",
+   "min-inline-size",
+   "min-width",
+   "mix-blend-mode",
+   "navigation",
+   "negative",
+   "object-fit",
+   "object-position",
+   "object-view-box",
+   "offset-anchor",
+   "offset-distance",
+   "offset-path",
+   "offset-position",
+   "offset-rotate",
+   "opacity",
+   "order",
+   "origin-trial-test-property",
+   "orphans",
+   "outline-color",
+   "outline-offset",
+   "outline-style",
+   "outline-width",
+   "overflow-anchor",
+   "overflow-block",
+   "overflow-clip-margin",
+   "overflow-inline",
+   "overflow-wrap",
+   "overflow-x",
+   "overflow-y",
+   "overlay",
+   "override-colors",
+   "overscroll-behavior-block",
+   "overscroll-behavior-inline",
+   "overscroll-behavior-x",
+   "overscroll-behavior-y",
+   "overscroll-container-type",
+   "pad",
+   "padding-block-end",
+   "padding-block-start",
+   "padding-bottom",
+   "padding-inline-end",
+   "padding-inline-start",
+   "padding-left",
+   "padding-right",
+   "padding-top",
+   "page",
+   "page-margin-safety",
+   "page-orientation",
+   "paint-order",
+   "path-length",
+   "pathname",
+   "pattern",
+   "perspective",
+   "perspective-origin",
+   "pointer-events",
+   "port",
+   "position",
+   "position-anchor",
+   "position-area",
+   "position-try-fallbacks",
+   "position-try-order",
+   "position-visibility",
+   "prefix",
+   "print-color-adjust",
+   "protocol",
+   "quotes",
+   "r",
+   "range",
+   "reading-flow",
+   "reading-order",
+   "resize",
+   "result",
+   "right",
+   "rotate",
+   "row-gap",
+   "row-rule-break",
+   "row-rule-color",
+   "row-rule-inset-cap-end",
+   "row-rule-inset-cap-start",
+   "row-rule-inset-junction-end",
+   "row-rule-inset-junction-start",
+   "row-rule-style",
+   "row-rule-visibility-items",
+   "row-rule-width",
+   "ruby-align",
+   "ruby-overhang",
+   "ruby-position",
+   "rule-overlap",
+   "rx",
+   "ry",
+   "scale",
+   "scroll-axis-lock",
+   "scroll-behavior",
+   "scroll-initial-target",
+   "scroll-margin-block-end",
+   "scroll-margin-block-start",
+   "scroll-margin-bottom",
+   "scroll-margin-inline-end",
+   "scroll-margin-inline-start",
+   "scroll-margin-left",
+   "scroll-margin-right",
+   "scroll-margin-top",
+   "scroll-marker-group",
+   "scroll-padding-block-end",
+   "scroll-padding-block-start",
+   "scroll-padding-bottom",
+   "scroll-padding-inline-end",
+   "scroll-padding-inline-start",
+   "scroll-padding-left",
+   "scroll-padding-right",
+   "scroll-padding-top",
+   "scroll-snap-align",
+   "scroll-snap-stop",
+   "scroll-snap-type",
+   "scroll-target-group",
+   "scroll-timeline-axis",
+   "scroll-timeline-name",
+   "scrollbar-color",
+   "scrollbar-gutter",
+   "scrollbar-width",
+   "search",
+   "shape-image-threshold",
+   "shape-margin",
+   "shape-outside",
+   "shape-rendering",
+   "size",
+   "size-adjust",
+   "speak",
+   "speak-as",
+   "src",
+   "stop-color",
+   "stop-opacity",
+   "stroke",
+   "stroke-dasharray",
+   "stroke-dashoffset",
+   "stroke-linecap",
+   "stroke-linejoin",
+   "stroke-miterlimit",
+   "stroke-opacity",
+   "stroke-width",
+   "suffix",
+   "symbols",
+   "syntax",
+   "system",
+   "tab-size",
+   "table-layout",
+   "text-align",
+   "text-align-last",
+   "text-anchor",
+   "text-autospace",
+   "text-box-edge",
+   "text-box-trim",
+   "text-combine-upright",
+   "text-decoration-color",
+   "text-decoration-inset",
+   "text-decoration-line",
+   "text-decoration-skip-ink",
+   "text-decoration-skip-spaces",
+   "text-decoration-style",
+   "text-decoration-thickness",
+   "text-emphasis-color",
+   "text-emphasis-position",
+   "text-emphasis-style",
+   "text-fit",
+   "text-indent",
+   "text-justify",
+   "text-orientation",
+   "text-overflow",
+   "text-rendering",
+   "text-shadow",
+   "text-size-adjust",
+   "text-spacing-trim",
+   "text-transform",
+   "text-underline-offset",
+   "text-underline-position",
+   "text-wrap-mode",
+   "text-wrap-style",
+   "timeline-scope",
+   "timeline-trigger-activation-range-end",
+   "timeline-trigger-activation-range-start",
+   "timeline-trigger-active-range-end",
+   "timeline-trigger-active-range-start",
+   "timeline-trigger-name",
+   "timeline-trigger-source",
+   "top",
+   "touch-action",
+   "transform",
+   "transform-box",
+   "transform-origin",
+   "transform-style",
+   "transition-behavior",
+   "transition-delay",
+   "transition-duration",
+   "transition-property",
+   "transition-timing-function",
+   "translate",
+   "trigger-scope",
+   "types",
+   "unicode-range",
+   "user-select",
+   "vector-effect",
+   "vertical-align",
+   "view-timeline-axis",
+   "view-timeline-inset",
+   "view-timeline-name",
+   "view-transition-class",
+   "view-transition-group",
+   "view-transition-name",
+   "view-transition-scope",
+   "visibility",
+   "white-space-collapse",
+   "widows",
+   "width",
+   "will-change",
+   "window-drag",
+   "word-break",
+   "word-spacing",
+   "writing-mode",
+   "x",
+   "y",
+   "z-index",
+   "zoom"
+  ],
+  "animation": [
+   "animation-duration",
+   "animation-timing-function",
+   "animation-delay",
+   "animation-iteration-count",
+   "animation-direction",
+   "animation-fill-mode",
+   "animation-play-state",
+   "animation-name",
+   "animation-timeline",
+   "animation-range-start",
+   "animation-range-end"
+  ],
+  "animation-range": [
+   "animation-range-start",
+   "animation-range-end"
+  ],
+  "background": [
+   "background-image",
+   "background-position-x",
+   "background-position-y",
+   "background-size",
+   "background-repeat",
+   "background-attachment",
+   "background-origin",
+   "background-clip",
+   "background-color"
+  ],
+  "background-position": [
+   "background-position-x",
+   "background-position-y"
+  ],
+  "border": [
+   "border-top-color",
+   "border-top-style",
+   "border-top-width",
+   "border-right-color",
+   "border-right-style",
+   "border-right-width",
+   "border-bottom-color",
+   "border-bottom-style",
+   "border-bottom-width",
+   "border-left-color",
+   "border-left-style",
+   "border-left-width",
+   "border-image-source",
+   "border-image-slice",
+   "border-image-width",
+   "border-image-outset",
+   "border-image-repeat"
+  ],
+  "border-block": [
+   "border-block-start-color",
+   "border-block-start-style",
+   "border-block-start-width",
+   "border-block-end-color",
+   "border-block-end-style",
+   "border-block-end-width"
+  ],
+  "border-block-color": [
+   "border-block-start-color",
+   "border-block-end-color"
+  ],
+  "border-block-end": [
+   "border-block-end-width",
+   "border-block-end-style",
+   "border-block-end-color"
+  ],
+  "border-block-start": [
+   "border-block-start-width",
+   "border-block-start-style",
+   "border-block-start-color"
+  ],
+  "border-block-style": [
+   "border-block-start-style",
+   "border-block-end-style"
+  ],
+  "border-block-width": [
+   "border-block-start-width",
+   "border-block-end-width"
+  ],
+  "border-bottom": [
+   "border-bottom-width",
+   "border-bottom-style",
+   "border-bottom-color"
+  ],
+  "border-color": [
+   "border-top-color",
+   "border-right-color",
+   "border-bottom-color",
+   "border-left-color"
+  ],
+  "border-image": [
+   "border-image-source",
+   "border-image-slice",
+   "border-image-width",
+   "border-image-outset",
+   "border-image-repeat"
+  ],
+  "border-inline": [
+   "border-inline-start-color",
+   "border-inline-start-style",
+   "border-inline-start-width",
+   "border-inline-end-color",
+   "border-inline-end-style",
+   "border-inline-end-width"
+  ],
+  "border-inline-color": [
+   "border-inline-start-color",
+   "border-inline-end-color"
+  ],
+  "border-inline-end": [
+   "border-inline-end-width",
+   "border-inline-end-style",
+   "border-inline-end-color"
+  ],
+  "border-inline-start": [
+   "border-inline-start-width",
+   "border-inline-start-style",
+   "border-inline-start-color"
+  ],
+  "border-inline-style": [
+   "border-inline-start-style",
+   "border-inline-end-style"
+  ],
+  "border-inline-width": [
+   "border-inline-start-width",
+   "border-inline-end-width"
+  ],
+  "border-left": [
+   "border-left-width",
+   "border-left-style",
+   "border-left-color"
+  ],
+  "border-radius": [
+   "border-top-left-radius",
+   "border-top-right-radius",
+   "border-bottom-right-radius",
+   "border-bottom-left-radius"
+  ],
+  "border-right": [
+   "border-right-width",
+   "border-right-style",
+   "border-right-color"
+  ],
+  "border-spacing": [
+   "-webkit-border-horizontal-spacing",
+   "-webkit-border-vertical-spacing"
+  ],
+  "border-style": [
+   "border-top-style",
+   "border-right-style",
+   "border-bottom-style",
+   "border-left-style"
+  ],
+  "border-top": [
+   "border-top-width",
+   "border-top-style",
+   "border-top-color"
+  ],
+  "border-width": [
+   "border-top-width",
+   "border-right-width",
+   "border-bottom-width",
+   "border-left-width"
+  ],
+  "column-rule": [
+   "column-rule-width",
+   "column-rule-style",
+   "column-rule-color"
+  ],
+  "column-rule-inset": [
+   "column-rule-inset-cap-start",
+   "column-rule-inset-cap-end",
+   "column-rule-inset-junction-start",
+   "column-rule-inset-junction-end"
+  ],
+  "column-rule-inset-cap": [
+   "column-rule-inset-cap-start",
+   "column-rule-inset-cap-end"
+  ],
+  "column-rule-inset-end": [
+   "column-rule-inset-cap-end",
+   "column-rule-inset-junction-end"
+  ],
+  "column-rule-inset-junction": [
+   "column-rule-inset-junction-start",
+   "column-rule-inset-junction-end"
+  ],
+  "column-rule-inset-start": [
+   "column-rule-inset-cap-start",
+   "column-rule-inset-junction-start"
+  ],
+  "columns": [
+   "column-width",
+   "column-count",
+   "column-height",
+   "column-wrap"
+  ],
+  "contain-intrinsic-size": [
+   "contain-intrinsic-width",
+   "contain-intrinsic-height"
+  ],
+  "container": [
+   "container-name",
+   "container-type"
+  ],
+  "corner-block-end-shape": [
+   "corner-end-start-shape",
+   "corner-end-end-shape"
+  ],
+  "corner-block-start-shape": [
+   "corner-start-start-shape",
+   "corner-start-end-shape"
+  ],
+  "corner-bottom-shape": [
+   "corner-bottom-left-shape",
+   "corner-bottom-right-shape"
+  ],
+  "corner-inline-end-shape": [
+   "corner-start-end-shape",
+   "corner-end-end-shape"
+  ],
+  "corner-inline-start-shape": [
+   "corner-start-start-shape",
+   "corner-end-start-shape"
+  ],
+  "corner-left-shape": [
+   "corner-top-left-shape",
+   "corner-bottom-left-shape"
+  ],
+  "corner-right-shape": [
+   "corner-top-right-shape",
+   "corner-bottom-right-shape"
+  ],
+  "corner-shape": [
+   "corner-top-left-shape",
+   "corner-top-right-shape",
+   "corner-bottom-right-shape",
+   "corner-bottom-left-shape"
+  ],
+  "corner-top-shape": [
+   "corner-top-left-shape",
+   "corner-top-right-shape"
+  ],
+  "flex": [
+   "flex-grow",
+   "flex-shrink",
+   "flex-basis"
+  ],
+  "flex-flow": [
+   "flex-direction",
+   "flex-wrap"
+  ],
+  "font": [
+   "font-style",
+   "font-variant-ligatures",
+   "font-variant-caps",
+   "font-variant-numeric",
+   "font-variant-east-asian",
+   "font-variant-alternates",
+   "font-variant-position",
+   "font-variant-emoji",
+   "font-weight",
+   "font-stretch",
+   "font-size",
+   "line-height",
+   "font-family",
+   "font-optical-sizing",
+   "font-size-adjust",
+   "font-kerning",
+   "font-feature-settings",
+   "font-variation-settings",
+   "font-language-override"
+  ],
+  "font-synthesis": [
+   "font-synthesis-weight",
+   "font-synthesis-style",
+   "font-synthesis-small-caps"
+  ],
+  "font-variant": [
+   "font-variant-ligatures",
+   "font-variant-caps",
+   "font-variant-alternates",
+   "font-variant-numeric",
+   "font-variant-east-asian",
+   "font-variant-position",
+   "font-variant-emoji"
+  ],
+  "gap": [
+   "row-gap",
+   "column-gap"
+  ],
+  "grid": [
+   "grid-template-rows",
+   "grid-template-columns",
+   "grid-template-areas",
+   "grid-auto-flow",
+   "grid-auto-rows",
+   "grid-auto-columns"
+  ],
+  "grid-area": [
+   "grid-row-start",
+   "grid-column-start",
+   "grid-row-end",
+   "grid-column-end"
+  ],
+  "grid-column": [
+   "grid-column-start",
+   "grid-column-end"
+  ],
+  "grid-row": [
+   "grid-row-start",
+   "grid-row-end"
+  ],
+  "grid-template": [
+   "grid-template-rows",
+   "grid-template-columns",
+   "grid-template-areas"
+  ],
+  "inset": [
+   "top",
+   "right",
+   "bottom",
+   "left"
+  ],
+  "inset-block": [
+   "inset-block-start",
+   "inset-block-end"
+  ],
+  "inset-inline": [
+   "inset-inline-start",
+   "inset-inline-end"
+  ],
+  "interest-delay": [
+   "interest-delay-start",
+   "interest-delay-end"
+  ],
+  "list-style": [
+   "list-style-position",
+   "list-style-image",
+   "list-style-type"
+  ],
+  "margin": [
+   "margin-top",
+   "margin-right",
+   "margin-bottom",
+   "margin-left"
+  ],
+  "margin-block": [
+   "margin-block-start",
+   "margin-block-end"
+  ],
+  "margin-inline": [
+   "margin-inline-start",
+   "margin-inline-end"
+  ],
+  "marker": [
+   "marker-start",
+   "marker-mid",
+   "marker-end"
+  ],
+  "mask": [
+   "mask-image",
+   "-webkit-mask-position-x",
+   "-webkit-mask-position-y",
+   "mask-size",
+   "mask-repeat",
+   "mask-origin",
+   "mask-clip",
+   "mask-composite",
+   "mask-mode"
+  ],
+  "mask-position": [
+   "-webkit-mask-position-x",
+   "-webkit-mask-position-y"
+  ],
+  "offset": [
+   "offset-position",
+   "offset-path",
+   "offset-distance",
+   "offset-rotate",
+   "offset-anchor"
+  ],
+  "outline": [
+   "outline-color",
+   "outline-style",
+   "outline-width"
+  ],
+  "overflow": [
+   "overflow-x",
+   "overflow-y"
+  ],
+  "overscroll-behavior": [
+   "overscroll-behavior-x",
+   "overscroll-behavior-y"
+  ],
+  "padding": [
+   "padding-top",
+   "padding-right",
+   "padding-bottom",
+   "padding-left"
+  ],
+  "padding-block": [
+   "padding-block-start",
+   "padding-block-end"
+  ],
+  "padding-inline": [
+   "padding-inline-start",
+   "padding-inline-end"
+  ],
+  "page-break-after": [
+   "break-after"
+  ],
+  "page-break-before": [
+   "break-before"
+  ],
+  "page-break-inside": [
+   "break-inside"
+  ],
+  "place-content": [
+   "align-content",
+   "justify-content"
+  ],
+  "place-items": [
+   "align-items",
+   "justify-items"
+  ],
+  "place-self": [
+   "align-self",
+   "justify-self"
+  ],
+  "position-try": [
+   "position-try-order",
+   "position-try-fallbacks"
+  ],
+  "row-rule": [
+   "row-rule-width",
+   "row-rule-style",
+   "row-rule-color"
+  ],
+  "row-rule-inset": [
+   "row-rule-inset-cap-start",
+   "row-rule-inset-cap-end",
+   "row-rule-inset-junction-start",
+   "row-rule-inset-junction-end"
+  ],
+  "row-rule-inset-cap": [
+   "row-rule-inset-cap-start",
+   "row-rule-inset-cap-end"
+  ],
+  "row-rule-inset-end": [
+   "row-rule-inset-cap-end",
+   "row-rule-inset-junction-end"
+  ],
+  "row-rule-inset-junction": [
+   "row-rule-inset-junction-start",
+   "row-rule-inset-junction-end"
+  ],
+  "row-rule-inset-start": [
+   "row-rule-inset-cap-start",
+   "row-rule-inset-junction-start"
+  ],
+  "rule": [
+   "column-rule-width",
+   "column-rule-style",
+   "column-rule-color",
+   "row-rule-width",
+   "row-rule-style",
+   "row-rule-color"
+  ],
+  "rule-break": [
+   "row-rule-break",
+   "column-rule-break"
+  ],
+  "rule-color": [
+   "column-rule-color",
+   "row-rule-color"
+  ],
+  "rule-inset": [
+   "row-rule-inset-cap-start",
+   "row-rule-inset-cap-end",
+   "row-rule-inset-junction-start",
+   "row-rule-inset-junction-end",
+   "column-rule-inset-cap-start",
+   "column-rule-inset-cap-end",
+   "column-rule-inset-junction-start",
+   "column-rule-inset-junction-end"
+  ],
+  "rule-inset-cap": [
+   "row-rule-inset-cap-start",
+   "row-rule-inset-cap-end",
+   "column-rule-inset-cap-start",
+   "column-rule-inset-cap-end"
+  ],
+  "rule-inset-end": [
+   "column-rule-inset-cap-end",
+   "column-rule-inset-junction-end",
+   "row-rule-inset-cap-end",
+   "row-rule-inset-junction-end"
+  ],
+  "rule-inset-junction": [
+   "row-rule-inset-junction-start",
+   "row-rule-inset-junction-end",
+   "column-rule-inset-junction-start",
+   "column-rule-inset-junction-end"
+  ],
+  "rule-inset-start": [
+   "column-rule-inset-cap-start",
+   "column-rule-inset-junction-start",
+   "row-rule-inset-cap-start",
+   "row-rule-inset-junction-start"
+  ],
+  "rule-style": [
+   "column-rule-style",
+   "row-rule-style"
+  ],
+  "rule-visibility-items": [
+   "column-rule-visibility-items",
+   "row-rule-visibility-items"
+  ],
+  "rule-width": [
+   "column-rule-width",
+   "row-rule-width"
+  ],
+  "scroll-margin": [
+   "scroll-margin-top",
+   "scroll-margin-right",
+   "scroll-margin-bottom",
+   "scroll-margin-left"
+  ],
+  "scroll-margin-block": [
+   "scroll-margin-block-start",
+   "scroll-margin-block-end"
+  ],
+  "scroll-margin-inline": [
+   "scroll-margin-inline-start",
+   "scroll-margin-inline-end"
+  ],
+  "scroll-padding": [
+   "scroll-padding-top",
+   "scroll-padding-right",
+   "scroll-padding-bottom",
+   "scroll-padding-left"
+  ],
+  "scroll-padding-block": [
+   "scroll-padding-block-start",
+   "scroll-padding-block-end"
+  ],
+  "scroll-padding-inline": [
+   "scroll-padding-inline-start",
+   "scroll-padding-inline-end"
+  ],
+  "scroll-timeline": [
+   "scroll-timeline-name",
+   "scroll-timeline-axis"
+  ],
+  "text-box": [
+   "text-box-trim",
+   "text-box-edge"
+  ],
+  "text-decoration": [
+   "text-decoration-line",
+   "text-decoration-thickness",
+   "text-decoration-style",
+   "text-decoration-color"
+  ],
+  "text-emphasis": [
+   "text-emphasis-style",
+   "text-emphasis-color"
+  ],
+  "text-wrap": [
+   "text-wrap-mode",
+   "text-wrap-style"
+  ],
+  "timeline-trigger": [
+   "timeline-trigger-name",
+   "timeline-trigger-source",
+   "timeline-trigger-activation-range-start",
+   "timeline-trigger-activation-range-end",
+   "timeline-trigger-active-range-start",
+   "timeline-trigger-active-range-end"
+  ],
+  "timeline-trigger-activation-range": [
+   "timeline-trigger-activation-range-start",
+   "timeline-trigger-activation-range-end"
+  ],
+  "timeline-trigger-active-range": [
+   "timeline-trigger-active-range-start",
+   "timeline-trigger-active-range-end"
+  ],
+  "transition": [
+   "transition-property",
+   "transition-duration",
+   "transition-timing-function",
+   "transition-delay",
+   "transition-behavior"
+  ],
+  "view-timeline": [
+   "view-timeline-name",
+   "view-timeline-axis",
+   "view-timeline-inset"
+  ],
+  "white-space": [
+   "white-space-collapse",
+   "text-wrap-mode"
+  ]
+ },
+ "shorthands": {
+  "break-after": [
+   "-webkit-column-break-after",
+   "all",
+   "page-break-after"
+  ],
+  "break-before": [
+   "-webkit-column-break-before",
+   "all",
+   "page-break-before"
+  ],
+  "break-inside": [
+   "-webkit-column-break-inside",
+   "all",
+   "page-break-inside"
+  ],
+  "-webkit-mask-box-image-source": [
+   "-webkit-mask-box-image",
+   "all"
+  ],
+  "-webkit-mask-box-image-slice": [
+   "-webkit-mask-box-image",
+   "all"
+  ],
+  "-webkit-mask-box-image-width": [
+   "-webkit-mask-box-image",
+   "all"
+  ],
+  "-webkit-mask-box-image-outset": [
+   "-webkit-mask-box-image",
+   "all"
+  ],
+  "-webkit-mask-box-image-repeat": [
+   "-webkit-mask-box-image",
+   "all"
+  ],
+  "-webkit-text-stroke-width": [
+   "-webkit-text-stroke",
+   "all"
+  ],
+  "-webkit-text-stroke-color": [
+   "-webkit-text-stroke",
+   "all"
+  ],
+  "-alternative-webkit-line-clamp-longhand": [
+   "all"
+  ],
+  "-webkit-border-horizontal-spacing": [
+   "all",
+   "border-spacing"
+  ],
+  "-webkit-border-vertical-spacing": [
+   "all",
+   "border-spacing"
+  ],
+  "-webkit-box-align": [
+   "all"
+  ],
+  "-webkit-box-decoration-break": [
+   "all"
+  ],
+  "-webkit-box-direction": [
+   "all"
+  ],
+  "-webkit-box-flex": [
+   "all"
+  ],
+  "-webkit-box-ordinal-group": [
+   "all"
+  ],
+  "-webkit-box-orient": [
+   "all"
+  ],
+  "-webkit-box-pack": [
+   "all"
+  ],
+  "-webkit-box-reflect": [
+   "all"
+  ],
+  "-webkit-font-smoothing": [
+   "all"
+  ],
+  "-webkit-line-break": [
+   "all"
+  ],
+  "-webkit-line-clamp": [
+   "all"
+  ],
+  "-webkit-locale": [
+   "all"
+  ],
+  "-webkit-mask-position-x": [
+   "all",
+   "mask",
+   "mask-position"
+  ],
+  "-webkit-mask-position-y": [
+   "all",
+   "mask",
+   "mask-position"
+  ],
+  "-webkit-rtl-ordering": [
+   "all"
+  ],
+  "-webkit-ruby-position": [
+   "all"
+  ],
+  "-webkit-tap-highlight-color": [
+   "all"
+  ],
+  "-webkit-text-combine": [
+   "all"
+  ],
+  "-webkit-text-decorations-in-effect": [
+   "all"
+  ],
+  "-webkit-text-fill-color": [
+   "all"
+  ],
+  "-webkit-text-orientation": [
+   "all"
+  ],
+  "-webkit-text-security": [
+   "all"
+  ],
+  "-webkit-user-drag": [
+   "all"
+  ],
+  "-webkit-writing-mode": [
+   "all"
+  ],
+  "accent-color": [
+   "all"
+  ],
+  "additive-symbols": [
+   "all"
+  ],
+  "align-content": [
+   "all",
+   "place-content"
+  ],
+  "align-items": [
+   "all",
+   "place-items"
+  ],
+  "align-self": [
+   "all",
+   "place-self"
+  ],
+  "alignment-baseline": [
+   "all"
+  ],
+  "anchor-name": [
+   "all"
+  ],
+  "anchor-scope": [
+   "all"
+  ],
+  "animation-composition": [
+   "all"
+  ],
+  "animation-delay": [
+   "all",
+   "animation"
+  ],
+  "animation-direction": [
+   "all",
+   "animation"
+  ],
+  "animation-duration": [
+   "all",
+   "animation"
+  ],
+  "animation-fill-mode": [
+   "all",
+   "animation"
+  ],
+  "animation-iteration-count": [
+   "all",
+   "animation"
+  ],
+  "animation-name": [
+   "all",
+   "animation"
+  ],
+  "animation-play-state": [
+   "all",
+   "animation"
+  ],
+  "animation-range-end": [
+   "all",
+   "animation",
+   "animation-range"
+  ],
+  "animation-range-start": [
+   "all",
+   "animation",
+   "animation-range"
+  ],
+  "animation-timeline": [
+   "all",
+   "animation"
+  ],
+  "animation-timing-function": [
+   "all",
+   "animation"
+  ],
+  "animation-trigger": [
+   "all"
+  ],
+  "app-region": [
+   "all"
+  ],
+  "appearance": [
+   "all"
+  ],
+  "ascent-override": [
+   "all"
+  ],
+  "aspect-ratio": [
+   "all"
+  ],
+  "backdrop-filter": [
+   "all"
+  ],
+  "backface-visibility": [
+   "all"
+  ],
+  "background-attachment": [
+   "all",
+   "background"
+  ],
+  "background-blend-mode": [
+   "all"
+  ],
+  "background-clip": [
+   "all",
+   "background"
+  ],
+  "background-color": [
+   "all",
+   "background"
+  ],
+  "background-image": [
+   "all",
+   "background"
+  ],
+  "background-origin": [
+   "all",
+   "background"
+  ],
+  "background-position-x": [
+   "all",
+   "background",
+   "background-position"
+  ],
+  "background-position-y": [
+   "all",
+   "background",
+   "background-position"
+  ],
+  "background-repeat": [
+   "all",
+   "background"
+  ],
+  "background-size": [
+   "all",
+   "background"
+  ],
+  "base-palette": [
+   "all"
+  ],
+  "base-url": [
+   "all"
+  ],
+  "baseline-shift": [
+   "all"
+  ],
+  "baseline-source": [
+   "all"
+  ],
+  "block-ellipsis": [
+   "all"
+  ],
+  "block-size": [
+   "all"
+  ],
+  "border-block-end-color": [
+   "all",
+   "border-block",
+   "border-block-color",
+   "border-block-end"
+  ],
+  "border-block-end-style": [
+   "all",
+   "border-block",
+   "border-block-end",
+   "border-block-style"
+  ],
+  "border-block-end-width": [
+   "all",
+   "border-block",
+   "border-block-end",
+   "border-block-width"
+  ],
+  "border-block-start-color": [
+   "all",
+   "border-block",
+   "border-block-color",
+   "border-block-start"
+  ],
+  "border-block-start-style": [
+   "all",
+   "border-block",
+   "border-block-start",
+   "border-block-style"
+  ],
+  "border-block-start-width": [
+   "all",
+   "border-block",
+   "border-block-start",
+   "border-block-width"
+  ],
+  "border-bottom-color": [
+   "all",
+   "border",
+   "border-bottom",
+   "border-color"
+  ],
+  "border-bottom-left-radius": [
+   "all",
+   "border-radius"
+  ],
+  "border-bottom-right-radius": [
+   "all",
+   "border-radius"
+  ],
+  "border-bottom-style": [
+   "all",
+   "border",
+   "border-bottom",
+   "border-style"
+  ],
+  "border-bottom-width": [
+   "all",
+   "border",
+   "border-bottom",
+   "border-width"
+  ],
+  "border-collapse": [
+   "all"
+  ],
+  "border-end-end-radius": [
+   "all"
+  ],
+  "border-end-start-radius": [
+   "all"
+  ],
+  "border-image-outset": [
+   "all",
+   "border",
+   "border-image"
+  ],
+  "border-image-repeat": [
+   "all",
+   "border",
+   "border-image"
+  ],
+  "border-image-slice": [
+   "all",
+   "border",
+   "border-image"
+  ],
+  "border-image-source": [
+   "all",
+   "border",
+   "border-image"
+  ],
+  "border-image-width": [
+   "all",
+   "border",
+   "border-image"
+  ],
+  "border-inline-end-color": [
+   "all",
+   "border-inline",
+   "border-inline-color",
+   "border-inline-end"
+  ],
+  "border-inline-end-style": [
+   "all",
+   "border-inline",
+   "border-inline-end",
+   "border-inline-style"
+  ],
+  "border-inline-end-width": [
+   "all",
+   "border-inline",
+   "border-inline-end",
+   "border-inline-width"
+  ],
+  "border-inline-start-color": [
+   "all",
+   "border-inline",
+   "border-inline-color",
+   "border-inline-start"
+  ],
+  "border-inline-start-style": [
+   "all",
+   "border-inline",
+   "border-inline-start",
+   "border-inline-style"
+  ],
+  "border-inline-start-width": [
+   "all",
+   "border-inline",
+   "border-inline-start",
+   "border-inline-width"
+  ],
+  "border-left-color": [
+   "all",
+   "border",
+   "border-color",
+   "border-left"
+  ],
+  "border-left-style": [
+   "all",
+   "border",
+   "border-left",
+   "border-style"
+  ],
+  "border-left-width": [
+   "all",
+   "border",
+   "border-left",
+   "border-width"
+  ],
+  "border-right-color": [
+   "all",
+   "border",
+   "border-color",
+   "border-right"
+  ],
+  "border-right-style": [
+   "all",
+   "border",
+   "border-right",
+   "border-style"
+  ],
+  "border-right-width": [
+   "all",
+   "border",
+   "border-right",
+   "border-width"
+  ],
+  "border-shape": [
+   "all"
+  ],
+  "border-start-end-radius": [
+   "all"
+  ],
+  "border-start-start-radius": [
+   "all"
+  ],
+  "border-top-color": [
+   "all",
+   "border",
+   "border-color",
+   "border-top"
+  ],
+  "border-top-left-radius": [
+   "all",
+   "border-radius"
+  ],
+  "border-top-right-radius": [
+   "all",
+   "border-radius"
+  ],
+  "border-top-style": [
+   "all",
+   "border",
+   "border-style",
+   "border-top"
+  ],
+  "border-top-width": [
+   "all",
+   "border",
+   "border-top",
+   "border-width"
+  ],
+  "bottom": [
+   "all",
+   "inset"
+  ],
+  "box-decoration-break": [
+   "all"
+  ],
+  "box-shadow": [
+   "all"
+  ],
+  "box-sizing": [
+   "all"
+  ],
+  "buffered-rendering": [
+   "all"
+  ],
+  "caption-side": [
+   "all"
+  ],
+  "caret-animation": [
+   "all"
+  ],
+  "caret-color": [
+   "all"
+  ],
+  "caret-shape": [
+   "all"
+  ],
+  "clear": [
+   "all"
+  ],
+  "clip": [
+   "all"
+  ],
+  "clip-path": [
+   "all"
+  ],
+  "clip-rule": [
+   "all"
+  ],
+  "color": [
+   "all"
+  ],
+  "color-interpolation": [
+   "all"
+  ],
+  "color-interpolation-filters": [
+   "all"
+  ],
+  "color-rendering": [
+   "all"
+  ],
+  "color-scheme": [
+   "all"
+  ],
+  "column-count": [
+   "all",
+   "columns"
+  ],
+  "column-fill": [
+   "all"
+  ],
+  "column-gap": [
+   "all",
+   "gap"
+  ],
+  "column-height": [
+   "all",
+   "columns"
+  ],
+  "column-rule-break": [
+   "all",
+   "rule-break"
+  ],
+  "column-rule-color": [
+   "all",
+   "column-rule",
+   "rule",
+   "rule-color"
+  ],
+  "column-rule-inset-cap-end": [
+   "all",
+   "column-rule-inset",
+   "column-rule-inset-cap",
+   "column-rule-inset-end",
+   "rule-inset",
+   "rule-inset-cap",
+   "rule-inset-end"
+  ],
+  "column-rule-inset-cap-start": [
+   "all",
+   "column-rule-inset",
+   "column-rule-inset-cap",
+   "column-rule-inset-start",
+   "rule-inset",
+   "rule-inset-cap",
+   "rule-inset-start"
+  ],
+  "column-rule-inset-junction-end": [
+   "all",
+   "column-rule-inset",
+   "column-rule-inset-end",
+   "column-rule-inset-junction",
+   "rule-inset",
+   "rule-inset-end",
+   "rule-inset-junction"
+  ],
+  "column-rule-inset-junction-start": [
+   "all",
+   "column-rule-inset",
+   "column-rule-inset-junction",
+   "column-rule-inset-start",
+   "rule-inset",
+   "rule-inset-junction",
+   "rule-inset-start"
+  ],
+  "column-rule-style": [
+   "all",
+   "column-rule",
+   "rule",
+   "rule-style"
+  ],
+  "column-rule-visibility-items": [
+   "all",
+   "rule-visibility-items"
+  ],
+  "column-rule-width": [
+   "all",
+   "column-rule",
+   "rule",
+   "rule-width"
+  ],
+  "column-span": [
+   "all"
+  ],
+  "column-width": [
+   "all",
+   "columns"
+  ],
+  "column-wrap": [
+   "all",
+   "columns"
+  ],
+  "contain": [
+   "all"
+  ],
+  "contain-intrinsic-block-size": [
+   "all"
+  ],
+  "contain-intrinsic-height": [
+   "all",
+   "contain-intrinsic-size"
+  ],
+  "contain-intrinsic-inline-size": [
+   "all"
+  ],
+  "contain-intrinsic-width": [
+   "all",
+   "contain-intrinsic-size"
+  ],
+  "container-name": [
+   "all",
+   "container"
+  ],
+  "container-type": [
+   "all",
+   "container"
+  ],
+  "content": [
+   "all"
+  ],
+  "content-visibility": [
+   "all"
+  ],
+  "continue": [
+   "all"
+  ],
+  "corner-bottom-left-shape": [
+   "all",
+   "corner-bottom-shape",
+   "corner-left-shape",
+   "corner-shape"
+  ],
+  "corner-bottom-right-shape": [
+   "all",
+   "corner-bottom-shape",
+   "corner-right-shape",
+   "corner-shape"
+  ],
+  "corner-end-end-shape": [
+   "all",
+   "corner-block-end-shape",
+   "corner-inline-end-shape"
+  ],
+  "corner-end-start-shape": [
+   "all",
+   "corner-block-end-shape",
+   "corner-inline-start-shape"
+  ],
+  "corner-start-end-shape": [
+   "all",
+   "corner-block-start-shape",
+   "corner-inline-end-shape"
+  ],
+  "corner-start-start-shape": [
+   "all",
+   "corner-block-start-shape",
+   "corner-inline-start-shape"
+  ],
+  "corner-top-left-shape": [
+   "all",
+   "corner-left-shape",
+   "corner-shape",
+   "corner-top-shape"
+  ],
+  "corner-top-right-shape": [
+   "all",
+   "corner-right-shape",
+   "corner-shape",
+   "corner-top-shape"
+  ],
+  "counter-increment": [
+   "all"
+  ],
+  "counter-reset": [
+   "all"
+  ],
+  "counter-set": [
+   "all"
+  ],
+  "cursor": [
+   "all"
+  ],
+  "cx": [
+   "all"
+  ],
+  "cy": [
+   "all"
+  ],
+  "d": [
+   "all"
+  ],
+  "descent-override": [
+   "all"
+  ],
+  "display": [
+   "all"
+  ],
+  "dominant-baseline": [
+   "all"
+  ],
+  "dynamic-range-limit": [
+   "all"
+  ],
+  "empty-cells": [
+   "all"
+  ],
+  "fallback": [
+   "all"
+  ],
+  "field-sizing": [
+   "all"
+  ],
+  "fill": [
+   "all"
+  ],
+  "fill-opacity": [
+   "all"
+  ],
+  "fill-rule": [
+   "all"
+  ],
+  "filter": [
+   "all"
+  ],
+  "flex-basis": [
+   "all",
+   "flex"
+  ],
+  "flex-direction": [
+   "all",
+   "flex-flow"
+  ],
+  "flex-grow": [
+   "all",
+   "flex"
+  ],
+  "flex-line-count": [
+   "all"
+  ],
+  "flex-shrink": [
+   "all",
+   "flex"
+  ],
+  "flex-wrap": [
+   "all",
+   "flex-flow"
+  ],
+  "float": [
+   "all"
+  ],
+  "flood-color": [
+   "all"
+  ],
+  "flood-opacity": [
+   "all"
+  ],
+  "flow-tolerance": [
+   "all"
+  ],
+  "font-display": [
+   "all"
+  ],
+  "font-family": [
+   "all",
+   "font"
+  ],
+  "font-feature-settings": [
+   "all",
+   "font"
+  ],
+  "font-kerning": [
+   "all",
+   "font"
+  ],
+  "font-language-override": [
+   "all",
+   "font"
+  ],
+  "font-optical-sizing": [
+   "all",
+   "font"
+  ],
+  "font-palette": [
+   "all"
+  ],
+  "font-size": [
+   "all",
+   "font"
+  ],
+  "font-size-adjust": [
+   "all",
+   "font"
+  ],
+  "font-stretch": [
+   "all",
+   "font"
+  ],
+  "font-style": [
+   "all",
+   "font"
+  ],
+  "font-synthesis-small-caps": [
+   "all",
+   "font-synthesis"
+  ],
+  "font-synthesis-style": [
+   "all",
+   "font-synthesis"
+  ],
+  "font-synthesis-weight": [
+   "all",
+   "font-synthesis"
+  ],
+  "font-variant-alternates": [
+   "all",
+   "font",
+   "font-variant"
+  ],
+  "font-variant-caps": [
+   "all",
+   "font",
+   "font-variant"
+  ],
+  "font-variant-east-asian": [
+   "all",
+   "font",
+   "font-variant"
+  ],
+  "font-variant-emoji": [
+   "all",
+   "font",
+   "font-variant"
+  ],
+  "font-variant-ligatures": [
+   "all",
+   "font",
+   "font-variant"
+  ],
+  "font-variant-numeric": [
+   "all",
+   "font",
+   "font-variant"
+  ],
+  "font-variant-position": [
+   "all",
+   "font",
+   "font-variant"
+  ],
+  "font-variation-settings": [
+   "all",
+   "font"
+  ],
+  "font-weight": [
+   "all",
+   "font"
+  ],
+  "forced-color-adjust": [
+   "all"
+  ],
+  "frame-sizing": [
+   "all"
+  ],
+  "grid-auto-columns": [
+   "all",
+   "grid"
+  ],
+  "grid-auto-flow": [
+   "all",
+   "grid"
+  ],
+  "grid-auto-rows": [
+   "all",
+   "grid"
+  ],
+  "grid-column-end": [
+   "all",
+   "grid-area",
+   "grid-column"
+  ],
+  "grid-column-start": [
+   "all",
+   "grid-area",
+   "grid-column"
+  ],
+  "grid-lanes-direction": [
+   "all"
+  ],
+  "grid-lanes-pack": [
+   "all"
+  ],
+  "grid-row-end": [
+   "all",
+   "grid-area",
+   "grid-row"
+  ],
+  "grid-row-start": [
+   "all",
+   "grid-area",
+   "grid-row"
+  ],
+  "grid-template-areas": [
+   "all",
+   "grid",
+   "grid-template"
+  ],
+  "grid-template-columns": [
+   "all",
+   "grid",
+   "grid-template"
+  ],
+  "grid-template-rows": [
+   "all",
+   "grid",
+   "grid-template"
+  ],
+  "hanging-punctuation": [
+   "all"
+  ],
+  "hash": [
+   "all"
+  ],
+  "height": [
+   "all"
+  ],
+  "hostname": [
+   "all"
+  ],
+  "hyphenate-character": [
+   "all"
+  ],
+  "hyphenate-limit-chars": [
+   "all"
+  ],
+  "hyphens": [
+   "all"
+  ],
+  "image-animation": [
+   "all"
+  ],
+  "image-orientation": [
+   "all"
+  ],
+  "image-rendering": [
+   "all"
+  ],
+  "inherits": [
+   "all"
+  ],
+  "initial-letter": [
+   "all"
+  ],
+  "initial-value": [
+   "all"
+  ],
+  "inline-size": [
+   "all"
+  ],
+  "inset-block-end": [
+   "all",
+   "inset-block"
+  ],
+  "inset-block-start": [
+   "all",
+   "inset-block"
+  ],
+  "inset-inline-end": [
+   "all",
+   "inset-inline"
+  ],
+  "inset-inline-start": [
+   "all",
+   "inset-inline"
+  ],
+  "interactivity": [
+   "all"
+  ],
+  "interest-delay-end": [
+   "all",
+   "interest-delay"
+  ],
+  "interest-delay-start": [
+   "all",
+   "interest-delay"
+  ],
+  "interpolate-size": [
+   "all"
+  ],
+  "isolation": [
+   "all"
+  ],
+  "justify-content": [
+   "all",
+   "place-content"
+  ],
+  "justify-items": [
+   "all",
+   "place-items"
+  ],
+  "justify-self": [
+   "all",
+   "place-self"
+  ],
+  "left": [
+   "all",
+   "inset"
+  ],
+  "letter-spacing": [
+   "all"
+  ],
+  "lighting-color": [
+   "all"
+  ],
+  "line-break": [
+   "all"
+  ],
+  "line-clamp": [
+   "all"
+  ],
+  "line-gap-override": [
+   "all"
+  ],
+  "line-height": [
+   "all",
+   "font"
+  ],
+  "list-style-image": [
+   "all",
+   "list-style"
+  ],
+  "list-style-position": [
+   "all",
+   "list-style"
+  ],
+  "list-style-type": [
+   "all",
+   "list-style"
+  ],
+  "margin-block-end": [
+   "all",
+   "margin-block"
+  ],
+  "margin-block-start": [
+   "all",
+   "margin-block"
+  ],
+  "margin-bottom": [
+   "all",
+   "margin"
+  ],
+  "margin-inline-end": [
+   "all",
+   "margin-inline"
+  ],
+  "margin-inline-start": [
+   "all",
+   "margin-inline"
+  ],
+  "margin-left": [
+   "all",
+   "margin"
+  ],
+  "margin-right": [
+   "all",
+   "margin"
+  ],
+  "margin-top": [
+   "all",
+   "margin"
+  ],
+  "margin-trim": [
+   "all"
+  ],
+  "marker-end": [
+   "all",
+   "marker"
+  ],
+  "marker-mid": [
+   "all",
+   "marker"
+  ],
+  "marker-start": [
+   "all",
+   "marker"
+  ],
+  "mask-clip": [
+   "all",
+   "mask"
+  ],
+  "mask-composite": [
+   "all",
+   "mask"
+  ],
+  "mask-image": [
+   "all",
+   "mask"
+  ],
+  "mask-mode": [
+   "all",
+   "mask"
+  ],
+  "mask-origin": [
+   "all",
+   "mask"
+  ],
+  "mask-repeat": [
+   "all",
+   "mask"
+  ],
+  "mask-size": [
+   "all",
+   "mask"
+  ],
+  "mask-type": [
+   "all"
+  ],
+  "math-depth": [
+   "all"
+  ],
+  "math-shift": [
+   "all"
+  ],
+  "math-style": [
+   "all"
+  ],
+  "max-block-size": [
+   "all"
+  ],
+  "max-content-sizing": [
+   "all"
+  ],
+  "max-height": [
+   "all"
+  ],
+  "max-inline-size": [
+   "all"
+  ],
+  "max-lines": [
+   "all"
+  ],
+  "max-width": [
+   "all"
+  ],
+  "min-block-size": [
+   "all"
+  ],
+  "min-height": [
+   "all"
+  ],
+  "min-inline-size": [
+   "all"
+  ],
+  "min-width": [
+   "all"
+  ],
+  "mix-blend-mode": [
+   "all"
+  ],
+  "navigation": [
+   "all"
+  ],
+  "negative": [
+   "all"
+  ],
+  "object-fit": [
+   "all"
+  ],
+  "object-position": [
+   "all"
+  ],
+  "object-view-box": [
+   "all"
+  ],
+  "offset-anchor": [
+   "all",
+   "offset"
+  ],
+  "offset-distance": [
+   "all",
+   "offset"
+  ],
+  "offset-path": [
+   "all",
+   "offset"
+  ],
+  "offset-position": [
+   "all",
+   "offset"
+  ],
+  "offset-rotate": [
+   "all",
+   "offset"
+  ],
+  "opacity": [
+   "all"
+  ],
+  "order": [
+   "all"
+  ],
+  "origin-trial-test-property": [
+   "all"
+  ],
+  "orphans": [
+   "all"
+  ],
+  "outline-color": [
+   "all",
+   "outline"
+  ],
+  "outline-offset": [
+   "all"
+  ],
+  "outline-style": [
+   "all",
+   "outline"
+  ],
+  "outline-width": [
+   "all",
+   "outline"
+  ],
+  "overflow-anchor": [
+   "all"
+  ],
+  "overflow-block": [
+   "all"
+  ],
+  "overflow-clip-margin": [
+   "all"
+  ],
+  "overflow-inline": [
+   "all"
+  ],
+  "overflow-wrap": [
+   "all"
+  ],
+  "overflow-x": [
+   "all",
+   "overflow"
+  ],
+  "overflow-y": [
+   "all",
+   "overflow"
+  ],
+  "overlay": [
+   "all"
+  ],
+  "override-colors": [
+   "all"
+  ],
+  "overscroll-behavior-block": [
+   "all"
+  ],
+  "overscroll-behavior-inline": [
+   "all"
+  ],
+  "overscroll-behavior-x": [
+   "all",
+   "overscroll-behavior"
+  ],
+  "overscroll-behavior-y": [
+   "all",
+   "overscroll-behavior"
+  ],
+  "overscroll-container-type": [
+   "all"
+  ],
+  "pad": [
+   "all"
+  ],
+  "padding-block-end": [
+   "all",
+   "padding-block"
+  ],
+  "padding-block-start": [
+   "all",
+   "padding-block"
+  ],
+  "padding-bottom": [
+   "all",
+   "padding"
+  ],
+  "padding-inline-end": [
+   "all",
+   "padding-inline"
+  ],
+  "padding-inline-start": [
+   "all",
+   "padding-inline"
+  ],
+  "padding-left": [
+   "all",
+   "padding"
+  ],
+  "padding-right": [
+   "all",
+   "padding"
+  ],
+  "padding-top": [
+   "all",
+   "padding"
+  ],
+  "page": [
+   "all"
+  ],
+  "page-margin-safety": [
+   "all"
+  ],
+  "page-orientation": [
+   "all"
+  ],
+  "paint-order": [
+   "all"
+  ],
+  "path-length": [
+   "all"
+  ],
+  "pathname": [
+   "all"
+  ],
+  "pattern": [
+   "all"
+  ],
+  "perspective": [
+   "all"
+  ],
+  "perspective-origin": [
+   "all"
+  ],
+  "pointer-events": [
+   "all"
+  ],
+  "port": [
+   "all"
+  ],
+  "position": [
+   "all"
+  ],
+  "position-anchor": [
+   "all"
+  ],
+  "position-area": [
+   "all"
+  ],
+  "position-try-fallbacks": [
+   "all",
+   "position-try"
+  ],
+  "position-try-order": [
+   "all",
+   "position-try"
+  ],
+  "position-visibility": [
+   "all"
+  ],
+  "prefix": [
+   "all"
+  ],
+  "print-color-adjust": [
+   "all"
+  ],
+  "protocol": [
+   "all"
+  ],
+  "quotes": [
+   "all"
+  ],
+  "r": [
+   "all"
+  ],
+  "range": [
+   "all"
+  ],
+  "reading-flow": [
+   "all"
+  ],
+  "reading-order": [
+   "all"
+  ],
+  "resize": [
+   "all"
+  ],
+  "result": [
+   "all"
+  ],
+  "right": [
+   "all",
+   "inset"
+  ],
+  "rotate": [
+   "all"
+  ],
+  "row-gap": [
+   "all",
+   "gap"
+  ],
+  "row-rule-break": [
+   "all",
+   "rule-break"
+  ],
+  "row-rule-color": [
+   "all",
+   "row-rule",
+   "rule",
+   "rule-color"
+  ],
+  "row-rule-inset-cap-end": [
+   "all",
+   "row-rule-inset",
+   "row-rule-inset-cap",
+   "row-rule-inset-end",
+   "rule-inset",
+   "rule-inset-cap",
+   "rule-inset-end"
+  ],
+  "row-rule-inset-cap-start": [
+   "all",
+   "row-rule-inset",
+   "row-rule-inset-cap",
+   "row-rule-inset-start",
+   "rule-inset",
+   "rule-inset-cap",
+   "rule-inset-start"
+  ],
+  "row-rule-inset-junction-end": [
+   "all",
+   "row-rule-inset",
+   "row-rule-inset-end",
+   "row-rule-inset-junction",
+   "rule-inset",
+   "rule-inset-end",
+   "rule-inset-junction"
+  ],
+  "row-rule-inset-junction-start": [
+   "all",
+   "row-rule-inset",
+   "row-rule-inset-junction",
+   "row-rule-inset-start",
+   "rule-inset",
+   "rule-inset-junction",
+   "rule-inset-start"
+  ],
+  "row-rule-style": [
+   "all",
+   "row-rule",
+   "rule",
+   "rule-style"
+  ],
+  "row-rule-visibility-items": [
+   "all",
+   "rule-visibility-items"
+  ],
+  "row-rule-width": [
+   "all",
+   "row-rule",
+   "rule",
+   "rule-width"
+  ],
+  "ruby-align": [
+   "all"
+  ],
+  "ruby-overhang": [
+   "all"
+  ],
+  "ruby-position": [
+   "all"
+  ],
+  "rule-overlap": [
+   "all"
+  ],
+  "rx": [
+   "all"
+  ],
+  "ry": [
+   "all"
+  ],
+  "scale": [
+   "all"
+  ],
+  "scroll-axis-lock": [
+   "all"
+  ],
+  "scroll-behavior": [
+   "all"
+  ],
+  "scroll-initial-target": [
+   "all"
+  ],
+  "scroll-margin-block-end": [
+   "all",
+   "scroll-margin-block"
+  ],
+  "scroll-margin-block-start": [
+   "all",
+   "scroll-margin-block"
+  ],
+  "scroll-margin-bottom": [
+   "all",
+   "scroll-margin"
+  ],
+  "scroll-margin-inline-end": [
+   "all",
+   "scroll-margin-inline"
+  ],
+  "scroll-margin-inline-start": [
+   "all",
+   "scroll-margin-inline"
+  ],
+  "scroll-margin-left": [
+   "all",
+   "scroll-margin"
+  ],
+  "scroll-margin-right": [
+   "all",
+   "scroll-margin"
+  ],
+  "scroll-margin-top": [
+   "all",
+   "scroll-margin"
+  ],
+  "scroll-marker-group": [
+   "all"
+  ],
+  "scroll-padding-block-end": [
+   "all",
+   "scroll-padding-block"
+  ],
+  "scroll-padding-block-start": [
+   "all",
+   "scroll-padding-block"
+  ],
+  "scroll-padding-bottom": [
+   "all",
+   "scroll-padding"
+  ],
+  "scroll-padding-inline-end": [
+   "all",
+   "scroll-padding-inline"
+  ],
+  "scroll-padding-inline-start": [
+   "all",
+   "scroll-padding-inline"
+  ],
+  "scroll-padding-left": [
+   "all",
+   "scroll-padding"
+  ],
+  "scroll-padding-right": [
+   "all",
+   "scroll-padding"
+  ],
+  "scroll-padding-top": [
+   "all",
+   "scroll-padding"
+  ],
+  "scroll-snap-align": [
+   "all"
+  ],
+  "scroll-snap-stop": [
+   "all"
+  ],
+  "scroll-snap-type": [
+   "all"
+  ],
+  "scroll-target-group": [
+   "all"
+  ],
+  "scroll-timeline-axis": [
+   "all",
+   "scroll-timeline"
+  ],
+  "scroll-timeline-name": [
+   "all",
+   "scroll-timeline"
+  ],
+  "scrollbar-color": [
+   "all"
+  ],
+  "scrollbar-gutter": [
+   "all"
+  ],
+  "scrollbar-width": [
+   "all"
+  ],
+  "search": [
+   "all"
+  ],
+  "shape-image-threshold": [
+   "all"
+  ],
+  "shape-margin": [
+   "all"
+  ],
+  "shape-outside": [
+   "all"
+  ],
+  "shape-rendering": [
+   "all"
+  ],
+  "size": [
+   "all"
+  ],
+  "size-adjust": [
+   "all"
+  ],
+  "speak": [
+   "all"
+  ],
+  "speak-as": [
+   "all"
+  ],
+  "src": [
+   "all"
+  ],
+  "stop-color": [
+   "all"
+  ],
+  "stop-opacity": [
+   "all"
+  ],
+  "stroke": [
+   "all"
+  ],
+  "stroke-dasharray": [
+   "all"
+  ],
+  "stroke-dashoffset": [
+   "all"
+  ],
+  "stroke-linecap": [
+   "all"
+  ],
+  "stroke-linejoin": [
+   "all"
+  ],
+  "stroke-miterlimit": [
+   "all"
+  ],
+  "stroke-opacity": [
+   "all"
+  ],
+  "stroke-width": [
+   "all"
+  ],
+  "suffix": [
+   "all"
+  ],
+  "symbols": [
+   "all"
+  ],
+  "syntax": [
+   "all"
+  ],
+  "system": [
+   "all"
+  ],
+  "tab-size": [
+   "all"
+  ],
+  "table-layout": [
+   "all"
+  ],
+  "text-align": [
+   "all"
+  ],
+  "text-align-last": [
+   "all"
+  ],
+  "text-anchor": [
+   "all"
+  ],
+  "text-autospace": [
+   "all"
+  ],
+  "text-box-edge": [
+   "all",
+   "text-box"
+  ],
+  "text-box-trim": [
+   "all",
+   "text-box"
+  ],
+  "text-combine-upright": [
+   "all"
+  ],
+  "text-decoration-color": [
+   "all",
+   "text-decoration"
+  ],
+  "text-decoration-inset": [
+   "all"
+  ],
+  "text-decoration-line": [
+   "all",
+   "text-decoration"
+  ],
+  "text-decoration-skip-ink": [
+   "all"
+  ],
+  "text-decoration-skip-spaces": [
+   "all"
+  ],
+  "text-decoration-style": [
+   "all",
+   "text-decoration"
+  ],
+  "text-decoration-thickness": [
+   "all",
+   "text-decoration"
+  ],
+  "text-emphasis-color": [
+   "all",
+   "text-emphasis"
+  ],
+  "text-emphasis-position": [
+   "all"
+  ],
+  "text-emphasis-style": [
+   "all",
+   "text-emphasis"
+  ],
+  "text-fit": [
+   "all"
+  ],
+  "text-indent": [
+   "all"
+  ],
+  "text-justify": [
+   "all"
+  ],
+  "text-orientation": [
+   "all"
+  ],
+  "text-overflow": [
+   "all"
+  ],
+  "text-rendering": [
+   "all"
+  ],
+  "text-shadow": [
+   "all"
+  ],
+  "text-size-adjust": [
+   "all"
+  ],
+  "text-spacing-trim": [
+   "all"
+  ],
+  "text-transform": [
+   "all"
+  ],
+  "text-underline-offset": [
+   "all"
+  ],
+  "text-underline-position": [
+   "all"
+  ],
+  "text-wrap-mode": [
+   "all",
+   "text-wrap",
+   "white-space"
+  ],
+  "text-wrap-style": [
+   "all",
+   "text-wrap"
+  ],
+  "timeline-scope": [
+   "all"
+  ],
+  "timeline-trigger-activation-range-end": [
+   "all",
+   "timeline-trigger",
+   "timeline-trigger-activation-range"
+  ],
+  "timeline-trigger-activation-range-start": [
+   "all",
+   "timeline-trigger",
+   "timeline-trigger-activation-range"
+  ],
+  "timeline-trigger-active-range-end": [
+   "all",
+   "timeline-trigger",
+   "timeline-trigger-active-range"
+  ],
+  "timeline-trigger-active-range-start": [
+   "all",
+   "timeline-trigger",
+   "timeline-trigger-active-range"
+  ],
+  "timeline-trigger-name": [
+   "all",
+   "timeline-trigger"
+  ],
+  "timeline-trigger-source": [
+   "all",
+   "timeline-trigger"
+  ],
+  "top": [
+   "all",
+   "inset"
+  ],
+  "touch-action": [
+   "all"
+  ],
+  "transform": [
+   "all"
+  ],
+  "transform-box": [
+   "all"
+  ],
+  "transform-origin": [
+   "all"
+  ],
+  "transform-style": [
+   "all"
+  ],
+  "transition-behavior": [
+   "all",
+   "transition"
+  ],
+  "transition-delay": [
+   "all",
+   "transition"
+  ],
+  "transition-duration": [
+   "all",
+   "transition"
+  ],
+  "transition-property": [
+   "all",
+   "transition"
+  ],
+  "transition-timing-function": [
+   "all",
+   "transition"
+  ],
+  "translate": [
+   "all"
+  ],
+  "trigger-scope": [
+   "all"
+  ],
+  "types": [
+   "all"
+  ],
+  "unicode-range": [
+   "all"
+  ],
+  "user-select": [
+   "all"
+  ],
+  "vector-effect": [
+   "all"
+  ],
+  "vertical-align": [
+   "all"
+  ],
+  "view-timeline-axis": [
+   "all",
+   "view-timeline"
+  ],
+  "view-timeline-inset": [
+   "all",
+   "view-timeline"
+  ],
+  "view-timeline-name": [
+   "all",
+   "view-timeline"
+  ],
+  "view-transition-class": [
+   "all"
+  ],
+  "view-transition-group": [
+   "all"
+  ],
+  "view-transition-name": [
+   "all"
+  ],
+  "view-transition-scope": [
+   "all"
+  ],
+  "visibility": [
+   "all"
+  ],
+  "white-space-collapse": [
+   "all",
+   "white-space"
+  ],
+  "widows": [
+   "all"
+  ],
+  "width": [
+   "all"
+  ],
+  "will-change": [
+   "all"
+  ],
+  "window-drag": [
+   "all"
+  ],
+  "word-break": [
+   "all"
+  ],
+  "word-spacing": [
+   "all"
+  ],
+  "writing-mode": [
+   "all"
+  ],
+  "x": [
+   "all"
+  ],
+  "y": [
+   "all"
+  ],
+  "z-index": [
+   "all"
+  ],
+  "zoom": [
+   "all"
+  ]
+ }
+};
@@ -9,48 +9,43 @@ Asserts that expected and generated list of GRD files is equal.
 """
 
 import sys
-import json
 
+from grd_manifest import load_manifest, write_stamp
 
-def main(argv):
-    expected_grd_sources = open(argv[1], 'r').read()
-    generated_grd_sources = open(argv[2], 'r').read()
-    stamp_file = argv[3]
-
-    expected_json = json.loads(expected_grd_sources)
-    generated_json = json.loads(generated_grd_sources)
 
-    expected_json.sort()
-    generated_json.sort()
+def check(expected, generated):
+    """Returns the sorted differences between the expected and generated
+    GrdManifests."""
+    return {
+        'not_generated': sorted(expected.files - generated.files),
+        'not_listed': sorted(generated.files - expected.files),
+    }
 
-    return_code = 0
 
-    for expected_file in expected_json:
-        if expected_file not in generated_json:
-            print(
-                "File " + expected_file +
-                " is not generated by any action in front_end." +
-                " Either remove it from config/gni/devtools_grd_files.gni" +
-                " or add the missing file to an action" +
-                " (for example a devtools_module or devtools_entrypoint definition).\n"
-            )
+def print_errors(diff):
+    """Prints the differences returned by check(), and returns the exit
+    code."""
+    for expected_file in diff['not_generated']:
+        print("File " + expected_file +
+              " is not generated by any action in front_end." +
+              " Either remove it from config/gni/devtools_grd_files.gni" +
+              " or add the missing file to an action" +
+              " (for example a devtools_module or devtools_entrypoint definition).\n")
 
-            return_code = 1
+    for generated_file in diff['not_listed']:
+        print(
+            "File " + generated_file +
+            " is not listed in config/gni/devtools_grd_files.gni." +
+            " Either add the file to the grd_files_bundled_sources/grd_files_unbundled_sources,"
+            + " or remove the generated file from an action.\n")
 
-    for generated_file in generated_json:
-        if generated_file not in expected_json:
-            print(
-                "File " + generated_file +
-                " is not listed in config/gni/devtools_grd_files.gni." +
-                " Either add the file to the grd_files_bundled_sources/grd_files_unbundled_sources,"
-                + " or remove the generated file from an action.\n")
+    return 1 if any(diff.values()) else 0
 
-            return_code = 1
 
-    with open(stamp_file, 'w', encoding="utf8") as fp:
-        fp.write("")
-
-    return return_code
+def main(argv):
+    diff = check(load_manifest(argv[1]), load_manifest(argv[2]))
+    write_stamp(argv[3])
+    return print_errors(diff)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,55 @@
+#!/usr/bin/env vpython3
+# -*- coding: UTF-8 -*-
+#
+# Copyright 2026 The Chromium Authors
+# Use of this source code is governed by a BSD-style license that can be
+# found in the LICENSE file.
+"""
+Runs the checks of assert_grd.py and assert_third_party_readmes.py in one
+process, on lists that are only loaded once.
+"""
+
+import argparse
+import json
+import sys
+
+import assert_grd
+import assert_third_party_readmes
+from generated_files import write_if_changed
+from grd_manifest import load_list, load_manifest, write_stamp
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--expected_grd_files', required=True)
+    parser.add_argument('--input_grd_files', required=True)
+    parser.add_argument('--third_party_readme_paths', required=True)
+    parser.add_argument('--stamp', required=True)
+    parser.add_argument('--report',
+                        help='Write the differences that were found as JSON.')
+    return parser.parse_args(argv)
+
+
+def main(argv):
+    args = parse_args(argv[1:])
+    expected = load_manifest(args.expected_grd_files)
+    report = {
+        'grd':
+        assert_grd.check(expected, load_manifest(args.input_grd_files)),
+        'third_party_readmes':
+        assert_third_party_readmes.check(
+            expected, load_list(args.third_party_readme_paths)),
+    }
+    if args.report:
+        write_if_changed(args.report,
+                         json.dumps(report, indent=2, sort_keys=True) + '\n')
+    write_stamp(args.stamp)
+
+    return_code = assert_grd.print_errors(report['grd'])
+    return_code |= assert_third_party_readmes.print_errors(
+        report['third_party_readmes'])
+    return return_code
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv))
@@ -9,33 +9,33 @@ Asserts that all third_party packages are included in additional_readme_paths.js
 """
 
 import sys
-import json
 
+from grd_manifest import load_list, load_manifest, write_stamp
 
-def main(argv):
-    grd_sources = open(argv[1], 'r').read()
-    listed_third_party_directories = open(argv[2], 'r').read()
-    stamp_file = argv[3]
 
-    grd_json = json.loads(grd_sources)
-    listed_third_party_directories_json = json.loads(
-        listed_third_party_directories)
+def _is_exempt(listed_directory):
+    # Exception for Puppeteer's transitive dependencies.
+    # TODO(crbug.com/1287519): Remove exception for codemirror 5
+    return (listed_directory == "codemirror"
+            or listed_directory.startswith("puppeteer/"))
 
-    grd_json.sort()
-    listed_third_party_directories_json.sort()
 
-    return_code = 0
-    found_directories = set()
-    missing_directories = set()
+def check(grd, listed_third_party_directories):
+    """Returns the sorted differences between the third_party directories of
+    the grd GrdManifest and the listed ones."""
+    return {
+        'not_listed':
+        sorted(grd.third_party_directories - listed_third_party_directories),
+        'not_shipped':
+        sorted(directory for directory in listed_third_party_directories -
+               grd.third_party_directories if not _is_exempt(directory)),
+    }
 
-    for grd_file in grd_json:
-        if grd_file.startswith("front_end/third_party"):
-            third_party_directory_name = grd_file.split("/")[2]
-            found_directories.add(third_party_directory_name)
-            if third_party_directory_name not in listed_third_party_directories_json:
-                missing_directories.add(third_party_directory_name)
 
-    for missing_directory in missing_directories:
+def print_errors(diff):
+    """Prints the differences returned by check(), and returns the exit
+    code."""
+    for missing_directory in diff['not_listed']:
         print(
             "Directory `" + missing_directory + "`" +
             " is not listed in the `additional_readme_paths.json` file " +
@@ -44,26 +44,20 @@ def main(argv):
             " directories in the `.json` file to ensure all licenses are listed"
             + " in chrome://credits.\n")
 
-        return_code = 1
-
-    for listed_directory in listed_third_party_directories_json:
-        # Exception for Puppeteer's transitive dependencies.
-        if (listed_directory not in found_directories
-                # TODO(crbug.com/1287519): Remove exception for codemirror 5
-                and not listed_directory == "codemirror" and
-                not listed_directory.startswith("puppeteer/")):
-            print(
-                "Directory `" + listed_directory + "`" +
-                " is not included in `config/gni/devtools_grd_files.gni`." +
-                " Make sure to only include third_party directories that are shipped"
-                + " in Chromium.\n")
+    for listed_directory in diff['not_shipped']:
+        print(
+            "Directory `" + listed_directory + "`" +
+            " is not included in `config/gni/devtools_grd_files.gni`." +
+            " Make sure to only include third_party directories that are shipped"
+            + " in Chromium.\n")
 
-            return_code = 1
+    return 1 if any(diff.values()) else 0
 
-    with open(stamp_file, 'w', encoding="utf8") as fp:
-        fp.write("")
 
-    return return_code
+def main(argv):
+    diff = check(load_manifest(argv[1]), load_list(argv[2]))
+    write_stamp(argv[3])
+    return print_errors(diff)
 
 
 if __name__ == '__main__':
@@ -28,11 +28,17 @@
 # (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+import argparse
+import hashlib
 import sys
 import string
 import re
+import statistics
+import time
 from os import path
 
+from generated_files import write_if_changed
+
 try:
     import json
 except ImportError:
@@ -98,23 +104,28 @@ class TypeData(object):
 
 
 class TypeMap:
+    """Index of the raw JS type of every protocol type.
+
+    Types are keyed by their fully qualified name, e.g. "DOM.NodeId", so that
+    resolving a `$ref` is a single dictionary lookup.
+    """
 
     def __init__(self, api):
-        self.map_ = {}
+        self.raw_types_ = {}
         for json_domain in api["domains"]:
             domain_name = json_domain["domain"]
+            for json_type in json_domain.get("types", ()):
+                self.raw_types_["%s.%s" % (domain_name, json_type["id"])] = (
+                    TypeData(json_type).get_raw_type_js())
 
-            domain_map = {}
-            self.map_[domain_name] = domain_map
+    def get_raw_type_js(self, qualified_name):
+        return self.raw_types_[qualified_name]
 
-            if "types" in json_domain:
-                for json_type in json_domain["types"]:
-                    type_name = json_type["id"]
-                    type_data = TypeData(json_type)
-                    domain_map[type_name] = type_data
 
-    def get(self, domain_name, type_name):
-        return self.map_[domain_name][type_name]
+def qualify_ref(json_ref, scope_domain_name):
+    if "." in json_ref:
+        return json_ref
+    return "%s.%s" % (scope_domain_name, json_ref)
 
 
 def resolve_param_raw_type_js(json_parameter, scope_domain_name):
@@ -129,20 +140,7 @@ def resolve_param_raw_type_js(json_parameter, scope_domain_name):
 
 
 def get_ref_data_js(json_ref, scope_domain_name):
-    dot_pos = json_ref.find(".")
-    if dot_pos == -1:
-        domain_name = scope_domain_name
-        type_name = json_ref
-    else:
-        domain_name = json_ref[:dot_pos]
-        type_name = json_ref[dot_pos + 1:]
-
-    return type_map.get(domain_name, type_name).get_raw_type_js()
-
-
-input_file = open(READ_LOCATION, "r")
-json_string = input_file.read()
-json_api = json.loads(json_string)
+    return type_map.get_raw_type_js(qualify_ref(json_ref, scope_domain_name))
 
 
 class Templates:
@@ -167,7 +165,7 @@ class Templates:
 
         return "/".join(components)
 
-    file_header_ = ("""// Copyright 2020 The Chromium Authors
+    file_prelude_ = ("""// Copyright 2020 The Chromium Authors
 // Use of this source code is governed by a BSD-style license that can be
 // found in the LICENSE file.
 """ + "// File is generated by %s\n" % get_this_script_path_(sys.argv[0]) + """
@@ -186,94 +184,236 @@ export interface InspectorBackendAPI {
   registerEvent(event: string, params: string[]): void;
   registerType(type: string, parameters: CommandParameter[]): void;
 }
+""")
 
+    backend_js = string.Template(file_prelude_ + """
 export function registerCommands(inspectorBackend: InspectorBackendAPI): void {
-""")
 
-    backend_js = string.Template(file_header_ + """
 
 $domainInitializers
 }
 """)
 
+    # Splits the registrations into one function per domain, see
+    # `render_domains`.
+    backend_js_domains = string.Template(file_prelude_ + """
+export interface DomainManifestEntry {
+  commands: string[];
+  events: string[];
+  // Other domains whose types are referenced by this domain's registrations.
+  dependencies: string[];
+}
+
+export const domainManifest: Record<string, DomainManifestEntry> = {
+$domainManifest};
+
+const domainRegistrations: Record<string, (inspectorBackend: InspectorBackendAPI) => void> = {
+$domainRegistrations};
+
+/**
+ * Registers all commands, events, enums and types of `domain`.
+ * Returns false if the domain is unknown.
+ */
+export function registerDomain(inspectorBackend: InspectorBackendAPI, domain: string): boolean {
+  const register = domainRegistrations[domain];
+  if (!register) {
+    return false;
+  }
+  register(inspectorBackend);
+  return true;
+}
+
+export function registerCommands(inspectorBackend: InspectorBackendAPI): void {
+  for (const domain of Object.keys(domainRegistrations)) {
+    registerDomain(inspectorBackend, domain);
+  }
+}
+""")
+
+    # The table format encodes the same registrations as plain number arrays,
+    # which are much cheaper to parse than the equivalent object literals:
+    #  - `strings` holds every distinct string once.
+    #  - `parameterTable` holds each distinct parameter descriptor once, as
+    #    5 numbers: name, type, optional (0/1), description and typeRef (-1
+    #    for null), all but `optional` being indices into `strings`.
+    #  - `entryTable` holds the registrations. Each one starts with its kind
+    #    and the index of its qualified name, followed by counted lists:
+    #      enum:    count, (key, value)*
+    #      event:   count, parameter name*
+    #      command: count, parameter descriptor*, count, reply name*,
+    #               description
+    #      type:    count, parameter descriptor*
+    #  - `domainTable` holds (domain name, offset into entryTable) pairs.
+    backend_js_table = string.Template(file_prelude_ + """
+const strings: string[] = $strings;
+
+const parameterTable: number[] = $parameterTable;
+
+const domainTable: number[] = $domainTable;
+
+const entryTable: number[] = $entryTable;
+
+const ENUM = 0;
+const EVENT = 1;
+const COMMAND = 2;
+const TYPE = 3;
+
+function decodeParameters(): CommandParameter[] {
+  const parameters = [];
+  for (let i = 0; i < parameterTable.length; i += 5) {
+    const typeRef = parameterTable[i + 4];
+    parameters.push({
+      name: strings[parameterTable[i]],
+      type: strings[parameterTable[i + 1]],
+      optional: parameterTable[i + 2] === 1,
+      description: strings[parameterTable[i + 3]],
+      typeRef: typeRef === -1 ? null : strings[typeRef],
+    });
+  }
+  return parameters;
+}
+
+function registerEntries(
+    inspectorBackend: InspectorBackendAPI, parameters: CommandParameter[], start: number, end: number): void {
+  let cursor = start;
+  const next = (): number => entryTable[cursor++];
+  const nextStrings = (): string[] => {
+    const values = [];
+    for (let count = next(); count > 0; --count) {
+      values.push(strings[next()]);
+    }
+    return values;
+  };
+  const nextParameters = (): CommandParameter[] => {
+    const values = [];
+    for (let count = next(); count > 0; --count) {
+      values.push(parameters[next()]);
+    }
+    return values;
+  };
+  while (cursor < end) {
+    const kind = next();
+    const name = strings[next()];
+    if (kind === ENUM) {
+      const values: Record<string, string> = {};
+      for (let count = next(); count > 0; --count) {
+        const key = strings[next()];
+        values[key] = strings[next()];
+      }
+      inspectorBackend.registerEnum(name, values);
+    } else if (kind === EVENT) {
+      inspectorBackend.registerEvent(name, nextStrings());
+    } else if (kind === COMMAND) {
+      const commandParameters = nextParameters();
+      const replyArgs = nextStrings();
+      inspectorBackend.registerCommand(name, commandParameters, replyArgs, strings[next()]);
+    } else if (kind === TYPE) {
+      inspectorBackend.registerType(name, nextParameters());
+    } else {
+      throw new Error(`Unknown protocol table entry kind $${kind}`);
+    }
+  }
+}
+
+export function registerCommands(inspectorBackend: InspectorBackendAPI): void {
+  const parameters = decodeParameters();
+  for (let i = 0; i < domainTable.length; i += 2) {
+    const end = i + 3 < domainTable.length ? domainTable[i + 3] : entryTable.length;
+    registerEntries(inspectorBackend, parameters, domainTable[i + 1], end);
+  }
+}
+""")
+
 
-type_map = TypeMap(json_api)
+type_map = None
 
 
 class Generator:
-    backend_js_domain_initializer_list = []
+    # Generation produces a list of records per domain, one per registration.
+    # Each record is a JSON-serializable list, see `render_call` and
+    # `render_table`.
 
     @staticmethod
-    def go():
+    def go(json_api, domain_cache=None):
+        """Returns a list of (domain name, records) pairs."""
+        domains = []
         for json_domain in json_api["domains"]:
             domain_name = json_domain["domain"]
             domain_name_lower = domain_name.lower()
             if domain_name_lower == "console":
                 continue
 
-            Generator.backend_js_domain_initializer_list.append("// %s.\n" %
-                                                                domain_name)
-
-            if "types" in json_domain:
-                for json_type in json_domain["types"]:
-                    if "type" in json_type and json_type["type"] == "string" and "enum" in json_type:
-                        enum_name = "%s.%s" % (domain_name, json_type["id"])
-                        Generator.process_enum(json_type, enum_name)
-                    elif json_type["type"] == "object":
-                        if "properties" in json_type:
-                            for json_property in json_type["properties"]:
-                                if "type" in json_property and json_property["type"] == "string" and "enum" in json_property:
-                                    enum_name = "%s.%s%s" % (
-                                        domain_name, json_type["id"],
-                                        to_title_case(json_property["name"]))
-                                    Generator.process_enum(
-                                        json_property, enum_name)
-
-            if "events" in json_domain:
-                for json_event in json_domain["events"]:
-                    if "parameters" in json_event:
-                        for param in json_event["parameters"]:
-                            if "enum" in param:
-                                enum_name = "%s.%sEvent%s" % (
-                                    domain_name,
-                                    to_title_case(json_event["name"]),
-                                    to_title_case(param["name"]))
-                                Generator.process_enum(param, enum_name)
-                    Generator.process_event(json_event, domain_name)
-
-            if "commands" in json_domain:
-                for json_command in json_domain["commands"]:
-                    if "parameters" in json_command:
-                        for param in json_command["parameters"]:
-                            if "enum" in param:
-                                enum_name = "%s.%sRequest%s" % (
-                                    domain_name,
-                                    to_title_case(json_command["name"]),
-                                    to_title_case(param["name"]))
-                                Generator.process_enum(param, enum_name)
-                    Generator.process_command(json_command, domain_name)
-
-            if "types" in json_domain:
-                for json_type in json_domain["types"]:
-                    if json_type[
-                            "type"] == "object" and "properties" in json_type:
-                        Generator.process_type(json_type["properties"],
-                                               domain_name, json_type["id"])
-                    elif json_type["type"] == "array":
-                        Generator.process_type([json_type], domain_name,
-                                               json_type["id"])
-
-            Generator.backend_js_domain_initializer_list.append("\n")
+            fingerprint = None
+            if domain_cache is not None:
+                fingerprint = domain_fingerprint(json_domain)
+                cached = domain_cache.get(domain_name, fingerprint)
+                if cached is not None:
+                    domains.append((domain_name, cached))
+                    continue
+
+            records = Generator.generate_domain(json_domain)
+            domains.append((domain_name, records))
+            if domain_cache is not None:
+                domain_cache.put(domain_name, fingerprint, records)
+        return domains
+
+    @staticmethod
+    def generate_domain(json_domain):
+        """Collects the records of a domain in a single pass over it.
+
+        The records are grouped as enums declared by types, events (each
+        preceded by its enums), commands (likewise) and type registrations.
+        """
+        domain_name = json_domain["domain"]
+        type_enums = []
+        events = []
+        commands = []
+        types = []
+
+        for json_type in json_domain.get("types", ()):
+            type_id = json_type["id"]
+            if json_type.get("type") == "string" and "enum" in json_type:
+                type_enums.append(
+                    Generator.process_enum(json_type,
+                                           "%s.%s" % (domain_name, type_id)))
+            elif json_type["type"] == "object" and "properties" in json_type:
+                for json_property in json_type["properties"]:
+                    if json_property.get(
+                            "type") == "string" and "enum" in json_property:
+                        enum_name = "%s.%s%s" % (
+                            domain_name, type_id,
+                            to_title_case(json_property["name"]))
+                        type_enums.append(
+                            Generator.process_enum(json_property, enum_name))
+                types.append(
+                    Generator.process_type(json_type["properties"],
+                                           domain_name, type_id))
+            elif json_type["type"] == "array":
+                types.append(
+                    Generator.process_type([json_type], domain_name, type_id))
+
+        for json_event in json_domain.get("events", ()):
+            for param in json_event.get("parameters", ()):
+                if "enum" in param:
+                    enum_name = "%s.%sEvent%s" % (
+                        domain_name, to_title_case(json_event["name"]),
+                        to_title_case(param["name"]))
+                    events.append(Generator.process_enum(param, enum_name))
+            events.append(Generator.process_event(json_event, domain_name))
+
+        for json_command in json_domain.get("commands", ()):
+            commands.extend(
+                Generator.process_command(json_command, domain_name))
+
+        return type_enums + events + commands + types
 
     @staticmethod
     def process_enum(json_enum, enum_name):
         enum_members = []
         for member in json_enum["enum"]:
-            enum_members.append("%s: \"%s\"" %
-                                (fix_camel_case(member), member))
+            enum_members.append([fix_camel_case(member), member])
 
-        Generator.backend_js_domain_initializer_list.append(
-            "inspectorBackend.registerEnum(\"%s\", {%s});\n" % (enum_name, ", ".join(enum_members)))
+        return ["enum", enum_name, enum_members]
 
     @staticmethod
     def process_event(json_event, domain_name):
@@ -281,20 +421,21 @@ class Generator:
 
         json_parameters = json_event.get("parameters")
 
-        backend_js_event_param_list = []
+        event_param_list = []
         if json_parameters:
             for parameter in json_parameters:
-                parameter_name = parameter["name"]
-                backend_js_event_param_list.append("\"%s\"" % parameter_name)
+                event_param_list.append(parameter["name"])
 
-        Generator.backend_js_domain_initializer_list.append("inspectorBackend.registerEvent(\"%s.%s\", [%s]);\n" %
-                                                            (domain_name, event_name, ", ".join(backend_js_event_param_list)))
+        return ["event", "%s.%s" % (domain_name, event_name), event_param_list]
+
+    @staticmethod
+    def normalize_description(description):
+        return description.replace('\r\n',
+                                   ' ').replace('\r', ' ').replace('\n', ' ')
 
     @staticmethod
     def format_description(description):
-        description = description.replace('\r\n',
-                                          ' ').replace('\r',
-                                                       ' ').replace('\n', ' ')
+        description = Generator.normalize_description(description)
         description = description.replace('"', '\\"')
         return description
 
@@ -306,24 +447,19 @@ class Generator:
 
         type_ref = json_parameter.get("$ref")
         if type_ref:
-            type_ref = type_ref if '.' in type_ref else "%s.%s" % (domain_name,
-                                                                   type_ref)
-        json_ref = ""
-        js_bind_type = resolve_param_raw_type_js(json_parameter, domain_name)
+            type_ref = qualify_ref(type_ref, domain_name)
+            js_bind_type = type_map.get_raw_type_js(type_ref)
+        else:
+            js_bind_type = resolve_param_raw_type_js(json_parameter,
+                                                     domain_name)
 
         if js_bind_type == "array" and 'items' in json_parameter:
             if '$ref' in json_parameter['items']:
-                json_ref = json_parameter['items']['$ref']
-                type_ref = json_ref if '.' in json_ref else "%s.%s" % (
-                    domain_name, json_ref)
+                type_ref = qualify_ref(json_parameter['items']['$ref'],
+                                       domain_name)
             elif 'type' in json_parameter['items']:
                 type_ref = json_parameter['items']['type']
 
-        if js_bind_type == "object" and "$ref" in json_parameter:
-            json_ref = json_parameter["$ref"]
-            type_ref = json_ref if '.' in json_ref else "%s.%s" % (domain_name,
-                                                                   json_ref)
-
         if (json_parameter.get("enum") and enum_name):
             type_ref = enum_name
 
@@ -335,67 +471,352 @@ class Generator:
             "description": json_param_description,
             "typeRef": type_ref
         }
-        js_param_text = json.dumps(param_dict)
 
-        return js_param_text
+        return param_dict
 
     @staticmethod
     def process_type(json_type, domain_name, type_id):
-        js_param_list = []
+        param_list = []
         for json_parameter in json_type:
-            js_param_text = Generator.convert_json_parameter(
-                json_parameter, domain_name, None)
-            js_param_list.append(js_param_text)
-
-        js_parameters_text = ", ".join(js_param_list)
+            param_list.append(
+                Generator.convert_json_parameter(json_parameter, domain_name,
+                                                 None))
 
-        Generator.backend_js_domain_initializer_list.append(
-            "inspectorBackend.registerType(\"%s.%s\", [%s]);\n" % (
-                domain_name,
-                type_id,
-                js_parameters_text,
-            ))
+        return ["type", "%s.%s" % (domain_name, type_id), param_list]
 
     @staticmethod
     def process_command(json_command, domain_name):
+        """Returns the records of the command's enums and of the command."""
         json_command_name = json_command["name"]
         json_command_description = json_command.get("description", "")
-        js_parameters_text = ""
+        records = []
+        param_list = []
         if "parameters" in json_command:
             json_params = json_command["parameters"]
-            js_param_list = []
             enum_name = None
             for json_parameter in json_params:
                 if "enum" in json_parameter:
                     enum_name = "%s.%sRequest%s" % (
                         domain_name, to_title_case(json_command["name"]),
                         to_title_case(json_parameter["name"]))
-                js_param_text = Generator.convert_json_parameter(
-                    json_parameter, domain_name, enum_name)
-                js_param_list.append(js_param_text)
+                    records.append(
+                        Generator.process_enum(json_parameter, enum_name))
+                param_list.append(
+                    Generator.convert_json_parameter(json_parameter,
+                                                     domain_name, enum_name))
 
-            js_parameters_text = ", ".join(js_param_list)
-
-        backend_js_reply_param_list = []
+        reply_list = []
         if "returns" in json_command:
             for json_return in json_command["returns"]:
-                json_return_name = json_return["name"]
-                backend_js_reply_param_list.append("\"%s\"" % json_return_name)
+                reply_list.append(json_return["name"])
 
-        js_reply_list = "[%s]" % ", ".join(backend_js_reply_param_list)
-        json_command_description = Generator.format_description(
+        json_command_description = Generator.normalize_description(
             json_command_description)
-        Generator.backend_js_domain_initializer_list.append(
-            "inspectorBackend.registerCommand(\"%s.%s\", [%s], %s, \"%s\");\n"
-            % (domain_name, json_command_name, js_parameters_text,
-               js_reply_list, json_command_description))
-
-
-Generator.go()
-
-backend_js_file = open(GENERATED_LOCATION, "w+", newline='\n')
+        records.append([
+            "command",
+            "%s.%s" % (domain_name, json_command_name), param_list,
+            reply_list, json_command_description
+        ])
+        return records
+
+
+def render_call(record):
+    """Renders the `inspectorBackend.registerX()` call of a single record."""
+    kind, name = record[0], record[1]
+    if kind == "enum":
+        members = ["%s: \"%s\"" % (key, value) for key, value in record[2]]
+        return "inspectorBackend.registerEnum(\"%s\", {%s});\n" % (
+            name, ", ".join(members))
+    if kind == "event":
+        params = ["\"%s\"" % param for param in record[2]]
+        return "inspectorBackend.registerEvent(\"%s\", [%s]);\n" % (
+            name, ", ".join(params))
+    if kind == "command":
+        params = [json.dumps(param) for param in record[2]]
+        replies = ["\"%s\"" % reply for reply in record[3]]
+        description = record[4].replace('"', '\\"')
+        return "inspectorBackend.registerCommand(\"%s\", [%s], [%s], \"%s\");\n" % (
+            name, ", ".join(params), ", ".join(replies), description)
+    if kind == "type":
+        params = [json.dumps(param) for param in record[2]]
+        return "inspectorBackend.registerType(\"%s\", [%s]);\n" % (
+            name, ", ".join(params))
+    raise Exception("Unknown record kind: %s" % kind)
+
+
+def render_calls(domains):
+    """Renders one `inspectorBackend.registerX()` call per registration."""
+    lines = []
+    for domain_name, records in domains:
+        lines.append("// %s.\n" % domain_name)
+        lines.extend(render_call(record) for record in records)
+        lines.append("\n")
+    return Templates.backend_js.substitute(None,
+                                           domainInitializers="".join(lines))
+
+
+def domain_manifest_entry(domain_name, records):
+    """Lists the commands and events of a domain, and the other domains whose
+    types its registrations refer to."""
+    commands = []
+    events = []
+    dependencies = set()
+    for record in records:
+        kind, name = record[0], record[1]
+        if kind == "command":
+            commands.append(name[len(domain_name) + 1:])
+        elif kind == "event":
+            events.append(name[len(domain_name) + 1:])
+        if kind in ("command", "type"):
+            for param in record[2]:
+                type_ref = param["typeRef"]
+                if type_ref and "." in type_ref:
+                    ref_domain = type_ref.split(".", 1)[0]
+                    if ref_domain != domain_name:
+                        dependencies.add(ref_domain)
+    return {
+        "commands": commands,
+        "events": events,
+        "dependencies": sorted(dependencies),
+    }
+
+
+def render_domains(domains):
+    """Renders one registration function per domain plus a manifest.
+
+    Function bodies that never run are only pre-parsed by the JS engine, so
+    consumers that call `registerDomain()` on first use of a domain don't pay
+    for the registrations of domains they never use.
+    """
+    manifest = []
+    functions = []
+    for domain_name, records in domains:
+        manifest.append("  %s: %s,\n" % (json.dumps(domain_name),
+                                         json.dumps(
+                                             domain_manifest_entry(
+                                                 domain_name, records))))
+        body = "".join("    " + render_call(record) for record in records)
+        functions.append(
+            "  %s(inspectorBackend: InspectorBackendAPI): void {\n%s  },\n" %
+            (domain_name, body))
+    return Templates.backend_js_domains.substitute(
+        None,
+        domainManifest="".join(manifest),
+        domainRegistrations="".join(functions))
+
+
+def _format_number_array(values, per_line=32):
+    rows = []
+    for i in range(0, len(values), per_line):
+        rows.append("  " + ", ".join(str(value)
+                                     for value in values[i:i + per_line]) +
+                    ",")
+    return "[\n%s\n]" % "\n".join(rows) if rows else "[]"
+
+
+def render_table(domains):
+    """Renders the registrations as deduplicated tables, see Templates."""
+    strings = {}
+    parameters = {}
+    entries = []
+    domain_table = []
+
+    def intern(value):
+        index = strings.get(value)
+        if index is None:
+            index = strings[value] = len(strings)
+        return index
+
+    def intern_parameter(param):
+        type_ref = param["typeRef"]
+        key = (intern(param["name"]), intern(param["type"]),
+               1 if param["optional"] else 0, intern(param["description"]),
+               -1 if type_ref is None else intern(type_ref))
+        index = parameters.get(key)
+        if index is None:
+            index = parameters[key] = len(parameters)
+        return index
+
+    def add_list(values, convert):
+        entries.append(len(values))
+        entries.extend(convert(value) for value in values)
+
+    for domain_name, records in domains:
+        domain_table += [intern(domain_name), len(entries)]
+        for record in records:
+            kind, name = record[0], record[1]
+            if kind == "enum":
+                entries += [0, intern(name), len(record[2])]
+                for key, value in record[2]:
+                    entries += [intern(key), intern(value)]
+            elif kind == "event":
+                entries += [1, intern(name)]
+                add_list(record[2], intern)
+            elif kind == "command":
+                entries += [2, intern(name)]
+                add_list(record[2], intern_parameter)
+                add_list(record[3], intern)
+                entries.append(intern(record[4]))
+            elif kind == "type":
+                entries += [3, intern(name)]
+                add_list(record[2], intern_parameter)
+
+    parameter_table = [value for key in parameters for value in key]
+    string_table = "[\n%s\n]" % "\n".join("  %s," % json.dumps(value)
+                                           for value in strings)
+    return Templates.backend_js_table.substitute(
+        None,
+        strings=string_table,
+        parameterTable=_format_number_array(parameter_table, per_line=30),
+        domainTable=_format_number_array(domain_table),
+        entryTable=_format_number_array(entries))
+
+
+def _collect_external_refs(value, refs):
+    if isinstance(value, dict):
+        json_ref = value.get("$ref")
+        if isinstance(json_ref, str) and "." in json_ref:
+            refs.add(json_ref)
+        for child in value.values():
+            _collect_external_refs(child, refs)
+    elif isinstance(value, list):
+        for child in value:
+            _collect_external_refs(child, refs)
+
+
+def _generator_fingerprint():
+    with open(path.abspath(__file__), "rb") as script:
+        return hashlib.sha1(script.read()).hexdigest()
+
+
+def domain_fingerprint(json_domain):
+    # The initializers of a domain depend on the domain itself and on the raw
+    # types of the types it references in other domains.
+    refs = set()
+    _collect_external_refs(json_domain, refs)
+    external_types = [(ref, get_ref_data_js(ref, json_domain["domain"]))
+                      for ref in sorted(refs)]
+    fingerprint_input = json.dumps([json_domain, external_types],
+                                   sort_keys=True)
+    return hashlib.sha1(fingerprint_input.encode("utf-8")).hexdigest()
+
+
+class DomainCache:
+    """Generated registration records of each domain from a previous run.
+
+    Records are keyed by a fingerprint of the domain's protocol definition, and
+    the whole cache is dropped when this script changes.
+    """
+
+    def __init__(self, location):
+        self.location = location
+        self.generator = _generator_fingerprint()
+        self.domains_ = {}
+        self.dirty_ = False
+        try:
+            with open(location, "r", encoding="utf-8") as cache_file:
+                data = json.load(cache_file)
+            if data.get("generator") == self.generator:
+                self.domains_ = data["domains"]
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            pass
+
+    def get(self, domain_name, fingerprint):
+        entry = self.domains_.get(domain_name)
+        if not isinstance(entry, dict) or entry.get("fingerprint") != fingerprint:
+            return None
+        return entry.get("records")
+
+    def put(self, domain_name, fingerprint, records):
+        self.domains_[domain_name] = {
+            "fingerprint": fingerprint,
+            "records": records,
+        }
+        self.dirty_ = True
+
+    def save(self):
+        if not self.dirty_:
+            return
+        data = {"generator": self.generator, "domains": self.domains_}
+        try:
+            # Keys are not sorted, since the order of parameter properties
+            # ends up in the generated output.
+            write_if_changed(self.location, json.dumps(data))
+        except OSError:
+            # The cache is only an optimization.
+            pass
+
+
+OUTPUT_FORMATS = {
+    "calls": render_calls,
+    "table": render_table,
+    "domains": render_domains,
+}
 
-backend_js_file.write(
-    Templates.backend_js.substitute(None, domainInitializers="".join(Generator.backend_js_domain_initializer_list)))
 
-backend_js_file.close()
+def generate(json_api, domain_cache=None, output_format="calls"):
+    global type_map
+    type_map = TypeMap(json_api)
+    domains = Generator.go(json_api, domain_cache)
+    return OUTPUT_FORMATS[output_format](domains)
+
+
+def benchmark(json_api, iterations):
+    """Times generation from the parsed protocol, without caching or I/O."""
+    print("Generating from %d domains, %d iterations" %
+          (len(json_api["domains"]), iterations))
+    for output_format in sorted(OUTPUT_FORMATS):
+        timings = []
+        for _ in range(iterations):
+            start = time.perf_counter()
+            contents = generate(json_api, None, output_format)
+            timings.append(time.perf_counter() - start)
+        print("  %-8s min %7.1fms  median %7.1fms  %8d bytes" %
+              (output_format, min(timings) * 1000,
+               statistics.median(timings) * 1000, len(contents)))
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Generates InspectorBackendCommands.ts from the protocol")
+    parser.add_argument("--input", default=READ_LOCATION)
+    parser.add_argument("--output", default=GENERATED_LOCATION)
+    parser.add_argument(
+        "--domain-cache",
+        help="Cache file for per-domain initializers. Domains whose "
+        "definition is unchanged since the previous run are not regenerated.")
+    parser.add_argument(
+        "--format",
+        choices=sorted(OUTPUT_FORMATS),
+        default="calls",
+        help="'calls' emits one registration call per command, event, enum "
+        "and type. 'table' emits the same registrations as compact, "
+        "deduplicated tables that are decoded at runtime. 'domains' emits "
+        "one registration function per domain and a manifest of the "
+        "domains' commands and events, so that domains can be registered "
+        "lazily via registerDomain().")
+    parser.add_argument(
+        "--benchmark",
+        type=int,
+        metavar="ITERATIONS",
+        help="Time the generation of every output format from --input and "
+        "print the results instead of writing --output.")
+    opts = parser.parse_args()
+
+    with open(opts.input, "r", encoding="utf-8") as input_file:
+        json_api = json.load(input_file)
+
+    if opts.benchmark:
+        benchmark(json_api, opts.benchmark)
+        return
+
+    domain_cache = DomainCache(
+        opts.domain_cache) if opts.domain_cache else None
+    contents = generate(json_api, domain_cache, opts.format)
+    if domain_cache is not None:
+        domain_cache.save()
+    write_if_changed(opts.output, contents)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,95 +2,168 @@
 // Use of this source code is governed by a BSD-style license that can be
 // found in the LICENSE file.
 
+/**
+ * Precompresses the DevTools resources that are packaged in the .pak.
+ *
+ * Every listed file is compressed with brotli into `<file>.compressed`, with
+ * the header grit expects. Files are compressed concurrently on the thread
+ * pool of node. With --cache_dir, compressed data is cached by the digest of
+ * the file, so that files that did not change are not compressed again;
+ * cached data is only used after checking that it decompresses to the file.
+ * `.compressed` files are only written when their content changed.
+ *
+ * --manifest writes a JSON object that maps every listed file to the file the
+ * grd should include for it: the `.compressed` file, or the file itself when
+ * compression does not make it smaller. generate_devtools_grd.py reads it
+ * with --compressed_manifest.
+ */
+
 import crypto from 'node:crypto';
 import fs from 'node:fs';
-import {pipeline, Readable} from 'node:stream';
+import path from 'node:path';
+import {promisify} from 'node:util';
 import zlib from 'node:zlib';
 
+import {writeIfChanged} from './ninja/write-if-changed.js';
+
 const {promises: pfs} = fs;
+const brotliCompress = promisify(zlib.brotliCompress);
+
+// BROTLI_CONST is prepended to brotli compressed data in order to
+// easily check if a resource has been brotli compressed.
+// It should be kept in sync with https://source.chromium.org/chromium/chromium/src/+/main:tools/grit/grit/constants.py;l=25;drc=84ef659584d3beb83b44cc168d02244dbd6b8f87.
+const BROTLI_CONST = Buffer.from([0x1e, 0x9b]);
+const HEADER_SIZE = BROTLI_CONST.length + 6;
+
+function parseArgs(argv) {
+  const args = {baseDir: '.'};
+  const names = {
+    '--file_list': 'fileList',
+    '--base_dir': 'baseDir',
+    '--manifest': 'manifest',
+    '--cache_dir': 'cacheDir',
+  };
+  for (let i = 2; i < argv.length; i += 2) {
+    const name = names[argv[i]];
+    if (!name || i + 1 >= argv.length) {
+      throw new Error(`Unexpected argument: ${argv[i]}`);
+    }
+    args[name] = argv[i + 1];
+  }
+  if (!args.fileList) {
+    throw new Error('--file_list is required');
+  }
+  return args;
+}
 
-function sha1(data) {
-  return crypto.createHash('sha1').update(data, 'binary').digest('hex');
+function header(sizeBytes) {
+  // This replicates the following compression logic:
+  // https://source.chromium.org/chromium/chromium/src/+/main:tools/grit/grit/node/base.py;l=649;drc=84ef659584d3beb83b44cc168d02244dbd6b8f87
+  // The length of the uncompressed data is appended to BROTLI_CONST,
+  // truncated to 6 bytes, little-endian.
+  const size = Buffer.alloc(8);
+  size.writeBigUInt64LE(BigInt(sizeBytes));
+  return Buffer.concat([BROTLI_CONST, size.subarray(0, 6)]);
 }
 
-async function readTextFile(filename) {
-  return pfs.readFile(filename, 'utf8');
+async function compress(sourceData) {
+  const compressed = await brotliCompress(sourceData, {
+    params: {
+      [zlib.constants.BROTLI_PARAM_QUALITY]: zlib.constants.BROTLI_MAX_QUALITY,
+      [zlib.constants.BROTLI_PARAM_SIZE_HINT]: sourceData.length,
+    },
+  });
+  return Buffer.concat([header(sourceData.length), compressed]);
 }
 
-async function fileExists(filename) {
+function decompressesTo(compressed, sourceData) {
+  if (!compressed.subarray(0, HEADER_SIZE).equals(header(sourceData.length))) {
+    return false;
+  }
   try {
-    await pfs.access(filename);
-    return true;
+    return zlib.brotliDecompressSync(compressed.subarray(HEADER_SIZE)).equals(sourceData);
   } catch {
     return false;
   }
 }
 
-async function writeTextFile(filename, data) {
-  return pfs.writeFile(filename, data, 'utf8');
+async function readIfExists(filename) {
+  try {
+    return await pfs.readFile(filename);
+  } catch {
+    return null;
+  }
 }
 
-async function readBinaryFile(filename) {
-  return pfs.readFile(filename);
+async function writeBytesIfChanged(filename, data) {
+  const existing = await readIfExists(filename);
+  if (existing && existing.equals(data)) {
+    return;
+  }
+  await pfs.writeFile(filename, data);
 }
 
-async function brotli(sourceData, compressedFilename) {
-  const sizeBytes = sourceData.length;
+/**
+ * Compressed data by the digest of the uncompressed data.
+ */
+class CompressionCache {
+  constructor(directory) {
+    this.directory = directory;
+  }
 
-  // This replicates the following compression logic:
-  // https://source.chromium.org/chromium/chromium/src/+/main:tools/grit/grit/node/base.py;l=649;drc=84ef659584d3beb83b44cc168d02244dbd6b8f87
-  const array = new BigUint64Array(1);
-  // The length of the uncompressed data as 8 bytes little-endian.
-  new DataView(array.buffer).setBigUint64(0, BigInt(sizeBytes), true);
-
-  // BROTLI_CONST is prepended to brotli compressed data in order to
-  // easily check if a resource has been brotli compressed.
-  // It should be kept in sync with https://source.chromium.org/chromium/chromium/src/+/main:tools/grit/grit/constants.py;l=25;drc=84ef659584d3beb83b44cc168d02244dbd6b8f87.
-  const brotliConst = new Uint8Array(2);
-  brotliConst[0] = 0x1e;
-  brotliConst[1] = 0x9b;
-
-  // The length of the uncompressed data is also appended to the start,
-  // truncated to 6 bytes, little-endian.
-  const sizeHeader = new Uint8Array(array.buffer).slice(0, 6).buffer;
-  const output = fs.createWriteStream(compressedFilename);
-  output.write(Buffer.from(brotliConst));
-  output.write(Buffer.from(sizeHeader));
-  return new Promise((resolve, reject) => {
-    pipeline(
-        Readable.from(sourceData),
-        zlib.createBrotliCompress(),
-        output,
-        err => {
-          return err ? reject(err) : resolve();
-        },
-    );
-  });
-}
+  path(sourceData) {
+    const digest = crypto.createHash('sha256').update(sourceData).digest('hex');
+    return path.join(this.directory, `${digest}.brotli`);
+  }
 
-async function compressFile(filename) {
-  const compressedFilename = filename + '.compressed';
-  const hashFilename = filename + '.hash';
+  async get(cachePath, sourceData) {
+    const compressed = await readIfExists(cachePath);
+    // Missing, truncated or corrupt entries are compressed again.
+    return compressed && decompressesTo(compressed, sourceData) ? compressed : null;
+  }
 
-  let prevHash = '';
-  if (await fileExists(hashFilename)) {
-    prevHash = await readTextFile(hashFilename);
+  async put(cachePath, compressed) {
+    try {
+      await pfs.mkdir(this.directory, {recursive: true});
+      const tempPath = `${cachePath}.${process.pid}.tmp`;
+      await pfs.writeFile(tempPath, compressed);
+      await pfs.rename(tempPath, cachePath);
+    } catch {
+      // The cache only saves time.
+    }
   }
+}
 
-  const sourceData = await readBinaryFile(filename);
-  const currHash = sha1(sourceData);
-  if (prevHash !== currHash || !(await fileExists(compressedFilename))) {
-    await writeTextFile(hashFilename, currHash);
-    await brotli(sourceData, compressedFilename);
+async function compressFile(baseDir, filename, cache) {
+  const sourceData = await pfs.readFile(path.join(baseDir, filename));
+  const cachePath = cache ? cache.path(sourceData) : null;
+  let compressed = cache ? await cache.get(cachePath, sourceData) : null;
+  if (!compressed) {
+    compressed = await compress(sourceData);
+    if (cache) {
+      await cache.put(cachePath, compressed);
+    }
   }
+  const compressedFilename = filename + '.compressed';
+  // Always written, as the build expects it.
+  await writeBytesIfChanged(path.join(baseDir, compressedFilename), compressed);
+  return compressed.length < sourceData.length ? compressedFilename : filename;
 }
 
 async function main(argv) {
-  const fileListPosition = argv.indexOf('--file_list');
-  const fileList = argv[fileListPosition + 1];
-  const fileListContents = await readTextFile(fileList);
-  const files = fileListContents.split(' ');
-  await Promise.all(files.map(filename => filename.trim()).map(compressFile));
+  const args = parseArgs(argv);
+  const fileListContents = await pfs.readFile(args.fileList, 'utf8');
+  const files = fileListContents.split(' ').map(filename => filename.trim()).filter(Boolean);
+  const cache = args.cacheDir ? new CompressionCache(args.cacheDir) : null;
+  const included = await Promise.all(files.map(filename => compressFile(args.baseDir, filename, cache)));
+  if (args.manifest) {
+    const includedByFile = new Map(files.map((filename, i) => [filename, included[i]]));
+    const manifest = {};
+    for (const filename of [...includedByFile.keys()].sort()) {
+      manifest[filename] = includedByFile.get(filename);
+    }
+    writeIfChanged(args.manifest, JSON.stringify(manifest, null, 1) + '\n');
+  }
 }
 
 main(process.argv).catch(err => {
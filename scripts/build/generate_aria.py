@@ -4,17 +4,13 @@
 # Use of this source code is governed by a BSD-style license that can be
 # found in the LICENSE file.
 
-import datetime
 import json
 import os
 import sys
 from os import path
 
-PYJSON5_DIR = os.path.join(os.path.dirname(__file__), '..', '..',
-                           'third_party', 'pyjson5', 'src')
-sys.path.append(PYJSON5_DIR)
-
-import json5  # pylint: disable=import-error
+import generated_files
+import json5_generator
 
 ROOT_DIRECTORY = path.join(path.dirname(__file__), '..', '..')
 GENERATED_LOCATION = path.join(ROOT_DIRECTORY, 'front_end', 'generated',
@@ -23,20 +19,24 @@ READ_LOCATION = path.join(ROOT_DIRECTORY, 'third_party', 'blink', 'renderer',
                           'core', 'html', 'aria_properties.json5')
 
 
+INPUTS = [READ_LOCATION]
+OUTPUTS = [GENERATED_LOCATION]
+
+
 def properties_from_file(file_name):
-    with open(os.path.abspath(file_name)) as json5_file:
-        properties = json5.loads(json5_file.read())
-        return properties
-
-
-ARIA_PROPERTIES = properties_from_file(READ_LOCATION)
-now = datetime.datetime.now()
-with open(GENERATED_LOCATION, "w+", newline='\n') as f:
-    f.write('// Copyright %d The Chromium Authors\n' % now.year)
-    f.write(
-        '// Use of this source code is governed by a BSD-style license that can be\n'
-    )
-    f.write('// found in the LICENSE file.\n')
-    f.write('\n')
-    f.write("export const config = %s;\n" %
-            json.dumps(ARIA_PROPERTIES, sort_keys=True, indent=1))
+    return json5_generator.load_json5(os.path.abspath(file_name))
+
+
+def generate():
+    aria_properties = properties_from_file(READ_LOCATION)
+    contents = [
+        generated_files.license_header(GENERATED_LOCATION),
+        '\n',
+        "export const config = %s;\n" %
+        json.dumps(aria_properties, sort_keys=True, indent=1),
+    ]
+    return {GENERATED_LOCATION: ''.join(contents)}
+
+
+if __name__ == '__main__':
+    sys.exit(json5_generator.main(generate))
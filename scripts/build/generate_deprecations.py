@@ -8,17 +8,12 @@
 # We do this in order to get tyep-saftey of the JSON's content vs the
 # deprecations defined in CDP.
 
-import datetime
 import json
-import os
 import sys
 from os import path
 
-PYJSON5_DIR = path.join(os.path.dirname(__file__), '..', '..', 'third_party',
-                        'pyjson5', 'src')
-sys.path.append(PYJSON5_DIR)
-
-import json5  # pylint: disable=import-error
+import generated_files
+import json5_generator
 
 ROOT_DIRECTORY = path.join(path.dirname(__file__), '..', '..')
 GENERATED_LOCATION = path.join(ROOT_DIRECTORY, 'front_end', 'generated',
@@ -26,6 +21,9 @@ GENERATED_LOCATION = path.join(ROOT_DIRECTORY, 'front_end', 'generated',
 READ_LOCATION = path.join(ROOT_DIRECTORY, 'third_party', 'blink', 'renderer',
                           'core', 'frame', 'deprecation', 'deprecation.json5')
 
+INPUTS = [READ_LOCATION]
+OUTPUTS = [GENERATED_LOCATION]
+
 # Deprecations in this list are exempt from code generation as they are not
 # dispatched to the DevTools.
 EXEMPTED_FROM_DEVTOOLS_GENERATION = {
@@ -33,8 +31,7 @@ EXEMPTED_FROM_DEVTOOLS_GENERATION = {
 
 
 def deprecations_from_file(file_name):
-    with open(file_name) as json5_file:
-        doc = json5.loads(json5_file.read())
+    doc = json5_generator.load_json5(file_name)
 
     # We turn the list of deprecations into two maps, both keyed by the deprecation name.
     # One contains the message + translation note.
@@ -66,33 +63,35 @@ def deprecations_from_file(file_name):
     return meta, ui_strings
 
 
-meta, ui_strings = deprecations_from_file(READ_LOCATION)
-now = datetime.datetime.now()
-with open(GENERATED_LOCATION, mode="w+") as f:
-    f.write("// Copyright %d The Chromium Authors\n" % now.year)
-    f.write(
-        "// Use of this source code is governed by a BSD-style license that can be\n"
-    )
-    f.write("// found in the LICENSE file.\n")
-    f.write("\n")
-    f.write("// This file is auto-generated, do not edit manually.\n")
-    f.write("// Re-generate with: npm run generate-protocol-resources\n")
-    f.write("\n")
-    f.write("export const UIStrings = {\n")
+def generate():
+    meta, ui_strings = deprecations_from_file(READ_LOCATION)
+    contents = []
+    contents.append(generated_files.license_header(GENERATED_LOCATION))
+    contents.append("\n")
+    contents.append("// This file is auto-generated, do not edit manually.\n")
+    contents.append(
+        "// Re-generate with: npm run generate-protocol-resources\n")
+    contents.append("\n")
+    contents.append("export const UIStrings = {\n")
     for name, ui_string in ui_strings.items():
         message = ui_string["message"]
         note = ui_string["note"]
-        f.write("  /**\n")
-        f.write("   * @description %s\n" % note)
-        f.write("   */\n")
-        f.write("  %s: %s,\n" % (name, json.dumps(message)))
-    f.write("} as const;\n")
-    f.write("\n")
-    f.write("export interface DeprecationDescriptor {\n")
-    f.write("  milestone?: number;\n")
-    f.write("  chromeStatusFeature?: number;\n")
-    f.write("}\n")
-    f.write("\n")
-    f.write(
+        contents.append("  /**\n")
+        contents.append("   * @description %s\n" % note)
+        contents.append("   */\n")
+        contents.append("  %s: %s,\n" % (name, json.dumps(message)))
+    contents.append("} as const;\n")
+    contents.append("\n")
+    contents.append("export interface DeprecationDescriptor {\n")
+    contents.append("  milestone?: number;\n")
+    contents.append("  chromeStatusFeature?: number;\n")
+    contents.append("}\n")
+    contents.append("\n")
+    contents.append(
         "export const DEPRECATIONS_METADATA: Partial<Record<string, DeprecationDescriptor>> = %s;\n"
         % json.dumps(meta, sort_keys=True, indent=2))
+    return {GENERATED_LOCATION: "".join(contents)}
+
+
+if __name__ == '__main__':
+    sys.exit(json5_generator.main(generate))
@@ -2,43 +2,69 @@
 # Copyright 2011 The Chromium Authors
 # Use of this source code is governed by a BSD-style license that can be
 # found in the LICENSE file.
-"""Creates a grd file for packaging the inspector files."""
+"""Creates a grd file for packaging the inspector files.
 
+The grd file is written as a stream of `<include>` elements, in the same
+format `xml.dom.minidom` used to produce, and only when its content changed,
+so that an unchanged file list does not repackage the resources.
+
+With --compressed_manifest, the files to include for the resources are read
+from the manifest written by compress_files.js, instead of including the
+`.compressed` file of every compressible resource as --compress does.
+
+With --dedupe, resources with identical content all include the file of the
+first of them, so that grit reads each payload once and stores it once in
+the .pak, with the other resource paths as aliases. --dedupe_report writes
+the bytes this saves and the largest resources as JSON.
+"""
+
+import hashlib
+import json
 import os
 import shlex
 import sys
-from xml.dom import minidom
+from xml.sax.saxutils import escape
+
+from generated_files import write_if_changed
 
 kDevToolsResourcePrefix = 'IDR_DEVTOOLS_'
-kGrdTemplate = '''<?xml version="1.0" encoding="UTF-8"?>
-<grit latest_public_release="0" current_release="1">
+kGrdHeader = '''<?xml version="1.0" encoding="UTF-8"?><grit latest_public_release="0" current_release="1">
   <outputs>
     <output filename="grit/devtools_resources.h" type="rc_header">
-      <emit emit_type='prepend'></emit>
+      <emit emit_type="prepend"/>
     </output>
-    <output filename="grit/devtools_resources_map.cc" type="resource_file_map_source" />
-    <output filename="grit/devtools_resources_map.h" type="resource_map_header" />
+    <output filename="grit/devtools_resources_map.cc" type="resource_file_map_source"/>
+    <output filename="grit/devtools_resources_map.h" type="resource_map_header"/>
 
-    <output filename="devtools_resources.pak" type="data_package" />
+    <output filename="devtools_resources.pak" type="data_package"/>
   </outputs>
   <release seq="1">
     <includes>
-      <include name="COMPRESSED_PROTOCOL_JSON" file="${protocol_file}" use_base_dir="false" compress="brotli" type="BINDATA" skip_in_resource_map = "true"/>
-    </includes>
+      <include name="COMPRESSED_PROTOCOL_JSON" file="${protocol_file}" use_base_dir="false" compress="brotli" type="BINDATA" skip_in_resource_map="true"/>
+    '''
+kGrdInclude = ('''
+      <include file="%s" name="%s" resource_path="%s" type="BINDATA" compress="false"/>''')
+kGrdFooter = '''</includes>
   </release>
-</grit>
-'''
+</grit>'''
+kCompressedExtensions = frozenset(
+    ['.css', '.html', '.js', '.svg', '.json', '.md'])
+kLargestResourcesInReport = 20
 
 
 class ParsedArgs:
 
-    def __init__(self, file_list, output_filename, compress):
+    def __init__(self, file_list, output_filename, compress,
+                 compressed_manifest, dedupe, dedupe_report):
         self.file_list = file_list
         file_list_file = open(file_list, 'r')
         file_list_contents = file_list_file.read()
         self.source_files = shlex.split(file_list_contents)
         self.output_filename = output_filename
         self.compress = compress
+        self.compressed_manifest = compressed_manifest
+        self.dedupe = dedupe
+        self.dedupe_report = dedupe_report
 
 
 def parse_args(argv):
@@ -46,51 +72,137 @@ def parse_args(argv):
     #   --file_list <input_file_list>
     #   --output <output_file>
     #   --compress
+    #   --compressed_manifest <manifest_file>
+    #   --dedupe
+    #   --dedupe_report <report_file>
     file_list_position = argv.index('--file_list')
     output_position = argv.index('--output')
     file_list = argv[file_list_position + 1]
     compress = argv.count('--compress') > 0
-    return ParsedArgs(file_list, argv[output_position + 1], compress)
+    compressed_manifest = None
+    if '--compressed_manifest' in argv:
+        compressed_manifest = argv[argv.index('--compressed_manifest') + 1]
+    dedupe_report = None
+    if '--dedupe_report' in argv:
+        dedupe_report = argv[argv.index('--dedupe_report') + 1]
+    dedupe = argv.count('--dedupe') > 0 or dedupe_report is not None
+    return ParsedArgs(file_list, argv[output_position + 1], compress,
+                      compressed_manifest, dedupe, dedupe_report)
+
+
+class ResourceDeduper:
+    """Maps resources with identical content to the file of the first of
+    them, by the digest of their files relative to `base_dir`."""
+
+    def __init__(self, base_dir):
+        self.base_dir = base_dir
+        self.canonical_files = {}
+        # The (resource path, file, digest, size) of every resource.
+        self.resources = []
+
+    def canonical_file(self, resource_path, filename):
+        digest = hashlib.sha256()
+        size = 0
+        with open(os.path.join(self.base_dir, filename), 'rb') as f:
+            while chunk := f.read(65536):
+                digest.update(chunk)
+                size += len(chunk)
+        digest = digest.hexdigest()
+        self.resources.append((resource_path, filename, digest, size))
+        return self.canonical_files.setdefault(digest, filename)
+
+    def report(self):
+        aliases = {}
+        for resource_path, filename, digest, size in self.resources:
+            if self.canonical_files[digest] != filename:
+                aliases.setdefault(digest, []).append(resource_path)
+        sizes = {digest: size for _, _, digest, size in self.resources}
+        total_bytes = sum(size for _, _, _, size in self.resources)
+        unique_bytes = sum(sizes.values())
+        largest = sorted(self.resources, key=lambda r: (-r[3], r[0]))
+        return {
+            'resources': len(self.resources),
+            'unique_payloads': len(self.canonical_files),
+            'total_bytes': total_bytes,
+            'unique_bytes': unique_bytes,
+            'bytes_saved': total_bytes - unique_bytes,
+            'duplicates': [{
+                'file': self.canonical_files[digest],
+                'aliases': resource_paths,
+                'bytes': sizes[digest],
+            } for digest, resource_paths in sorted(
+                aliases.items(),
+                key=lambda item: (-sizes[item[0]] * len(item[1]), item[0]))],
+            'largest': [{
+                'resource_path': resource_path,
+                'file': filename,
+                'bytes': size,
+            } for resource_path, filename, _, size in
+                        largest[:kLargestResourcesInReport]],
+        }
 
 
 def make_name_from_filename(filename):
     return (filename.replace('/', '_').replace('\\', '_').replace('-', '_').replace('.', '_')).upper()
 
 
-def add_file_to_grd(grd_doc, relative_filename, compress):
-    includes_node = grd_doc.getElementsByTagName('includes')[0]
-    includes_node.appendChild(grd_doc.createTextNode('\n      '))
+def quote_attribute(value):
+    return escape(value, {'"': '&quot;'})
 
+
+def make_include(relative_filename, compress, deduper=None):
+    """Returns the <include> of a resource. `compress` is a bool, or a dict
+    of the file to include for each resource."""
     ext = os.path.splitext(relative_filename)[1]
-    new_include_node = grd_doc.createElement('include')
-    if compress and ext in ['.css', '.html', '.js', '.svg', '.json', '.md']:
-        new_include_node.setAttribute('file',
-                                      relative_filename + '.compressed')
+    if isinstance(compress, dict):
+        filename = compress.get(relative_filename, relative_filename)
+    elif compress and ext in kCompressedExtensions:
+        filename = relative_filename + '.compressed'
     else:
-        new_include_node.setAttribute('file', relative_filename)
-
-    new_include_node.setAttribute('name', make_name_from_filename(relative_filename))
-    new_include_node.setAttribute('resource_path', relative_filename)
-    new_include_node.setAttribute('type', 'BINDATA')
-    new_include_node.setAttribute('compress', 'false')
-    includes_node.appendChild(new_include_node)
-
-
-def main(argv):
-    parsed_args = parse_args(argv[1:])
-
-    doc = minidom.parseString(kGrdTemplate)
-
+        filename = relative_filename
+    if deduper is not None:
+        filename = deduper.canonical_file(relative_filename, filename)
+    return kGrdInclude % (quote_attribute(filename),
+                          quote_attribute(
+                              make_name_from_filename(relative_filename)),
+                          quote_attribute(relative_filename))
+
+
+def generate_grd(source_files, compress, deduper=None):
+    """Yields the pieces of the grd file that includes `source_files`."""
+    yield kGrdHeader
     written_filenames = set()
-    for filename in parsed_args.source_files:
+    for filename in source_files:
         # Avoid writing duplicate relative filenames.
         if filename in written_filenames:
             raise Exception("Duplicate file detected: %s" % filename)
         written_filenames.add(filename)
-        add_file_to_grd(doc, filename, parsed_args.compress)
+        yield make_include(filename, compress, deduper)
+    yield kGrdFooter
+
+
+def main(argv):
+    parsed_args = parse_args(argv[1:])
 
-    with open(parsed_args.output_filename, 'wb') as output_file:
-        output_file.write(doc.toxml(encoding='UTF-8'))
+    compress = parsed_args.compress
+    if parsed_args.compressed_manifest:
+        with open(parsed_args.compressed_manifest, 'r',
+                  encoding='utf-8') as manifest_file:
+            compress = json.load(manifest_file)
+
+    deduper = None
+    if parsed_args.dedupe:
+        # The files of the grd file are relative to it.
+        deduper = ResourceDeduper(
+            os.path.dirname(os.path.abspath(parsed_args.output_filename)))
+
+    write_if_changed(
+        parsed_args.output_filename, ''.join(
+            generate_grd(parsed_args.source_files, compress, deduper)))
+
+    if parsed_args.dedupe_report:
+        write_if_changed(parsed_args.dedupe_report,
+                         json.dumps(deduper.report(), indent=2) + '\n')
 
 
 if __name__ == '__main__':
@@ -3,17 +3,12 @@
 # Use of this source code is governed by a BSD-style license that can be
 # found in the LICENSE file.
 
-import datetime
 import json
-import os
 import sys
 from os import path
 
-PYJSON5_DIR = os.path.join(os.path.dirname(__file__), '..', '..',
-                           'third_party', 'pyjson5', 'src')
-sys.path.append(PYJSON5_DIR)
-
-import json5  # pylint: disable=import-error
+import generated_files
+import json5_generator
 
 ROOT_DIRECTORY = path.join(path.dirname(__file__), '..', '..')
 GENERATED_LOCATION = path.join(ROOT_DIRECTORY, 'front_end', 'generated',
@@ -24,21 +19,46 @@ RUNTIME_FLAGS_READ_LOCATION = path.join(ROOT_DIRECTORY, 'third_party', 'blink',
                                         'renderer', 'platform',
                                         'runtime_enabled_features.json5')
 
+INPUTS = [READ_LOCATION, RUNTIME_FLAGS_READ_LOCATION]
+OUTPUTS = [GENERATED_LOCATION]
+
+
+REQUIRED_KEYS = frozenset([
+    "name", "longhands", "svg", "inherited", "keywords", "is_property",
+    "is_descriptor", "runtime_flag", "runtime_flag_status", "devtools_keywords"
+])
+
 
 def _keep_only_required_keys(entry):
-    for key in list(entry.keys()):
-        if key not in ("name", "longhands", "svg", "inherited", "keywords",
-                       "is_property", "is_descriptor", "runtime_flag",
-                       "runtime_flag_status", "devtools_keywords"):
-            del entry[key]
-    return entry
+    return {key: value for key, value in entry.items() if key in REQUIRED_KEYS}
+
+
+def _longhands_by_shorthand(properties_by_name, affected_by_all):
+    """Maps every shorthand to its longhands that are supported properties.
+
+    `all` has no explicit longhands and expands to every property that is
+    affected by it.
+    """
+    longhands_by_shorthand = {}
+    for name, property in properties_by_name.items():
+        longhands = property.get("longhands")
+        if not longhands:
+            if name != 'all':
+                continue
+            longhands = sorted(affected_by_all)
+        if type(longhands) is str:
+            longhands = longhands.split(";")
+        longhands_by_shorthand[name] = [
+            longhand for longhand in longhands
+            if longhand in properties_by_name
+        ]
+    return longhands_by_shorthand
 
 
 def properties_from_file(file_name):
-    with open(file_name) as json5_file:
-        doc = json5.loads(json5_file.read())
-    with open(RUNTIME_FLAGS_READ_LOCATION, 'r') as json5_file:
-        runtime_features_data = json5.loads(json5_file.read())
+    doc = json5_generator.load_json5(file_name)
+    runtime_features_data = json5_generator.load_json5(
+        RUNTIME_FLAGS_READ_LOCATION)
 
     # Create a map for easy lookup of feature status
     runtime_features_map = {
@@ -64,11 +84,12 @@ def properties_from_file(file_name):
         if "affected_by_all" not in entry or entry["affected_by_all"]:
             if not 'longhands' in entry:
                 affected_by_all.add(entry['name'])
+        entry = _keep_only_required_keys(entry)
         if "runtime_flag" in entry and entry[
                 "runtime_flag"] in runtime_features_map:
             status = runtime_features_map[entry["runtime_flag"]]
             entry["runtime_flag_status"] = status
-        properties.append(_keep_only_required_keys(entry))
+        properties.append(entry)
         property_names[entry["name"]] = entry
         # If devtools_keywords is specified, it is given precedence over keywords.
         # This is because there might be values in keywords which are actually not
@@ -89,50 +110,102 @@ def properties_from_file(file_name):
     properties.sort(key=lambda entry: entry["name"])
     aliases_for.sort(key=lambda entry: entry[0])
 
+    # Longhands never have longhands themselves, so whether they are inherited
+    # can be determined up front.
+    inherited = {
+        name
+        for name, property in property_names.items()
+        if property.get("inherited")
+    }
+
     # Filter out unsupported longhands.
-    for property in properties:
-        longhands = property.get("longhands")
-        if not longhands:
-            if property['name'] != 'all':
-                continue
-            longhands = list(sorted(affected_by_all))
-        if type(longhands) is str:
-            longhands = longhands.split(";")
-        longhands = [
-            longhand for longhand in longhands if longhand in property_names
-        ]
+    longhands_by_shorthand = _longhands_by_shorthand(property_names,
+                                                     affected_by_all)
+    for name, longhands in longhands_by_shorthand.items():
+        property = property_names[name]
         if not longhands:
             del property["longhands"]
         else:
             property["longhands"] = longhands
-        all_inherited = True
-        for longhand in longhands:
-            longhand_property = property_names[longhand]
-            all_inherited = all_inherited and (
-                "inherited"
-                in longhand_property) and longhand_property["inherited"]
-        if all_inherited:
+        if all(longhand in inherited for longhand in longhands):
             property["inherited"] = True
 
     return properties, property_values, aliases_for
 
 
-properties, property_values, aliases_for = properties_from_file(READ_LOCATION)
-now = datetime.datetime.now()
-with open(GENERATED_LOCATION, "w+", newline='\n') as f:
-    f.write('// Copyright %d The Chromium Authors\n' % now.year)
-    f.write(
-        '// Use of this source code is governed by a BSD-style license that can be\n'
-    )
-    f.write('// found in the LICENSE file.\n')
-    f.write('\n')
-    f.write(
-        '/* eslint-disable @stylistic/quotes, @stylistic/quote-props, @stylistic/comma-dangle */\n'
-    )
-    f.write("export const generatedProperties = %s;\n" %
-            json.dumps(properties, sort_keys=True, indent=1))
-    # sort keys to ensure entries are generated in a deterministic way to avoid inconsistencies across different OS
-    f.write("export const generatedPropertyValues = %s;\n" %
-            json.dumps(property_values, sort_keys=True, indent=1))
-    f.write("export const generatedAliasesFor = new Map(%s);\n" %
-            json.dumps(aliases_for, sort_keys=True, indent=1))
+# Bits of the flags in generatedPropertyTable, see PropertyFlag in
+# front_end/core/sdk/CSSMetadata.ts.
+INHERITED_FLAG = 1
+SVG_FLAG = 2
+
+CSS_WIDE_KEYWORDS = frozenset(
+    ['inherit', 'initial', 'revert', 'revert-layer', 'revert-rule', 'unset'])
+
+
+def _is_listed(property):
+    """Whether the frontend lists the property: it is not only a descriptor,
+    and its runtime flag, if any, is stable."""
+    if ("is_descriptor" in property and "is_property" in property
+            and property["is_descriptor"] and not property["is_property"]):
+        return False
+    status = property.get("runtime_flag_status")
+    return not status or status == "stable"
+
+
+def property_table(properties):
+    """Returns the lookup tables that CSSMetadata reads instead of building
+    them from `generatedProperties` at startup.
+
+    `flags` maps every listed property to its INHERITED_FLAG and SVG_FLAG
+    bits, in the order the frontend lists properties: CSS-wide keywords and
+    then -webkit- prefixed names last. `longhands` maps every listed shorthand
+    to its longhands, and `shorthands` every longhand to the listed
+    shorthands that include it.
+    """
+    listed = [property for property in properties if _is_listed(property)]
+    flags = {}
+    for property in sorted(
+            listed,
+            key=lambda property: (property["name"] in CSS_WIDE_KEYWORDS,
+                                  property["name"].startswith("-webkit-"),
+                                  property["name"])):
+        flags[property["name"]] = (
+            (INHERITED_FLAG if property.get("inherited") else 0) |
+            (SVG_FLAG if property.get("svg") else 0))
+    longhands = {}
+    shorthands = {}
+    for property in listed:
+        if not property.get("longhands"):
+            continue
+        longhands[property["name"]] = property["longhands"]
+        for longhand in property["longhands"]:
+            shorthands.setdefault(longhand, []).append(property["name"])
+    return {"flags": flags, "longhands": longhands, "shorthands": shorthands}
+
+
+def generate():
+    properties, property_values, aliases_for = properties_from_file(
+        READ_LOCATION)
+    contents = [
+        generated_files.license_header(GENERATED_LOCATION),
+        '\n',
+        '/* eslint-disable @stylistic/quotes, @stylistic/quote-props, @stylistic/comma-dangle */\n',
+        "export const generatedProperties = %s;\n" %
+        json.dumps(properties, sort_keys=True, indent=1),
+        # sort keys to ensure entries are generated in a deterministic way to avoid inconsistencies across different OS
+        "export const generatedPropertyValues = %s;\n" %
+        json.dumps(property_values, sort_keys=True, indent=1),
+        "export const generatedAliasesFor = new Map(%s);\n" %
+        json.dumps(aliases_for, sort_keys=True, indent=1),
+        # Not sorted, as the order of `flags` is the order of the properties.
+        "export const generatedPropertyTable: {\n"
+        " flags: Record<string, number>,\n"
+        " longhands: Record<string, string[]>,\n"
+        " shorthands: Record<string, string[]>,\n"
+        "} = %s;\n" % json.dumps(property_table(properties), indent=1),
+    ]
+    return {GENERATED_LOCATION: ''.join(contents)}
+
+
+if __name__ == '__main__':
+    sys.exit(json5_generator.main(generate))
@@ -0,0 +1,95 @@
+# Copyright 2026 The Chromium Authors
+# Use of this source code is governed by a BSD-style license that can be
+# found in the LICENSE file.
+"""Output layer shared by the scripts that write `front_end/generated` files.
+
+Generated files are checked in and consumed by Ninja, so regenerating them
+from unchanged inputs must not touch them at all:
+
+- `write_if_changed()` only replaces a file when its content differs, and does
+  so atomically, so that an unchanged output keeps its mtime and an
+  interrupted generator never leaves a truncated file behind.
+- `has_contents()` tells whether a file already has the given content, so
+  that checks can compare regenerated outputs with the checked-in ones.
+- `copyright_year()` keeps the year of the existing copyright header, so that
+  the header does not change just because the file was regenerated in a new
+  year.
+"""
+
+import datetime
+import os
+import re
+import tempfile
+
+from os import path
+
+_COPYRIGHT_YEAR_PATTERN = re.compile(r'Copyright (\d{4}) ')
+
+# os.umask() can only be read by setting it, which is done once, before any
+# threads write files.
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def has_contents(file_name, contents):
+    """Returns whether the file exists and has exactly `contents`."""
+    try:
+        with open(file_name, 'r', encoding='utf-8', newline='') as old_file:
+            return old_file.read() == contents
+    except (OSError, UnicodeDecodeError):
+        return False
+
+
+def _file_mode(file_name):
+    """Returns the mode of an existing file, or the mode a new file gets."""
+    try:
+        return os.stat(file_name).st_mode & 0o7777
+    except OSError:
+        return 0o666 & ~_UMASK
+
+
+def _replace(file_name, contents, mode, **kwargs):
+    directory = path.dirname(path.abspath(file_name))
+    os.makedirs(directory, exist_ok=True)
+    fd, temp_name = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, mode, **kwargs) as new_file:
+            new_file.write(contents)
+        # mkstemp() creates files that only their owner can read.
+        os.chmod(temp_name, _file_mode(file_name))
+        os.replace(temp_name, file_name)
+    except BaseException:
+        os.unlink(temp_name)
+        raise
+
+
+def write_if_changed(file_name, contents):
+    """Atomically writes `contents`, unless the file already has them.
+
+    Returns True if the file was written.
+    """
+    if has_contents(file_name, contents):
+        return False
+    _replace(file_name, contents, 'w', encoding='utf-8', newline='\n')
+    return True
+
+
+def copyright_year(file_name):
+    """Returns the year of the copyright header of an existing output, or the
+    current year for a new one."""
+    try:
+        with open(file_name, 'r', encoding='utf-8') as existing_file:
+            match = _COPYRIGHT_YEAR_PATTERN.search(existing_file.readline())
+        if match:
+            return int(match.group(1))
+    except (OSError, UnicodeDecodeError):
+        pass
+    return datetime.date.today().year
+
+
+def license_header(file_name):
+    """Returns the Chromium license header for a generated TypeScript file."""
+    return ('// Copyright %d The Chromium Authors\n'
+            '// Use of this source code is governed by a BSD-style license '
+            'that can be\n'
+            '// found in the LICENSE file.\n' % copyright_year(file_name))
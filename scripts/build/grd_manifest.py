@@ -0,0 +1,44 @@
+# Copyright 2026 The Chromium Authors
+# Use of this source code is governed by a BSD-style license that can be
+# found in the LICENSE file.
+"""Shared view of the GRD file lists that the assert_* scripts check.
+
+`load_manifest()` parses each JSON list once per process, so that the checks
+run together by assert_grd_files.py share it, and indexes it as a
+`GrdManifest`: the set of files and the set of the `front_end/third_party`
+directories that they are in. The checks are then set differences.
+"""
+
+import json
+
+THIRD_PARTY_PREFIX = 'front_end/third_party/'
+
+_manifests = {}
+
+
+class GrdManifest:
+
+    def __init__(self, files):
+        self.files = frozenset(files)
+        self.third_party_directories = frozenset(
+            file_name[len(THIRD_PARTY_PREFIX):].partition('/')[0]
+            for file_name in self.files
+            if file_name.startswith(THIRD_PARTY_PREFIX))
+
+
+def load_manifest(file_name):
+    """Returns the GrdManifest of the JSON list in `file_name`."""
+    if file_name not in _manifests:
+        with open(file_name, 'r', encoding='utf-8') as f:
+            _manifests[file_name] = GrdManifest(json.load(f))
+    return _manifests[file_name]
+
+
+def load_list(file_name):
+    """Returns the JSON list in `file_name` as a set."""
+    return load_manifest(file_name).files
+
+
+def write_stamp(stamp_file):
+    with open(stamp_file, 'w', encoding="utf8") as fp:
+        fp.write("")
@@ -0,0 +1,245 @@
+# Copyright 2026 The Chromium Authors
+# Use of this source code is governed by a BSD-style license that can be
+# found in the LICENSE file.
+"""Shared pipeline for the scripts that generate `front_end/generated` files
+from Blink `.json5` files.
+
+Every generator script declares its inputs and outputs and computes the
+contents of its outputs without writing them:
+
+  INPUTS = [<path>, ...]
+  OUTPUTS = [<path>, ...]
+
+  def generate():
+      return {<output path>: <contents>, ...}
+
+  if __name__ == '__main__':
+      sys.exit(json5_generator.main(generate))
+
+`run_generators()` builds the graph between generators from the declared
+inputs and outputs. Generators without dependencies between them run
+concurrently in a process pool. Generators whose inputs (including the
+generator script itself and the json5 library) and outputs are unchanged
+since their last run are skipped, and outputs are only written when their
+content changed, so unchanged outputs keep their mtime.
+
+`stale_outputs()` runs generators without writing anything and returns the
+outputs whose checked-in content differs from the generated one.
+
+Generators read their `.json5` inputs with `load_json5()`, which keeps the
+parsed values in an on-disk cache, so unchanged inputs are not parsed again.
+"""
+
+import concurrent.futures
+import hashlib
+import importlib.util
+import json
+import sys
+
+from os import path
+
+from generated_files import has_contents, write_if_changed
+
+_CURRENT_DIR = path.dirname(path.abspath(__file__))
+ROOT_DIRECTORY = path.normpath(path.join(_CURRENT_DIR, '..', '..'))
+PYJSON5_DIR = path.join(ROOT_DIRECTORY, 'third_party', 'pyjson5', 'src')
+if PYJSON5_DIR not in sys.path:
+    sys.path.append(PYJSON5_DIR)
+SCRIPTS_DIR = path.join(ROOT_DIRECTORY, 'scripts')
+if SCRIPTS_DIR not in sys.path:
+    sys.path.append(SCRIPTS_DIR)
+
+import devtools_paths
+import json5  # pylint: disable=import-error
+
+# Files every generator implicitly depends on.
+COMMON_INPUTS = [
+    path.abspath(__file__),
+    path.join(_CURRENT_DIR, 'generated_files.py'),
+    path.join(PYJSON5_DIR, 'json5', 'cache.py'),
+    path.join(PYJSON5_DIR, 'json5', 'fast_parser.py'),
+    path.join(PYJSON5_DIR, 'json5', 'lib.py'),
+    path.join(PYJSON5_DIR, 'json5', 'parser.py'),
+]
+
+# Which generators are skipped, and the parsed values that feed checked-in
+# files, must not come from a shared directory, so both are private to the
+# checkout. Marshal data must only be loaded from trusted directories.
+DEFAULT_STATE_FILE = devtools_paths.checkout_cache_path(
+    'json5_generators.json')
+DEFAULT_CACHE_DIRECTORY = devtools_paths.checkout_cache_path('json5_cache')
+
+_parse_caches = {}
+
+
+def load_json5(file_name, cache_directory=DEFAULT_CACHE_DIRECTORY):
+    """Parses a `.json5` input, reusing the value parsed by an earlier run if
+    the file is unchanged. Pass None as `cache_directory` to always parse."""
+    if cache_directory is None:
+        with open(file_name, 'r', encoding='utf-8') as f:
+            return json5.loads(f.read())
+    if cache_directory not in _parse_caches:
+        _parse_caches[cache_directory] = json5.ParseCache(cache_directory)
+    return _parse_caches[cache_directory].load_file(file_name)
+
+
+def load_generator(script_path):
+    """Imports a generator script as a module."""
+    script_path = path.abspath(script_path)
+    name = path.splitext(path.basename(script_path))[0]
+    spec = importlib.util.spec_from_file_location(name, script_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def file_digest(file_name):
+    h = hashlib.sha1()
+    try:
+        with open(file_name, 'rb') as f:
+            while chunk := f.read(65536):
+                h.update(chunk)
+    except OSError:
+        return None
+    return h.hexdigest()
+
+
+def inputs_digest(script_path, inputs):
+    h = hashlib.sha1()
+    for input_path in [path.abspath(script_path)] + COMMON_INPUTS + inputs:
+        h.update(path.abspath(input_path).encode('utf-8'))
+        h.update(b'\0')
+        h.update((file_digest(input_path) or '-').encode('utf-8'))
+        h.update(b'\0')
+    return h.hexdigest()
+
+
+def _generate(script_path):
+    """Runs a generator, possibly in a worker process."""
+    return load_generator(script_path).generate()
+
+
+def _dependency_waves(generators):
+    """Groups generators into waves, where each wave only depends on the
+    outputs of earlier waves."""
+    producers = {}
+    for script_path, (_, outputs) in generators.items():
+        for output in outputs:
+            producers[path.abspath(output)] = script_path
+    dependencies = {}
+    for script_path, (inputs, _) in generators.items():
+        dependencies[script_path] = {
+            producers[path.abspath(input_path)]
+            for input_path in inputs
+            if producers.get(path.abspath(input_path), script_path) !=
+            script_path
+        }
+
+    done = set()
+    waves = []
+    while len(done) < len(generators):
+        wave = [
+            script_path for script_path in generators
+            if script_path not in done and dependencies[script_path] <= done
+        ]
+        if not wave:
+            raise ValueError('Cyclic dependency between generators: %s' %
+                             ', '.join(sorted(set(generators) - done)))
+        done.update(wave)
+        waves.append(wave)
+    return waves
+
+
+def _load_state(state_file):
+    try:
+        with open(state_file, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+        return state if isinstance(state, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def _is_up_to_date(state, digest, outputs):
+    if not isinstance(state, dict) or state.get('inputs') != digest:
+        return False
+    recorded = state.get('outputs', {})
+    return all(
+        recorded.get(path.abspath(output)) == file_digest(output)
+        for output in outputs)
+
+
+def run_generators(script_paths, jobs=None, state_file=DEFAULT_STATE_FILE):
+    """Runs the generator scripts, skipping up-to-date ones.
+
+    Returns a dict of script path to one of 'skipped', 'unchanged' or
+    'updated'.
+    """
+    generators = {}
+    for script_path in script_paths:
+        module = load_generator(script_path)
+        generators[path.abspath(script_path)] = (list(module.INPUTS),
+                                                 list(module.OUTPUTS))
+
+    state = _load_state(state_file) if state_file else {}
+    results = {}
+    with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as pool:
+        for wave in _dependency_waves(generators):
+            pending = {}
+            for script_path in wave:
+                inputs, outputs = generators[script_path]
+                digest = inputs_digest(script_path, inputs)
+                if _is_up_to_date(state.get(script_path), digest, outputs):
+                    results[script_path] = 'skipped'
+                    continue
+                pending[script_path] = (digest,
+                                        pool.submit(_generate, script_path))
+            for script_path, (digest, future) in pending.items():
+                written = [
+                    write_if_changed(output, contents)
+                    for output, contents in future.result().items()
+                ]
+                results[script_path] = 'updated' if any(
+                    written) else 'unchanged'
+                state[script_path] = {
+                    'inputs': digest,
+                    'outputs': {
+                        path.abspath(output): file_digest(output)
+                        for output in generators[script_path][1]
+                    },
+                }
+
+    if state_file:
+        try:
+            write_if_changed(state_file, json.dumps(state, indent=1))
+        except OSError:
+            # The state only allows skipping generators.
+            pass
+    return results
+
+
+def stale_outputs(script_paths, jobs=None):
+    """Runs the generator scripts without writing their outputs, and returns
+    the sorted paths of the outputs that differ from the generated content.
+
+    Generators see the checked-in outputs of the other generators, so an
+    output is only reported as stale by the generator that produces it.
+    """
+    stale = []
+    with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = [
+            pool.submit(_generate, path.abspath(script_path))
+            for script_path in script_paths
+        ]
+        for future in futures:
+            stale.extend(
+                path.abspath(output)
+                for output, contents in future.result().items()
+                if not has_contents(output, contents))
+    return sorted(stale)
+
+
+def main(generate):
+    """Entry point of the individual generator scripts. Always regenerates."""
+    for output, contents in generate().items():
+        write_if_changed(output, contents)
+    return 0
@@ -1,24 +1,65 @@
 # Copyright 2026 The Chromium Authors
 # Use of this source code is governed by a BSD-style license that can be
 # found in the LICENSE file.
-"""Runs an arbitrary command and preserves modification times for unchanged outputs.
+"""Runs a command and preserves modification times of unchanged outputs.
 
 Compilers (such as `tsc`) often rewrite output files unconditionally, updating
 their modification timestamps (`mtime`) even when their contents have not
 changed. In Ninja, this triggers cascading rebuilds of downstream targets.
 
 This script acts as a transparent wrapper:
-1. It records SHA1 hashes and modification timestamps (`mtime`) of existing
-   tracked outputs before invoking the command.
+1. It records the size, SHA1 hash and modification timestamp (`mtime`) of
+   existing tracked outputs before invoking the command.
 2. It executes the specified compiler command.
-3. If the command succeeds, it compares the SHA1 hash of each tracked output.
-   If the content has not changed, the original `mtime` is restored.
+3. If the command succeeds, it compares each tracked output against its
+   snapshot. Outputs whose size changed are skipped without being read again;
+   for the others, if the SHA1 hash is unchanged the original `mtime` is
+   restored.
 
 When paired with Ninja's `restat = 1` action rule, unchanged outputs prevent
 unnecessary downstream rebuilds, significantly accelerating incremental builds.
 
 Usage:
-  run_with_restat.py [<tracked_output>...] -- <command> [<command_args>...]
+  run_with_restat.py [<option>...] [<tracked_output>...] --
+      <command> [<command_args>...]
+
+Options (must precede the tracked outputs):
+  --digest-cache=<dir>  Reuse content digests across invocations, see below.
+  --hash=<algorithm>    Digest algorithm: 'sha1' (default), 'blake2b' or
+                        'crc32'. 'crc32' is a fast non-cryptographic checksum;
+                        since sizes are compared as well, it is adequate for
+                        detecting that a compiler rewrote identical content.
+  --parallel-threshold=<count>
+                        Stat and hash outputs on a thread pool when at least
+                        this many are tracked (default: 32).
+  --mmap-threshold=<bytes>
+                        Hash outputs of at least this size through a memory
+                        map instead of a read loop (default: 4 MiB).
+  --stats[=<bool>]      Report the number of tracked files, bytes hashed,
+                        digest cache hits, restored timestamps and time spent
+                        on stderr.
+
+Digest cache:
+  Hashing every tracked output before running the command is usually wasted
+  work, since the outputs are unchanged since the previous invocation. With
+  `--digest-cache`, each action stores the digests of its outputs in
+  `<dir>/<key>.json`, where `<key>` is the SHA1 of the tracked output list.
+  A digest is reused as long as the file's (path, inode, size, mtime_ns) is
+  unchanged. The file format is:
+
+    {
+      "version": 1,
+      "hash": "<algorithm>",
+      "written_ns": <time the cache was written>,
+      "entries": {"<path>": [<inode>, <size>, <mtime_ns>, "<hex digest>"]}
+    }
+
+  Entries whose mtime is within RACY_WINDOW_NS of `written_ns`, or of the
+  start of the current invocation, are ignored since the file may have been
+  rewritten within the same timestamp granularity. A cache that can't be
+  read or parsed, or that has a different version or algorithm, is
+  discarded. Caches are written atomically, so an interrupted build never
+  leaves a truncated cache behind.
 
 Any argument starting with '@' (e.g. '@path/to/response_file.rsp') is expanded
 in-place, allowing all tracked outputs, the '--' separator, and compiler
@@ -26,11 +67,46 @@ arguments to be passed inside a single GN/Ninja response file:
   run_with_restat.py @{{response_file_name}}
 """
 
+import collections
+import concurrent.futures
 import hashlib
+import json
+import mmap
 import os
 import shlex
 import subprocess
 import sys
+import tempfile
+import threading
+import time
+import zlib
+
+DIGEST_CACHE_VERSION = 1
+# Two seconds covers the coarsest mtime granularity of the file systems we
+# build on.
+RACY_WINDOW_NS = 2 * 1000 * 1000 * 1000
+DEFAULT_PARALLEL_THRESHOLD = 32
+DEFAULT_MMAP_THRESHOLD = 4 * 1024 * 1024
+
+
+class _Crc32:
+    """hashlib-style wrapper around zlib.crc32."""
+
+    def __init__(self):
+        self._value = 0
+
+    def update(self, data):
+        self._value = zlib.crc32(data, self._value)
+
+    def digest(self):
+        return self._value.to_bytes(4, 'big')
+
+
+HASH_ALGORITHMS = {
+    'sha1': hashlib.sha1,
+    'blake2b': lambda: hashlib.blake2b(digest_size=16),
+    'crc32': _Crc32,
+}
 
 
 def expand_response_files(args, visited=None):
@@ -54,8 +130,18 @@ def expand_response_files(args, visited=None):
     return expanded
 
 
-def hash_file(path):
-    h = hashlib.sha1()
+def parse_options(args):
+    """Splits the leading `--name=value` and `--flag` options off `args`."""
+    options = {}
+    while args and args[0].startswith('--'):
+        name, _, value = args[0][2:].partition('=')
+        options[name] = value if '=' in args[0] else True
+        args = args[1:]
+    return options, args
+
+
+def hash_file(path, algorithm='sha1'):
+    h = HASH_ALGORITHMS[algorithm]()
     try:
         with open(path, 'rb') as f:
             while chunk := f.read(65536):
@@ -65,35 +151,313 @@ def hash_file(path):
         return None
 
 
+def hash_file_mmap(path, algorithm='sha1'):
+    """Like hash_file, but hashes the whole file in one call via mmap."""
+    h = HASH_ALGORITHMS[algorithm]()
+    try:
+        with open(path, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                h.update(m)
+        return h.digest()
+    except (OSError, ValueError):
+        # Empty files can't be mapped.
+        return hash_file(path, algorithm)
+
+
+# Snapshot of a tracked output. Only the digest of the content is kept, so
+# snapshotting large outputs (e.g. source maps) costs a streaming read, not
+# a copy of the file in memory.
+FileState = collections.namedtuple('FileState',
+                                   ['atime_ns', 'mtime_ns', 'size', 'digest'])
+
+
+class DigestCache:
+    """Content digests of files from a previous invocation, see module docs."""
+
+    def __init__(self, location, algorithm):
+        self.location = location
+        self.algorithm = algorithm
+        # Files modified around or after this point may be rewritten within
+        # the same mtime granularity, so their digests are never reused.
+        self._trusted_before_ns = time.time_ns() - RACY_WINDOW_NS
+        self._entries = {}
+        if location is not None:
+            self._entries = self._load()
+
+    def _load(self):
+        try:
+            with open(self.location, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if (data['version'] != DIGEST_CACHE_VERSION
+                    or data['hash'] != self.algorithm):
+                return {}
+            fresh_before_ns = int(data['written_ns']) - RACY_WINDOW_NS
+            entries = {}
+            for path, entry in data['entries'].items():
+                inode, size, mtime_ns, digest = entry
+                if mtime_ns < fresh_before_ns:
+                    entries[path] = (inode, size, mtime_ns,
+                                     bytes.fromhex(digest))
+            return entries
+        except (OSError, ValueError, KeyError, TypeError):
+            return {}
+
+    def lookup(self, path, st):
+        entry = self._entries.get(path)
+        if entry is None or st.st_mtime_ns >= self._trusted_before_ns:
+            return None
+        if entry[:3] != (st.st_ino, st.st_size, st.st_mtime_ns):
+            return None
+        return entry[3]
+
+    def update(self, path, st, digest):
+        self._entries[path] = (st.st_ino, st.st_size, st.st_mtime_ns, digest)
+
+    def discard(self, path):
+        self._entries.pop(path, None)
+
+    def save(self):
+        if self.location is None:
+            return
+        data = {
+            'version': DIGEST_CACHE_VERSION,
+            'hash': self.algorithm,
+            'written_ns': time.time_ns(),
+            'entries': {
+                path: [inode, size, mtime_ns, digest.hex()]
+                for path, (inode, size, mtime_ns,
+                           digest) in self._entries.items()
+            },
+        }
+        directory = os.path.dirname(self.location)
+        try:
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, separators=(',', ':'))
+                os.replace(tmp_path, self.location)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError:
+            # The cache is only an optimization.
+            pass
+
+
+def digest_cache_location(cache_dir, tracked_files):
+    key = hashlib.sha1('\n'.join(tracked_files).encode('utf-8')).hexdigest()
+    return os.path.join(cache_dir, key + '.json')
+
+
+class RestatStats:
+    """Counters reported by `--stats`. Updated from the hashing threads."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.files_tracked = 0
+        self.files_hashed = 0
+        self.bytes_hashed = 0
+        self.cache_hits = 0
+        self.timestamps_restored = 0
+        self.hash_seconds = 0.0
+
+    def record_hash(self, size, seconds):
+        with self._lock:
+            self.files_hashed += 1
+            self.bytes_hashed += size
+            self.hash_seconds += seconds
+
+    def record_cache_hit(self):
+        with self._lock:
+            self.cache_hits += 1
+
+    def report(self, total_seconds, file=sys.stderr):
+        print(('run_with_restat: %d files tracked, %d hashed (%d bytes, '
+               '%.3fs), %d digest cache hits, %d timestamps restored, '
+               '%.3fs total') %
+              (self.files_tracked, self.files_hashed, self.bytes_hashed,
+               self.hash_seconds, self.cache_hits, self.timestamps_restored,
+               total_seconds),
+              file=file)
+
+
+class OutputHasher:
+    """Computes content digests of tracked outputs.
+
+    Digests are looked up in the optional DigestCache first. Files of at
+    least `mmap_threshold` bytes are hashed through a memory map rather than
+    a read loop.
+    """
+
+    def __init__(self,
+                 algorithm='sha1',
+                 cache=None,
+                 mmap_threshold=DEFAULT_MMAP_THRESHOLD,
+                 stats=None):
+        self.algorithm = algorithm
+        self.cache = cache
+        self.mmap_threshold = mmap_threshold
+        self.stats = stats
+
+    def digest(self, path, st):
+        if self.cache is not None:
+            digest = self.cache.lookup(path, st)
+            if digest is not None:
+                if self.stats is not None:
+                    self.stats.record_cache_hit()
+                return digest
+        start = time.perf_counter()
+        if st.st_size >= self.mmap_threshold:
+            digest = hash_file_mmap(path, self.algorithm)
+        else:
+            digest = hash_file(path, self.algorithm)
+        if digest is None:
+            return None
+        if self.stats is not None:
+            self.stats.record_hash(st.st_size, time.perf_counter() - start)
+        if self.cache is not None:
+            self.cache.update(path, st, digest)
+        return digest
+
+    def forget(self, path):
+        if self.cache is not None:
+            self.cache.discard(path)
+
+    def remember(self, path, st, digest):
+        if self.cache is not None:
+            self.cache.update(path, st, digest)
+
+
+def snapshot_file(path, hasher=None):
+    """Returns the FileState of `path`, or None if it can't be read."""
+    hasher = hasher or OutputHasher()
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    digest = hasher.digest(path, st)
+    if digest is None:
+        return None
+    return FileState(st.st_atime_ns, st.st_mtime_ns, st.st_size, digest)
+
+
+def restore_timestamps_if_unchanged(path, state, hasher=None):
+    """Restores the timestamps of `path` if its content matches `state`.
+
+    Returns True if the timestamps were restored.
+    """
+    hasher = hasher or OutputHasher()
+    try:
+        st = os.stat(path)
+        if st.st_size != state.size:
+            hasher.forget(path)
+            return False
+        if hasher.digest(path, st) != state.digest:
+            return False
+        os.utime(path, ns=(state.atime_ns, state.mtime_ns))
+        hasher.remember(path, os.stat(path), state.digest)
+        return True
+    except OSError:
+        hasher.forget(path)
+        return False
+
+
+def _map_files(function, items, parallel_threshold):
+    """Applies `function` to `items`, on a thread pool for many items.
+
+    The stat and hash calls release the GIL, so threads overlap the I/O of
+    many small outputs and the hashing of large ones.
+    """
+    items = list(items)
+    if len(items) < parallel_threshold:
+        return [function(*item) for item in items]
+    with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(32, (os.cpu_count() or 1) + 4)) as executor:
+        return list(executor.map(lambda item: function(*item), items))
+
+
+def snapshot_files(paths,
+                   hasher,
+                   parallel_threshold=DEFAULT_PARALLEL_THRESHOLD):
+    """Returns a dict of path to FileState for all readable `paths`."""
+    states = _map_files(lambda path: snapshot_file(path, hasher),
+                        [(path, ) for path in paths], parallel_threshold)
+    return {
+        path: state
+        for path, state in zip(paths, states) if state is not None
+    }
+
+
+def restore_unchanged_timestamps(
+        before_state, hasher, parallel_threshold=DEFAULT_PARALLEL_THRESHOLD):
+    """Restores timestamps of all unchanged files. Returns how many."""
+    restored = _map_files(
+        lambda path, state: restore_timestamps_if_unchanged(
+            path, state, hasher), before_state.items(), parallel_threshold)
+    return sum(restored)
+
+
 def main():
     args = expand_response_files(sys.argv[1:])
 
     if '--' not in args:
         print(
-            "Usage: run_with_restat.py [<tracked_output>...] -- <command> [args...]",
+            "Usage: run_with_restat.py [<tracked_output>...] -- <command> "
+            "[args...]",
             file=sys.stderr)
         print("       (Arguments and @response_files are expanded in-place)",
               file=sys.stderr)
         sys.exit(1)
 
     dash_index = args.index('--')
-    tracked_files = args[:dash_index]
+    options, tracked_files = parse_options(args[:dash_index])
     command_args = args[dash_index + 1:]
 
     if not command_args:
         print("Error: No command specified after '--'", file=sys.stderr)
         sys.exit(1)
 
+    algorithm = options.pop('hash', 'sha1')
+    cache_dir = options.pop('digest-cache', None)
+    report_stats = options.pop('stats', False)
+    if report_stats is not True and report_stats is not False:
+        if report_stats.lower() in ('1', 'true', 'yes'):
+            report_stats = True
+        elif report_stats.lower() in ('0', 'false', 'no'):
+            report_stats = False
+        else:
+            print("Error: Invalid value for --stats: '%s'" % report_stats,
+                  file=sys.stderr)
+            sys.exit(1)
+    try:
+        parallel_threshold = int(
+            options.pop('parallel-threshold', DEFAULT_PARALLEL_THRESHOLD))
+        mmap_threshold = int(
+            options.pop('mmap-threshold', DEFAULT_MMAP_THRESHOLD))
+    except ValueError as e:
+        print("Error: Invalid threshold: %s" % e, file=sys.stderr)
+        sys.exit(1)
+    if options:
+        print("Error: Unknown options: %s" %
+              ', '.join('--' + name for name in options),
+              file=sys.stderr)
+        sys.exit(1)
+    if algorithm not in HASH_ALGORITHMS:
+        print("Error: Unknown hash algorithm '%s', expected one of: %s" %
+              (algorithm, ', '.join(HASH_ALGORITHMS)),
+              file=sys.stderr)
+        sys.exit(1)
+
+    start = time.perf_counter()
+    stats = RestatStats() if report_stats else None
+    cache = DigestCache(
+        digest_cache_location(cache_dir, tracked_files)
+        if cache_dir else None, algorithm)
+    hasher = OutputHasher(algorithm, cache, mmap_threshold, stats)
+
     # Record existing state of tracked output files (nanosecond precision)
-    before_state = {}
-    for path in tracked_files:
-        try:
-            st = os.stat(path)
-            digest = hash_file(path)
-            if digest is not None:
-                before_state[path] = (st.st_atime_ns, st.st_mtime_ns, digest)
-        except OSError:
-            pass
+    before_state = snapshot_files(tracked_files, hasher, parallel_threshold)
 
     # Execute the command
     ret = subprocess.call(command_args)
@@ -102,15 +466,18 @@ def main():
             sys.exit(128 - ret)
         sys.exit(ret)
 
-    # Restore exact nanosecond timestamps for tracked files whose contents are identical
-    for path, (old_atime_ns, old_mtime_ns, old_digest) in before_state.items():
-        if os.path.exists(path):
-            try:
-                new_digest = hash_file(path)
-                if new_digest == old_digest:
-                    os.utime(path, ns=(old_atime_ns, old_mtime_ns))
-            except OSError:
-                pass
+    # Restore exact nanosecond timestamps for tracked files whose contents are
+    # identical
+    restored = restore_unchanged_timestamps(before_state, hasher,
+                                            parallel_threshold)
+    # Rewritten outputs are within the racy window and won't be reused by the
+    # next invocation, so there is no point in hashing new outputs here.
+    cache.save()
+
+    if stats is not None:
+        stats.files_tracked = len(tracked_files)
+        stats.timestamps_restored = restored
+        stats.report(time.perf_counter() - start)
 
     sys.exit(0)
 
@@ -28,6 +28,14 @@ finally:
     sys.path = old_sys_path
 ESBUILD_LOCATION = devtools_paths.esbuild_path()
 
+try:
+    old_sys_path = sys.path[:]
+    sys.path.append(path.join(ROOT_DIRECTORY_OF_REPOSITORY, 'scripts',
+                              'build'))
+    import run_with_restat
+finally:
+    sys.path = old_sys_path
+
 BASE_TS_CONFIG_LOCATION = path.join(ROOT_DIRECTORY_OF_REPOSITORY, 'config',
                                     'typescript', 'tsconfig.base.json')
 TYPES_NODE_MODULES_DIRECTORY = path.join(NODE_MODULES_DIRECTORY, '@types')
@@ -84,9 +92,9 @@ def maybe_update_tsconfig_file(tsconfig_output_location, tsconfig):
     return 0
 
 
-# Obtain the timestamps and original content of any previously generated TypeScript files, if any.
-# This will be used later in `maybe_reset_timestamps_on_generated_files` to potentially reset
-# file timestamps for Ninja.
+# Obtain a snapshot (timestamps, size and content digest) of any previously generated TypeScript
+# files, if any. This will be used later in `maybe_reset_timestamps_on_generated_files` to
+# potentially reset file timestamps for Ninja.
 def compute_previous_generated_file_metadata(sources,
                                              tsconfig_output_directory):
     gen_files = {}
@@ -94,11 +102,9 @@ def compute_previous_generated_file_metadata(sources,
         for ext in ['.d.ts', '.js', '.js.map']:
             gen_fname = os.path.basename(src_fname.replace('.ts', ext))
             gen_path = os.path.join(tsconfig_output_directory, gen_fname)
-            if os.path.exists(gen_path):
-                mtime = os.stat(gen_path).st_mtime
-                with open(gen_path, encoding="utf8") as fp:
-                    contents = fp.read()
-                gen_files[gen_fname] = (mtime, contents)
+            state = run_with_restat.snapshot_file(gen_path)
+            if state is not None:
+                gen_files[gen_fname] = state
 
     return gen_files
 
@@ -114,15 +120,9 @@ def compute_previous_generated_file_metadata(sources,
 # of the immediate dependent would be properly reset and any transitive dependents would not be rerun.
 def maybe_reset_timestamps_on_generated_files(
         previously_generated_file_metadata, tsconfig_output_directory):
-    for gen_fname in previously_generated_file_metadata:
+    for gen_fname, state in previously_generated_file_metadata.items():
         gen_path = os.path.join(tsconfig_output_directory, gen_fname)
-        if os.path.exists(gen_path):
-            old_mtime, old_contents = previously_generated_file_metadata[
-                gen_fname]
-            with open(gen_path, encoding="utf8") as fp:
-                new_contents = fp.read()
-            if new_contents == old_contents:
-                os.utime(gen_path, (old_mtime, old_mtime))
+        run_with_restat.restore_timestamps_if_unchanged(gen_path, state)
 
 
 # TypeScript generates `.tsbuildinfo` files for its incremental compilation. These files are used for
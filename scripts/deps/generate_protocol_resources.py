@@ -43,6 +43,7 @@ import os.path as path
 import os
 import subprocess
 import sys
+import tempfile
 
 _CURRENT_DIR = path.join(path.dirname(__file__))
 
@@ -60,6 +61,12 @@ PROTOCOL_LOCATION = path.join(ROOT_DIRECTORY, 'third_party', 'blink', 'public',
                               'devtools_protocol')
 SCRIPTS_BUILD_PATH = path.join(ROOT_DIRECTORY, 'scripts', 'build')
 
+# Kept on the path so that worker processes of the generator pool can import
+# the generators' shared pipeline as well.
+sys.path.append(SCRIPTS_BUILD_PATH)
+import json5_generator
+from generated_files import has_contents
+
 GENERATE_ARIA_SCRIPT = path.join(SCRIPTS_BUILD_PATH, 'generate_aria.py')
 GENERATE_SUPPORTED_CSS_SCRIPT = path.join(SCRIPTS_BUILD_PATH,
                                           'generate_supported_css.py')
@@ -70,16 +77,57 @@ CONCATENATE_PROTOCOL_SCRIPT = path.join(devtools_paths.third_party_path(),
                                         'concatenate_protocols.py')
 GENERATE_DEPRECATIONS_SCRIPT = path.join(SCRIPTS_BUILD_PATH,
                                          'generate_deprecations.py')
+JSON5_GENERATOR_SCRIPTS = [
+    GENERATE_ARIA_SCRIPT,
+    GENERATE_SUPPORTED_CSS_SCRIPT,
+    GENERATE_DEPRECATIONS_SCRIPT,
+]
+PROTOCOL_TYPESCRIPT_PATH = path.join(ROOT_DIRECTORY, 'scripts',
+                                     'protocol_typescript')
+PROTOCOL_DTS_GENERATOR_SCRIPT = path.join(PROTOCOL_TYPESCRIPT_PATH,
+                                          'protocol_dts_generator.ts')
+
+PROTOCOL_PDL_FILES = [
+    path.join(PROTOCOL_LOCATION, 'browser_protocol.pdl'),
+    path.join(V8_DIRECTORY_PATH, 'include', 'js_protocol.pdl'),
+]
+PROTOCOL_JSON = path.join(PROTOCOL_LOCATION, 'browser_protocol.json')
+GENERATED_PATH = path.join(ROOT_DIRECTORY, 'front_end', 'generated')
+INSPECTOR_BACKEND_COMMANDS = path.join(GENERATED_PATH,
+                                       'InspectorBackendCommands.ts')
+PROTOCOL_TYPESCRIPT_OUTPUTS = [
+    path.join(GENERATED_PATH, name)
+    for name in ('protocol.ts', 'protocol-mapping.d.ts',
+                 'protocol-proxy-api.d.ts')
+]
+# Per-domain cache of `code_generator_frontend.py`, so that protocol rolls
+# touching a single domain only regenerate that domain. It is kept in the
+# checkout, as its entries end up in checked-in files.
+PROTOCOL_DOMAIN_CACHE = devtools_paths.checkout_cache_path(
+    'protocol_domain_cache.json')
 
 NODE_LOCATION = devtools_paths.node_path()
 
 
+def domain_cache_arguments():
+    if PROTOCOL_DOMAIN_CACHE is None:
+        return []
+    return ['--domain-cache', PROTOCOL_DOMAIN_CACHE]
+
+
 def parse_options(cli_args):
     parser = argparse.ArgumentParser(description='Generate protocol resources')
     parser.add_argument(
         '--node-path',
         default=NODE_LOCATION,
     )
+    parser.add_argument(
+        '--check',
+        nargs='*',
+        metavar='CHANGED_FILE',
+        help='Check that the generated files are up to date instead of '
+        'writing them, by generating them into a temporary directory. If '
+        'changed files are given, only the steps that use them are run.')
     return parser.parse_args(cli_args)
 
 
@@ -92,21 +140,18 @@ def popen(arguments, cwd=ROOT_DIRECTORY, env=os.environ.copy()):
         sys.exit(process.returncode)
 
 
-def runNode(file_to_execute, options):
-    process = subprocess.Popen([options.node_path, file_to_execute],
+def runNode(file_to_execute, options, arguments=()):
+    process = subprocess.Popen([options.node_path, file_to_execute] +
+                               list(arguments),
                                stdout=subprocess.PIPE,
                                stderr=subprocess.PIPE)
     stdout, stderr = process.communicate()
     return process.returncode, stdout + stderr
 
 
-def generate_protocol_typescript_definitions(options):
-    protocol_generator_script = path.join(ROOT_DIRECTORY, 'scripts',
-                                          'protocol_typescript',
-                                          'protocol_dts_generator.ts')
-
-    node_found_errors, node_stderr = runNode(protocol_generator_script,
-                                             options)
+def generate_protocol_typescript_definitions(options, arguments=()):
+    node_found_errors, node_stderr = runNode(PROTOCOL_DTS_GENERATOR_SCRIPT,
+                                             options, arguments)
 
     if node_found_errors:
         print('')
@@ -117,23 +162,136 @@ def generate_protocol_typescript_definitions(options):
         return 1
 
 
+def generation_steps():
+    """Returns the (name, inputs, outputs) of every generation step, in the
+    order in which they run. Inputs can be files or directories."""
+    steps = []
+    for script in JSON5_GENERATOR_SCRIPTS:
+        generator = json5_generator.load_generator(script)
+        steps.append((path.basename(script),
+                      [script, json5_generator.PYJSON5_DIR] +
+                      json5_generator.COMMON_INPUTS + list(generator.INPUTS),
+                      list(generator.OUTPUTS)))
+    steps.extend([
+        # The .pdl files of the protocol include the ones of its domains.
+        ('protocol json', [
+            PROTOCOL_LOCATION, CONCATENATE_PROTOCOL_SCRIPT
+        ] + PROTOCOL_PDL_FILES, [PROTOCOL_JSON]),
+        ('protocol commands', [
+            PROTOCOL_JSON, GENERATE_PROTOCOL_DEFINITIONS_SCRIPT,
+            path.join(SCRIPTS_BUILD_PATH, 'generated_files.py')
+        ], [INSPECTOR_BACKEND_COMMANDS]),
+        ('protocol types', [PROTOCOL_JSON, PROTOCOL_TYPESCRIPT_PATH],
+         PROTOCOL_TYPESCRIPT_OUTPUTS),
+    ])
+    return steps
+
+
+def _is_at_or_under(file_name, parent):
+    return file_name == parent or file_name.startswith(parent + os.sep)
+
+
+def affected_steps(steps, changed_files):
+    """Returns the names of the steps that use any of `changed_files`, as
+    inputs or outputs, directly or through the outputs of earlier steps."""
+    changed = [path.normpath(path.abspath(f)) for f in changed_files]
+    this_script = path.normpath(path.abspath(__file__))
+    if this_script in changed:
+        return [name for name, _, _ in steps]
+    affected = []
+    for name, inputs, outputs in steps:
+        paths = [path.normpath(p) for p in inputs + outputs]
+        if any(
+                _is_at_or_under(file_name, parent) for file_name in changed
+                for parent in paths):
+            affected.append(name)
+            changed.extend(path.normpath(output) for output in outputs)
+    return affected
+
+
+def _stale_outputs(pairs):
+    """Returns the checked-in outputs of the (checked-in, generated) pairs
+    that differ from the generated ones."""
+    stale = []
+    for checked_in, generated in pairs:
+        with open(generated, 'r', encoding='utf-8', newline='') as f:
+            if not has_contents(checked_in, f.read()):
+                stale.append(checked_in)
+    return stale
+
+
+def check(options):
+    """Regenerates the outputs of the steps affected by `options.check` into
+    a temporary directory, and returns 1 if any differ from the checked-in
+    ones."""
+    steps = generation_steps()
+    if options.check:
+        selected = affected_steps(steps, options.check)
+    else:
+        selected = [name for name, _, _ in steps]
+
+    stale = []
+    json5_scripts = [
+        script for script in JSON5_GENERATOR_SCRIPTS
+        if path.basename(script) in selected
+    ]
+    if json5_scripts:
+        stale.extend(json5_generator.stale_outputs(json5_scripts))
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        protocol_json = PROTOCOL_JSON
+        if 'protocol json' in selected:
+            protocol_json = path.join(temp_dir, 'browser_protocol.json')
+            popen([CONCATENATE_PROTOCOL_SCRIPT] + PROTOCOL_PDL_FILES +
+                  [protocol_json])
+            stale.extend(_stale_outputs([(PROTOCOL_JSON, protocol_json)]))
+
+        if 'protocol commands' in selected:
+            commands = path.join(temp_dir,
+                                 path.basename(INSPECTOR_BACKEND_COMMANDS))
+            popen([
+                GENERATE_PROTOCOL_DEFINITIONS_SCRIPT, '--input', protocol_json,
+                '--output', commands
+            ] + domain_cache_arguments())
+            stale.extend(
+                _stale_outputs([(INSPECTOR_BACKEND_COMMANDS, commands)]))
+
+        if 'protocol types' in selected:
+            if generate_protocol_typescript_definitions(
+                    options,
+                ['--input', protocol_json, '--output-dir', temp_dir]):
+                return 1
+            stale.extend(
+                _stale_outputs([(output,
+                                 path.join(temp_dir, path.basename(output)))
+                                for output in PROTOCOL_TYPESCRIPT_OUTPUTS]))
+
+    print('Checked: %s' % (', '.join(selected) or 'nothing'))
+    if stale:
+        print('These generated files are out of date:')
+        for output in stale:
+            print('  ' + path.relpath(output, ROOT_DIRECTORY))
+        print('Run scripts/deps/generate_protocol_resources.py to update them.')
+        return 1
+    return 0
+
+
 # Generate the required `front_end/generated` files that are based on files
 # living in Blink
 def main():
     options = parse_options(sys.argv[1:])
 
-    popen([GENERATE_ARIA_SCRIPT])
-    popen([GENERATE_SUPPORTED_CSS_SCRIPT])
-    popen([GENERATE_DEPRECATIONS_SCRIPT])
+    if options.check is not None:
+        sys.exit(check(options))
+
+    json5_generator.run_generators(JSON5_GENERATOR_SCRIPTS)
 
-    popen([CONCATENATE_PROTOCOL_SCRIPT] + [
-        path.join(PROTOCOL_LOCATION, 'browser_protocol.pdl'),
-        path.join(V8_DIRECTORY_PATH, 'include', 'js_protocol.pdl'),
+    popen([CONCATENATE_PROTOCOL_SCRIPT] + PROTOCOL_PDL_FILES + [
         # output_file
-        path.join(PROTOCOL_LOCATION, 'browser_protocol.json'),
+        PROTOCOL_JSON,
     ])
 
-    popen([GENERATE_PROTOCOL_DEFINITIONS_SCRIPT])
+    popen([GENERATE_PROTOCOL_DEFINITIONS_SCRIPT] + domain_cache_arguments())
 
     generate_protocol_typescript_definitions(options)
 
@@ -50,6 +50,27 @@ def devtools_root_path():
     return path.dirname((path.dirname(path.abspath(__file__))))
 
 
+def checkout_cache_path(name):
+    """Returns the path of the cache `name` that is private to this checkout,
+    inside its git directory, or None if the checkout has no git directory.
+
+    Unlike the shared temporary directory, the git directory is only
+    writable by the owner of the checkout, so cached values can be trusted.
+    """
+    git_dir = path.join(devtools_root_path(), '.git')
+    if path.isfile(git_dir):
+        # Worktrees and submodules point to their git directory.
+        with open(git_dir, 'r', encoding='utf-8') as git_file:
+            content = git_file.read().strip()
+        if not content.startswith('gitdir:'):
+            return None
+        git_dir = path.join(devtools_root_path(),
+                            content[len('gitdir:'):].strip())
+    if not path.isdir(git_dir):
+        return None
+    return path.join(path.normpath(git_dir), 'devtools-cache', name)
+
+
 def node_modules_path():
     return path.join(devtools_root_path(), 'node_modules')
 
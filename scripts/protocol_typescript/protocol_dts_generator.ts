@@ -8,13 +8,25 @@
  */
 import * as fs from 'node:fs';
 import * as path from 'node:path';
+import {parseArgs} from 'node:util';
 
 import protocolJson from '../../third_party/blink/public/devtools_protocol/browser_protocol.json' with {type : 'json'};
 
 import type {Protocol} from './protocol_schema.js';
 
+// --input and --output-dir let presubmit check a regenerated protocol
+// without touching the checked-in files.
+const {values: options} = parseArgs({
+  options: {
+    input: {type: 'string'},
+    'output-dir': {type: 'string'},
+  },
+});
+const protocol: typeof protocolJson =
+    options.input ? JSON.parse(fs.readFileSync(options.input, 'utf-8')) : protocolJson;
+
 const removedDomains = new Set(['Console']);
-const protocolDomains: Protocol.Domain[] = protocolJson.domains.filter(({domain}) => !removedDomains.has(domain));
+const protocolDomains: Protocol.Domain[] = protocol.domains.filter(({domain}) => !removedDomains.has(domain));
 
 let numIndents = 0;
 let emitStr = '';
@@ -442,15 +454,29 @@ const emitApi = (moduleName: string, protocolModuleName: string, domains: Protoc
   emitLine('export = ProtocolProxyApi;');
 };
 
+const readFileIfExists = (path: string) => {
+  try {
+    return fs.readFileSync(path, {encoding: 'utf-8'});
+  } catch {
+    return null;
+  }
+};
+
+// Unchanged files are not rewritten, so that they keep their mtime.
 const flushEmitToFile = (path: string) => {
-  console.log(`Wrote file: ${path}`);
-  fs.writeFileSync(path, emitStr, {encoding: 'utf-8'});
+  if (readFileIfExists(path) === emitStr) {
+    console.log(`Unchanged file: ${path}`);
+  } else {
+    console.log(`Wrote file: ${path}`);
+    fs.writeFileSync(path, emitStr, {encoding: 'utf-8'});
+  }
   numIndents = 0;
   emitStr = '';
 };
 
 const main = () => {
-  const FRONTEND_GENERATED_DIR = path.resolve(import.meta.dirname, path.join('../../front_end/generated'));
+  const FRONTEND_GENERATED_DIR =
+      options['output-dir'] ?? path.resolve(import.meta.dirname, path.join('../../front_end/generated'));
 
   const destProtocolFilePath = path.join(FRONTEND_GENERATED_DIR, 'protocol.ts');
   const protocolModuleName = path.basename(destProtocolFilePath, '.ts');
@@ -13,11 +13,35 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+"""Benchmarks json5.
+
+Every input is run through each operation (json5.loads(), json5.load(),
+json5.dumps() and json5.dumps() with an indent, both producing JSON5) as a
+separate scenario. The inputs are the files in this directory and synthetic
+inputs that stress one part of the parser each; --scale makes the synthetic
+inputs larger.
+
+Each scenario is run --warmup times and then timed --num-iterations times.
+The results can be written as JSON with --output, and compared against the
+results of an earlier run with --baseline:
+
+    $ ./run.py --output baseline.json
+    $ <change the parser>
+    $ ./run.py --baseline baseline.json --threshold 0.1
+
+which exits with 1 if the median time of any scenario got more than 10%
+slower. Baselines are only meaningful on the machine they were taken on.
+"""
+
 from __future__ import print_function
 
 import argparse
+import fnmatch
+import io
 import json
 import os
+import platform
+import random
 import sys
 import time
 
@@ -28,6 +52,8 @@ if not REPO_DIR in sys.path:
 
 import json5
 
+from json5.parser import MEMOIZED_RULES, RULES, Parser
+
 ALL_BENCHMARKS = (
     'ios-simulator.json',
     'mb_config.json',
@@ -35,55 +61,283 @@ ALL_BENCHMARKS = (
     'chromium.perf.json',
 )
 
-DEFAULT_ITERATIONS = 1
+RESULTS_VERSION = 1
+
+DEFAULT_ITERATIONS = 5
+DEFAULT_WARMUP = 1
+DEFAULT_THRESHOLD = 0.1
+DEFAULT_NOISE_FLOOR = 0.001
+
+PERCENTILES = (50, 90, 99)
+
 
 def main():
-    parser = argparse.ArgumentParser()
-    parser.add_argument('--pure', action='store_true')
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter)
     parser.add_argument('-n', '--num-iterations', default=DEFAULT_ITERATIONS,
-                        type=int)
-    parser.add_argument('benchmarks', nargs='*')
+                        type=int,
+                        help='Timed runs of each scenario '
+                             '(default: %(default)s).')
+    parser.add_argument('--warmup', default=DEFAULT_WARMUP, type=int,
+                        help='Untimed runs of each scenario before the timed '
+                             'ones (default: %(default)s).')
+    parser.add_argument('--scale', default=1, type=int,
+                        help='Size factor for the synthetic inputs '
+                             '(default: %(default)s).')
+    parser.add_argument('-s', '--scenario', action='append', default=[],
+                        metavar='PATTERN',
+                        help='Only run the scenarios matching this glob '
+                             'pattern, e.g. "loads/*". Can be repeated.')
+    parser.add_argument('-l', '--list', action='store_true',
+                        help='List the scenarios and exit.')
+    parser.add_argument('--no-synthetic', action='store_true',
+                        help='Only use the benchmark files.')
+    parser.add_argument('--reference', action='store_true',
+                        help='Also time the generated reference parser and '
+                             'check that it agrees with json5.loads().')
+    parser.add_argument('-o', '--output',
+                        help='Write the results to this file as JSON.')
+    parser.add_argument('-b', '--baseline',
+                        help='Compare against the results in this file.')
+    parser.add_argument('-t', '--threshold', default=DEFAULT_THRESHOLD,
+                        type=float,
+                        help='Relative slowdown of the median time against '
+                             'the baseline that counts as a regression '
+                             '(default: %(default)s).')
+    parser.add_argument('--noise-floor', default=DEFAULT_NOISE_FLOOR,
+                        type=float,
+                        help='Slowdowns of fewer seconds than this are never '
+                             'regressions, as such short scenarios are mostly '
+                             'noise (default: %(default)s).')
+    parser.add_argument('--rule-stats', action='store_true',
+                        help='Parse with the reference parser and print the '
+                             'calls, memoization hits and time of each rule.')
+    parser.add_argument('--memoize', default=','.join(MEMOIZED_RULES),
+                        help='Comma-separated rules for the reference parser '
+                             'to memoize, or "all" (default: %(default)s).')
+    parser.add_argument('--max-cache-entries', type=int,
+                        help='Size of the reference parser\'s memoization '
+                             'cache.')
+    parser.add_argument('benchmarks', nargs='*',
+                        help='Files to use instead of the benchmark files.')
     args = parser.parse_args()
-    if not args.benchmarks:
-        args.benchmarks = [os.path.join(THIS_DIR, d) for d in ALL_BENCHMARKS]
+    if args.num_iterations < 1:
+        parser.error('--num-iterations must be at least 1')
 
-    file_contents = []
-    for f in args.benchmarks:
+    if args.benchmarks:
+        files = args.benchmarks
+    else:
+        files = [os.path.join(THIS_DIR, d) for d in ALL_BENCHMARKS]
+    inputs = []
+    for f in files:
         with open(f) as fp:
-            file_contents.append(fp.read())
-
-
-    # json.decoder.c_scanstring = py_scanstring
-    def py_maker(*_args, **_kwargs):
-        decoder = json.JSONDecoder()
-        decoder.scan_once = json.scanner.py_make_scanner(decoder)
-        decoder.parse_string = json.decoder.py_scanstring
-        json.decoder.scanstring = decoder.parse_string
-        return decoder
-
-    maker = py_maker if args.pure else json.JSONDecoder
-
-    all_times = []
-    for i, c in enumerate(file_contents):
-        times = []
-        for _ in range(args.num_iterations):
-            start = time.time()
-            json_obj = json.loads(c, cls=maker)
-            mid = time.time()
-            json5_obj = json5.loads(c)
-            end = time.time()
-
-            json_time = mid - start
-            json5_time = end - mid
-            times.append((json_time, json5_time))
-            assert(json5_obj == json_obj)
-        all_times.append(times)
-
-    for i, times in enumerate(all_times):
-        avg = sum((json5_time / json_time)
-                  for json_time, json5_time in times) / args.num_iterations
-        print("%-20s: %5.1f" % (args.benchmarks[i], avg))
+            inputs.append((os.path.basename(f), fp.read()))
+
+    if args.rule_stats:
+        return print_rule_stats(args, inputs)
+
+    if not args.no_synthetic:
+        inputs.extend(synthetic_inputs(args.scale))
+    scenarios = [
+        scenario for scenario in make_scenarios(inputs, args.reference)
+        if not args.scenario or any(
+            fnmatch.fnmatchcase(scenario[0], pattern)
+            for pattern in args.scenario)
+    ]
+    if args.list:
+        for name, _, _ in scenarios:
+            print(name)
+        return 0
+
+    results = {
+        'version': RESULTS_VERSION,
+        'python': platform.python_version(),
+        'json5': json5.VERSION,
+        'num_iterations': args.num_iterations,
+        'warmup': args.warmup,
+        'scale': args.scale,
+        'scenarios': {},
+    }
+    print('%-40s %9s %9s %9s %9s' % ('scenario', 'min', 'p50', 'p90', 'p99'))
+    for name, size, fn in scenarios:
+        stats = run_scenario(fn, args.warmup, args.num_iterations)
+        stats['size'] = size
+        results['scenarios'][name] = stats
+        print('%-40s %9.4f %9.4f %9.4f %9.4f' % (name, stats['min'],
+                                                 stats['p50'], stats['p90'],
+                                                 stats['p99']))
+
+    if args.output:
+        with open(args.output, 'w') as fp:
+            json.dump(results, fp, indent=2, sort_keys=True)
+            fp.write('\n')
+
+    if args.baseline:
+        with open(args.baseline) as fp:
+            baseline = json.load(fp)
+        return compare(results, baseline, args.threshold, args.noise_floor)
+    return 0
+
+
+def synthetic_inputs(scale):
+    """Returns (name, contents) pairs of generated documents that each
+    stress one part of the parser."""
+    rand = random.Random(0)
+
+    depth = 2000 * scale
+    deep_nesting = '{a: [' * depth + '1' + ']}' * depth
+
+    alphabet = 'abcdefghij \\"\'\u00e9\u4e2d'
+    escapes = {'\\': '\\\\', '"': '\\"'}
+    long_strings = '[\n%s\n]' % ',\n'.join(
+        '"%s"' % ''.join(escapes.get(c, c) for c in
+                         (rand.choice(alphabet) for _ in range(10000)))
+        for _ in range(20 * scale))
+
+    many_comments = '{\n%s\n}' % '\n'.join(
+        '  // Member %d.\n  /* A %s comment. */\n  key%d: %d, // Trailing.' %
+        (i, 'block ' * (i % 10), i, i) for i in range(5000 * scale))
+
+    numbers = [
+        lambda: str(rand.randint(-10**9, 10**9)),
+        lambda: repr(rand.uniform(-1e6, 1e6)),
+        lambda: '%.3e' % rand.uniform(-1e6, 1e6),
+        lambda: hex(rand.randint(0, 10**6)),
+    ]
+    large_array = '[%s]' % ', '.join(
+        rand.choice(numbers)() for _ in range(100000 * scale))
+
+    return [
+        ('synthetic:deep_nesting', deep_nesting),
+        ('synthetic:long_strings', long_strings),
+        ('synthetic:many_comments', many_comments),
+        ('synthetic:large_array', large_array),
+    ]
+
+
+def make_scenarios(inputs, reference):
+    """Returns (name, input size, function to time) triples."""
+    scenarios = []
+    for name, contents in inputs:
+        obj = json5.loads(contents)
+        size = len(contents)
+        scenarios.extend([
+            ('loads/' + name, size,
+             lambda contents=contents: json5.loads(contents)),
+            ('load/' + name, size,
+             lambda contents=contents: json5.load(io.StringIO(contents))),
+            ('dumps/' + name, size,
+             lambda obj=obj: json5.dumps(obj, as_json5=True)),
+            ('dumps_indent/' + name, size,
+             lambda obj=obj: json5.dumps(obj, as_json5=True, indent=2)),
+        ])
+        # The reference parser recurses, so it cannot parse deep_nesting.
+        if reference and not name.startswith('synthetic:'):
+            check_reference(name, contents, obj)
+            scenarios.append(
+                ('reference/' + name, size,
+                 lambda contents=contents: Parser(contents,
+                                                  '<string>').parse()))
+    return scenarios
+
+
+def check_reference(name, contents, obj):
+    ast, err, _ = Parser(contents, name).parse()
+    if err:
+        raise ValueError(err)
+    if json5.lib._walk_ast(ast, dict, float, int,
+                           json5.lib._fp_constant_parser) != obj:
+        raise ValueError('%s: the reference parser disagrees with '
+                         'json5.loads()' % name)
+
+
+def run_scenario(fn, warmup, num_iterations):
+    for _ in range(warmup):
+        fn()
+    times = []
+    for _ in range(num_iterations):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    stats = {
+        'runs': times,
+        'min': min(times),
+        'max': max(times),
+        'mean': sum(times) / len(times),
+    }
+    for p in PERCENTILES:
+        stats['p%d' % p] = percentile(times, p)
+    return stats
+
+
+def percentile(values, p):
+    """Returns the p-th percentile of `values`, interpolating linearly
+    between the closest ranks."""
+    values = sorted(values)
+    rank = (len(values) - 1) * p / 100.0
+    lower = int(rank)
+    upper = min(lower + 1, len(values) - 1)
+    return values[lower] + (values[upper] - values[lower]) * (rank - lower)
+
+
+def compare(results, baseline, threshold, noise_floor):
+    """Prints the change of the median time of every scenario against the
+    baseline, and returns 1 if any got slower by more than `threshold` and
+    `noise_floor` seconds."""
+    if baseline.get('version') != RESULTS_VERSION:
+        print('Unsupported baseline version: %r' % baseline.get('version'))
+        return 2
+
+    print()
+    print('%-40s %9s %9s %8s' % ('scenario', 'baseline', 'p50', 'change'))
+    regressions = []
+    for name, stats in sorted(results['scenarios'].items()):
+        base = baseline['scenarios'].get(name)
+        if base is None:
+            print('%-40s %9s %9.4f %8s' % (name, '-', stats['p50'], 'new'))
+            continue
+        change = stats['p50'] / base['p50'] - 1
+        regressed = (change > threshold and
+                     stats['p50'] - base['p50'] > noise_floor)
+        if regressed:
+            regressions.append(name)
+        print('%-40s %9.4f %9.4f %+7.1f%%%s' %
+              (name, base['p50'], stats['p50'], change * 100,
+               ' REGRESSION' if regressed else ''))
+    missing = set(baseline['scenarios']) - set(results['scenarios'])
+    if missing:
+        print('%d scenario(s) of the baseline were not run.' % len(missing))
+
+    if regressions:
+        print('%d scenario(s) got more than %d%% slower than the baseline.' %
+              (len(regressions), threshold * 100))
+        return 1
+    return 0
+
+
+def print_rule_stats(args, inputs):
+    if args.memoize == 'all':
+        memoize = RULES
+    else:
+        memoize = [rule for rule in args.memoize.split(',') if rule]
+    kwargs = {}
+    if args.max_cache_entries is not None:
+        kwargs['max_cache_entries'] = args.max_cache_entries
 
+    for name, c in inputs:
+        stats = {}
+        start = time.time()
+        _, err, _ = Parser(c, name, memoize=memoize, stats=stats,
+                           **kwargs).parse()
+        print("%s: %.3fs%s" % (name, time.time() - start,
+                               ' (%s)' % err if err else ''))
+        print("  %-16s %9s %9s %9s %9s" % ('rule', 'calls', 'hits', 'misses',
+                                           'seconds'))
+        for rule, s in sorted(stats.items(), key=lambda kv: -kv[1].seconds):
+            if s.calls:
+                print("  %-16s %9d %9d %9d %9.3f" % (rule, s.calls, s.hits,
+                                                     s.misses, s.seconds))
     return 0
 
 
@@ -15,14 +15,17 @@
 """A pure Python implementation of the JSON5 configuration language."""
 
 from . import tool
-from .lib import load, loads, dump, dumps
+from .cache import ParseCache
+from .lib import load, loads, iterload, dump, dumps
 from .version import VERSION
 
 
 __all__ = [
+    'ParseCache',
     'VERSION',
     'dump',
     'dumps',
+    'iterload',
     'load',
     'loads',
     'tool',
@@ -0,0 +1,156 @@
+# Copyright 2026 The Chromium Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""An optional on-disk cache of parsed JSON5 documents.
+
+`ParseCache` stores the value of every document it parses in a directory,
+keyed by a hash of the document and of the parser version, in a format
+that loads much faster than JSON5 parses. Parsing an unchanged document
+again then only costs hashing it and loading the stored value.
+
+Documents are always parsed without hooks, as hooks cannot be part of the
+key. Errors are not cached: documents that fail to parse are parsed again
+every time, so that the errors are raised again.
+
+The cache directory must only be writable by trusted users, as `marshal`
+data is not safe to load from untrusted sources.
+"""
+
+import hashlib
+import json
+import marshal
+import os
+import sys
+import tempfile
+
+from . import lib
+from .version import VERSION
+
+
+FORMATS = ('marshal', 'json')
+
+# The modules that determine the parsed values.
+_PARSER_MODULES = ('fast_parser.py', 'lib.py')
+
+_parser_version = None
+
+
+def parser_version():
+    """Returns a string that changes whenever the parsed values may."""
+    global _parser_version
+    if _parser_version is None:
+        h = hashlib.sha256(VERSION.encode('utf-8'))
+        package_dir = os.path.dirname(os.path.abspath(__file__))
+        for module in _PARSER_MODULES:
+            with open(os.path.join(package_dir, module), 'rb') as f:
+                h.update(b'\0' + f.read())
+        _parser_version = h.hexdigest()
+    return _parser_version
+
+
+class ParseCache(object):
+    """Parses JSON5 documents, caching the results in `directory`.
+
+    `fmt` is the format of the cache entries: 'marshal' loads fastest, but
+    its entries are only valid for the Python version that wrote them;
+    'json' entries are plain JSON files."""
+
+    def __init__(self, directory, fmt='marshal'):
+        if fmt not in FORMATS:
+            raise ValueError('fmt must be one of %r, not %r' % (FORMATS, fmt))
+        self.directory = directory
+        self.fmt = fmt
+        self.hits = 0
+        self.misses = 0
+        key = [parser_version(), fmt]
+        if fmt == 'marshal':
+            key.append('%d.%d/%d' % (sys.version_info[0],
+                                     sys.version_info[1], marshal.version))
+        self._version_key = '\0'.join(key).encode('utf-8')
+
+    def loads(self, s, encoding=None):
+        """Like `json5.loads()`, using the cache."""
+        if isinstance(s, bytes):
+            data = s
+            s = s.decode(encoding or 'utf-8')
+        else:
+            data = s.encode('utf-8')
+        path = self._path(data)
+        found, value = self._read(path)
+        if found:
+            self.hits += 1
+            return value
+        self.misses += 1
+        value = lib.loads(s)
+        self._write(path, value)
+        return value
+
+    def load_file(self, file_name, encoding='utf-8'):
+        """Parses the JSON5 file `file_name`, using the cache."""
+        with open(file_name, 'rb') as f:
+            return self.loads(f.read(), encoding)
+
+    def clear(self):
+        """Removes all entries from the cache directory."""
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return
+        for name in names:
+            if name.endswith(tuple('.' + fmt for fmt in FORMATS)):
+                try:
+                    os.remove(os.path.join(self.directory, name))
+                except OSError:
+                    pass
+
+    def _path(self, data):
+        h = hashlib.sha256(self._version_key)
+        h.update(b'\0')
+        h.update(data)
+        return os.path.join(self.directory,
+                            '%s.%s' % (h.hexdigest(), self.fmt))
+
+    def _read(self, path):
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+            if self.fmt == 'marshal':
+                return True, marshal.loads(data)
+            return True, json.loads(data.decode('utf-8'))
+        except (OSError, EOFError, ValueError, TypeError, RecursionError):
+            # Missing or corrupt entries are parsed again.
+            return False, None
+
+    def _write(self, path, value):
+        try:
+            if self.fmt == 'marshal':
+                data = marshal.dumps(value)
+            else:
+                data = json.dumps(value, ensure_ascii=False).encode('utf-8')
+        except (ValueError, RecursionError):
+            # Values nested too deeply to be stored are not cached.
+            return
+        temp_path = None
+        try:
+            if not os.path.isdir(self.directory):
+                os.makedirs(self.directory)
+            fd, temp_path = tempfile.mkstemp(dir=self.directory,
+                                             suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(temp_path, path)
+        except OSError:
+            # The cache only saves time.
+            if temp_path and os.path.exists(temp_path):
+                os.remove(temp_path)
@@ -0,0 +1,340 @@
+# Copyright 2026 The Chromium Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""The JSON5 encoder behind `json5.dumps()` and `json5.dump()`.
+
+`iterencode()` walks the object with an explicit stack instead of
+recursing, collects the output in a list and yields it in chunks, so that
+`dump()` can write a large document without building it in memory first.
+
+`encode()` produces the same output. Unless it has to indent, it lets the
+C encoder of the `json` module walk the object and only quotes the strings
+itself. Strings that are written differently as keys and as values are
+marked instead of quoted, and the marks are then replaced by the key or the
+value form depending on what follows them.
+"""
+
+import re
+import sys
+
+try:
+    from json.encoder import c_make_encoder
+except ImportError:  # pragma: no cover
+    c_make_encoder = None
+
+
+if sys.version_info[0] < 3:
+    # pylint: disable=redefined-builtin
+    str = unicode
+    _INT_TYPES = (int, long)
+else:
+    _INT_TYPES = (int,)
+
+
+QUOTE_STYLES = (None, 'single', 'double')
+
+# The number of pieces collected before `iterencode()` yields them.
+DEFAULT_CHUNK_PIECES = 4096
+
+# Strings matching this are written without quotes when they are keys.
+_IDENTIFIER = re.compile(u'[A-Za-z_$][A-Za-z0-9_$]*\\Z')
+
+_ESCAPES = {
+    u'\\': u'\\\\',
+    u'"': u'\\"',
+    u"'": u"\\'",
+    u'\b': u'\\b',
+    u'\f': u'\\f',
+    u'\n': u'\\n',
+    u'\r': u'\\r',
+    u'\t': u'\\t',
+}
+
+# Characters that must be escaped in strings quoted with each quote: the
+# quote itself, backslashes, control characters and the characters that
+# end a line in JSON5.
+_NEEDS_ESCAPE = {
+    q: re.compile(u'[%s\\\\\\x00-\\x1f\\u2028\\u2029]' % q)
+    for q in (u'"', u"'")
+}
+
+# Surrounds the number of a marked string in the output of the C encoder. It
+# cannot occur otherwise, as control characters in strings are escaped.
+_MARK = u'\x00'
+
+
+def _escape(m):
+    c = m.group(0)
+    return _ESCAPES.get(c) or u'\\u%04x' % ord(c)
+
+
+def _quote(s, q):
+    if _NEEDS_ESCAPE[q].search(s):
+        s = _NEEDS_ESCAPE[q].sub(_escape, s)
+    return q + s + q
+
+
+def _string_encoder(quote_style):
+    """Returns the quote that strings are quoted with by default, and a
+    function that quotes and escapes a string.
+
+    With the default `quote_style` of None, strings are quoted with single
+    quotes unless they contain one. Keys are quoted by the encoder of
+    `quote_style or 'double'`, so that they are quoted as in JSON by
+    default."""
+    if quote_style is None:
+        prefer, other = u"'", u'"'
+    elif quote_style == 'single':
+        prefer, other = u"'", None
+    elif quote_style == 'double':
+        prefer, other = u'"', None
+    else:
+        raise ValueError('quote_style must be one of %r, not %r' %
+                         (QUOTE_STYLES, quote_style))
+    needs_escape = _NEEDS_ESCAPE[prefer].search
+
+    def encode_string(s):
+        if not needs_escape(s):
+            return prefer + s + prefer
+        if other and prefer in s:
+            return _quote(s, other)
+        return _quote(s, prefer)
+
+    return prefer, encode_string
+
+
+class _Cache(dict):
+    """Memoizes a function of one argument: `cache[arg]` calls it once."""
+
+    def __init__(self, fn):
+        super(_Cache, self).__init__()
+        self._fn = fn
+
+    def __missing__(self, arg):
+        value = self[arg] = self._fn(arg)
+        return value
+
+
+def _separators(compact, indent):
+    if indent is not None:
+        return u',', u': '
+    if compact:
+        return u',', u':'
+    return u', ', u': '
+
+
+def _float_repr(f):
+    if f != f:
+        return u'NaN'
+    if f == float('inf'):
+        return u'Infinity'
+    if f == -float('inf'):
+        return u'-Infinity'
+    return float.__repr__(f)
+
+
+def _unserializable(obj):
+    raise TypeError('Object of type %s is not JSON5 serializable' %
+                    type(obj).__name__)
+
+
+def encode(obj, compact=False, indent=None, sort_keys=False,
+           quote_keys=False, quote_style=None, check_circular=True):
+    """Encodes ``obj`` as JSON5.
+
+    See `json5.dumps()` for the arguments."""
+
+    if indent is not None or c_make_encoder is None:
+        return u''.join(iterencode(obj, compact, indent, sort_keys,
+                                   quote_keys, quote_style, check_circular))
+
+    item_separator, key_separator = _separators(compact, indent)
+    _, encode_string = _string_encoder(quote_style)
+    _, encode_key_string = _string_encoder(quote_style or 'double')
+    key_forms = []
+    value_forms = []
+
+    def encode_marked(s):
+        if not quote_keys and _IDENTIFIER.match(s):
+            key = s
+        else:
+            key = encode_key_string(s)
+        value = encode_string(s)
+        if key == value:
+            return value
+        key_forms.append(key)
+        value_forms.append(value)
+        return u'%s%d%s' % (_MARK, len(key_forms) - 1, _MARK)
+
+    # The C encoder calls the `encoder` function for keys and values alike,
+    # so strings whose key and value forms differ are marked and left for
+    # later.
+    try:
+        chunks = c_make_encoder({} if check_circular else None,
+                                _unserializable,
+                                _Cache(encode_marked).__getitem__, None,
+                                key_separator, item_separator, sort_keys,
+                                False, True)(obj, 0)
+    except RecursionError:
+        # The C encoder recurses, `iterencode()` does not.
+        return u''.join(iterencode(obj, compact, indent, sort_keys,
+                                   quote_keys, quote_style, check_circular))
+    parts = u''.join(chunks).split(_MARK)
+    if len(parts) > 1:
+        # Marked keys are followed by the key separator, marked values are
+        # not.
+        parts[1::2] = [
+            key_forms[int(number)] if after[:1] == u':' else
+            value_forms[int(number)]
+            for number, after in zip(parts[1::2], parts[2::2])
+        ]
+    return u''.join(parts)
+
+
+def iterencode(obj, compact=False, indent=None, sort_keys=False,
+               quote_keys=False, quote_style=None, check_circular=True,
+               chunk_pieces=DEFAULT_CHUNK_PIECES):
+    """Encodes ``obj`` as JSON5, yielding the output in chunks.
+
+    See `json5.dumps()` for the arguments."""
+
+    if indent is not None and not isinstance(indent, str):
+        indent = u' ' * indent
+    item_separator, key_separator = _separators(compact, indent)
+    _, encode_string = _string_encoder(quote_style)
+    _, encode_key_string = _string_encoder(quote_style or 'double')
+    keys = {}
+    # With an indent, separators[depth] follows the items at that depth and
+    # closers[depth] precedes the end of the container at that depth.
+    separators = [item_separator]
+    closers = [u'']
+
+    def encode_key(k):
+        if isinstance(k, str):
+            s = k
+        elif k is True:
+            s = u'true'
+        elif k is False:
+            s = u'false'
+        elif k is None:
+            s = u'null'
+        elif isinstance(k, float):
+            s = _float_repr(k)
+        elif isinstance(k, _INT_TYPES):
+            s = int.__repr__(k)
+        else:
+            raise TypeError('keys must be str, int, float, bool or None, '
+                            'not %s' % type(k).__name__)
+        if not quote_keys and _IDENTIFIER.match(s):
+            encoded = s
+        else:
+            encoded = encode_key_string(s)
+        if s is k:
+            # Only strings are cached, as 1, 1.0 and True are equal keys.
+            # Values are not cached, so that memory use stays bounded.
+            keys[k] = encoded
+        return encoded
+
+    markers = {} if check_circular else None
+    # Each entry is the iterator over the items of an open container,
+    # whether it is a dict, its marker and the string that closes it.
+    stack = []
+    pieces = []
+    append = pieces.append
+    value = obj
+    while True:
+        t = type(value)
+        first = False
+        if t is str:
+            append(encode_string(value))
+        elif value is None:
+            append(u'null')
+        elif value is True:
+            append(u'true')
+        elif value is False:
+            append(u'false')
+        elif t is int:
+            append(int.__repr__(value))
+        elif t is float:
+            append(_float_repr(value))
+        elif t is dict or t is list or isinstance(value,
+                                                  (dict, list, tuple)):
+            is_dict = isinstance(value, dict)
+            if not value:
+                append(u'{}' if is_dict else u'[]')
+            else:
+                if markers is not None:
+                    marker = id(value)
+                    if marker in markers:
+                        raise ValueError('Circular reference detected')
+                    markers[marker] = value
+                else:
+                    marker = None
+                if indent is not None:
+                    depth = len(stack) + 1
+                    if depth == len(separators):
+                        separators.append(u',\n' + indent * depth)
+                        closers.append(u'\n' + indent * (depth - 1))
+                    append((u'{\n' if is_dict else u'[\n') + indent * depth)
+                    closer = closers[depth]
+                else:
+                    append(u'{' if is_dict else u'[')
+                    closer = u''
+                if is_dict:
+                    items = value.items()
+                    if sort_keys:
+                        items = sorted(items, key=lambda kv: kv[0])
+                    stack.append((iter(items), True, marker, closer + u'}'))
+                else:
+                    stack.append((iter(value), False, marker, closer + u']'))
+                first = True
+        elif isinstance(value, str):
+            append(encode_string(value))
+        elif isinstance(value, float):
+            append(_float_repr(value))
+        elif isinstance(value, _INT_TYPES):
+            append(int.__repr__(value))
+        else:
+            _unserializable(value)
+
+        # Move on to the next value, closing the containers that are done.
+        while stack:
+            items, is_dict, marker, closer = stack[-1]
+            for item in items:
+                break
+            else:
+                stack.pop()
+                append(closer)
+                if marker is not None:
+                    del markers[marker]
+                first = False
+                continue
+            if not first:
+                append(separators[len(stack)] if indent is not None
+                       else item_separator)
+            if is_dict:
+                k, value = item
+                append(keys.get(k) or encode_key(k))
+                append(key_separator)
+            else:
+                value = item
+            break
+        else:
+            break
+
+        if len(pieces) >= chunk_pieces:
+            yield u''.join(pieces)
+            del pieces[:]
+
+    yield u''.join(pieces)
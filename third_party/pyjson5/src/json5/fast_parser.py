@@ -0,0 +1,565 @@
+# Copyright 2026 The Chromium Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""A hand-written parser for the grammar in json5.g.
+
+`FastParser` is a drop-in replacement for the generated `Parser`: it
+returns the same AST, but scans whitespace, comments, strings, identifiers
+and numbers with regular expressions instead of matching the input one
+character at a time.
+
+The generated parser remains the reference implementation. Whenever the
+fast parser rejects a document, the document is parsed again with the
+generated parser, so that errors are reported exactly as before.
+"""
+
+import codecs
+import re
+import sys
+import unicodedata
+
+from .parser import Parser
+
+
+if sys.version_info[0] < 3:
+    # pylint: disable=redefined-builtin
+    chr = unichr
+    str = unicode
+
+
+# All characters of the 'Zs' category, which are whitespace in JSON5 along
+# with the other characters of the `ws` rule.
+_ZS_CHARS = u'\u0020\u00a0\u1680\u2000-\u200a\u202f\u205f\u3000'
+
+_EOL_CHARS = u'\r\n\u2028\u2029'
+
+_WS = re.compile(
+    u'(?:[\t\v\f\ufeff%s%s]+|//[^%s]*|/\\*.*?\\*/)*' %
+    (_EOL_CHARS, _ZS_CHARS, _EOL_CHARS), re.DOTALL)
+
+_STRING_CHUNKS = {
+    u'"': re.compile(u'[^"\\\\%s]*' % _EOL_CHARS),
+    u"'": re.compile(u"[^'\\\\%s]*" % _EOL_CHARS),
+}
+
+_ESCAPES = {
+    u'b': u'\b',
+    u'f': u'\f',
+    u'n': u'\n',
+    u'r': u'\r',
+    u't': u'\t',
+    u'v': u'\v',
+    u"'": u"'",
+    u'"': u'"',
+    u'\\': u'\\',
+}
+
+_HEX_ESCAPES = {u'x': 2, u'u': 4}
+
+_HEX = re.compile(u'[0-9a-fA-F]+')
+
+_ASCII_ID_START = re.compile(u'[A-Za-z$_]')
+
+_ASCII_ID_CONTINUE = re.compile(u'[A-Za-z0-9$_]*')
+
+_ID_START_CATEGORIES = frozenset(['Ll', 'Lm', 'Lo', 'Lt', 'Lu', 'Nl'])
+
+_ID_CONTINUE_CATEGORIES = _ID_START_CATEGORIES | frozenset(
+    ['Mn', 'Mc', 'Nd', 'Pc'])
+
+# `'+'? dec_literal`, split into the optional sign, the literal up to the
+# exponent and the exponent without its 'e' or 'E'.
+_DEC_LITERAL = re.compile(
+    u'(\\+?)((?:0(?![0-9])|[1-9][0-9]*)(?:\\.[0-9]*)?|\\.[0-9]*)'
+    u'(?:[eE]([+-]?[0-9]*))?')
+
+
+class _Failure(Exception):
+    pass
+
+
+def _ast_number(v):
+    return ['number', v]
+
+
+_AST_NUMBERS = dict.fromkeys(['int', 'hex', 'float', 'constant'], _ast_number)
+
+
+def _ast_object(pairs):
+    return ['object', [[k, v] for k, v in pairs]]
+
+
+def _ast_array(elements):
+    return ['array', elements]
+
+
+def _ast_string(s):
+    return ['string', s]
+
+
+class FastParser(object):
+    def __init__(self, msg, fname):
+        self.msg = str(msg)
+        self.end = len(self.msg)
+        self.fname = fname
+
+    def parse(self):
+        """Returns (ast, error, position) just like `Parser.parse()`."""
+        try:
+            for val in self._build(_AST_NUMBERS, _ast_string, _ast_array,
+                                   _ast_object, 'None', 'True', 'False'):
+                pass
+        except (_Failure, IndexError):
+            return self._reference_parse()
+        return val, None, self.end
+
+    def parse_values(self, dictify, parse_float, parse_int, parse_constant):
+        """Returns (value, error, position), building the Python values
+        directly instead of returning an AST.
+
+        The hooks have the same meaning as for `json5.loads()` and are called
+        as soon as a value has been parsed, with the same text as
+        `json5.lib._walk_ast()` would pass them.
+        """
+        values = self._values(dictify, parse_float, parse_int, parse_constant,
+                              items=False)
+        try:
+            for val in values:
+                pass
+        except (_Failure, IndexError):
+            ast, err, pos = self._reference_parse()
+            if err:
+                return None, err, pos
+            # Only reachable if the parsers disagree on the grammar.
+            from .lib import _walk_ast  # pylint: disable=cyclic-import
+            val = _walk_ast(ast, dictify, parse_float, parse_int,
+                            parse_constant)
+        except Exception:
+            # A hook failed. Syntax errors take precedence, as they did when
+            # the whole document was parsed before calling any hook.
+            _, err, pos = self._reference_parse(hook_failed=True)
+            if err:
+                return None, err, pos
+            raise
+        return val, None, self.end
+
+    def iter_values(self, dictify, parse_float, parse_int, parse_constant):
+        """Yields the elements of a top-level array, or the (key, value) pairs
+        of a top-level object, as soon as each of them has been parsed.
+
+        Raises ValueError for syntax errors, which are only detected when the
+        parser gets to them, and for documents that are not an array or an
+        object.
+        """
+        values = self._values(dictify, parse_float, parse_int, parse_constant,
+                              items=True)
+        try:
+            for val in values:
+                yield val
+        except (_Failure, IndexError):
+            _, err, _ = self._reference_parse()
+            raise ValueError(err or 'Failed to parse %s' % self.fname)
+
+    def _values(self, dictify, parse_float, parse_int, parse_constant, items):
+        numbers = {
+            'int': parse_int,
+            'hex': lambda v: parse_int(v, base=16),
+            'float': parse_float,
+            'constant': parse_constant,
+        }
+        return self._build(numbers, None, None, dictify, None, True, False,
+                           items)
+
+    def _reference_parse(self, hook_failed=False):
+        """Parses the document with the generated parser, to report errors."""
+        return Parser(self.msg, self.fname).parse()
+
+    def _read_more(self, keep_from):
+        """Called when parsing fails at `keep_from`, which may be because the
+        rest of the input hasn't been read yet.
+
+        Returns True if more input was read, in which case the text before
+        `keep_from` may have been discarded and parsing resumes at position 0.
+        """
+        return False
+
+    def _skip_ws(self, pos):
+        return _WS.match(self.msg, pos).end()
+
+    def _build(self, numbers, string, array, dictify, null, true, false,
+               items=False):
+        """Parses the whole document, calling the given hooks as values
+        complete, and yields the document's value. `string` and `array` may
+        be None to use the parsed str and list as they are.
+
+        If `items` is true, the elements or (key, value) pairs of the
+        top-level container are yielded instead, as soon as they are parsed.
+
+        Containers being parsed are kept on an explicit stack rather than
+        recursing, so the nesting depth is not limited by the recursion limit.
+        Each entry is [is_object, elements or (key, value) pairs, key].
+
+        Every step scans a token (and the whitespace after it) completely
+        before changing any state, so that when `_read_more()` reads more
+        input the step can simply be retried.
+        """
+        skip_ws = self._skip_ws
+        stack = []
+        pos = 0
+        while True:
+            p = skip_ws(pos)
+            if p < self.end and self.msg[p] != u'/':
+                break
+            if not self._read_more(pos):
+                raise _Failure()
+            pos = 0
+        pos = p
+
+        while True:
+            # Scan the value, or the start of the container, at `pos`.
+            while True:
+                msg = self.msg
+                try:
+                    ch = msg[pos]
+                    frame = None
+                    if ch == u'{' or ch == u'[':
+                        is_object = ch == u'{'
+                        p = skip_ws(pos + 1)
+                        if msg[p] == (u'}' if is_object else u']'):
+                            kind = ch
+                            p += 1
+                        else:
+                            frame = [is_object, [], None]
+                            if is_object:
+                                frame[2], p = self._member_key(p)
+                            elif msg[p] == u'/':
+                                # A comment that hasn't been read completely.
+                                raise _Failure()
+                    elif ch == u'"' or ch == u"'":
+                        kind = 'string'
+                        v, p = self._string(pos)
+                    elif ch == u'n' and msg.startswith(u'null', pos):
+                        kind = 'null'
+                        p = pos + 4
+                    elif ch == u't' and msg.startswith(u'true', pos):
+                        kind = 'true'
+                        p = pos + 4
+                    elif ch == u'f' and msg.startswith(u'false', pos):
+                        kind = 'false'
+                        p = pos + 5
+                    else:
+                        kind, v, p = self._num_literal(pos)
+                    if p >= self.end and self._read_more(pos):
+                        pos = 0
+                        continue
+                    break
+                except (_Failure, IndexError):
+                    if not self._read_more(pos):
+                        raise
+                    pos = 0
+            pos = p
+            if frame:
+                stack.append(frame)
+                continue
+            if items and not stack and kind != u'{' and kind != u'[':
+                raise ValueError('%s: Expected an array or an object' %
+                                 self.fname)
+            if kind in numbers:
+                val = numbers[kind](v)
+            elif kind == 'string':
+                val = string(v) if string else v
+            elif kind == 'null':
+                val = null
+            elif kind == 'true':
+                val = true
+            elif kind == 'false':
+                val = false
+            elif kind == u'{':
+                val = dictify([])
+            else:
+                val = array([]) if array else []
+
+            # Add the value to its container, and close all containers that
+            # end after it.
+            while stack:
+                frame = stack[-1]
+                is_object = frame[0]
+                close = u'}' if is_object else u']'
+                while True:
+                    msg = self.msg
+                    try:
+                        p = skip_ws(pos)
+                        ch = msg[p]
+                        if ch == u',':
+                            p = skip_ws(p + 1)
+                            ch = msg[p]
+                        elif ch != close:
+                            raise _Failure()
+                        if ch != close:
+                            if is_object:
+                                key, p = self._member_key(p)
+                            elif ch == u'/':
+                                raise _Failure()
+                        else:
+                            p += 1
+                        if p >= self.end and self._read_more(pos):
+                            pos = 0
+                            continue
+                        break
+                    except (_Failure, IndexError):
+                        if not self._read_more(pos):
+                            raise
+                        pos = 0
+                pos = p
+                if items and len(stack) == 1:
+                    yield (frame[2], val) if is_object else val
+                elif is_object:
+                    frame[1].append((frame[2], val))
+                else:
+                    frame[1].append(val)
+                if ch != close:
+                    if is_object:
+                        frame[2] = key
+                    break
+                stack.pop()
+                if is_object:
+                    val = dictify(frame[1])
+                else:
+                    val = array(frame[1]) if array else frame[1]
+            else:
+                while self._read_more(pos):
+                    pos = 0
+                if skip_ws(pos) != self.end:
+                    raise _Failure()
+                if not items:
+                    yield val
+                return
+
+    def _member_key(self, pos):
+        """Parses a member's key and the following ':', and returns the key
+        and the position of the member's value."""
+        msg = self.msg
+        if msg[pos] == u'"' or msg[pos] == u"'":
+            key, pos = self._string(pos)
+        else:
+            key, pos = self._ident(pos)
+        pos = self._skip_ws(pos)
+        if msg[pos] != u':':
+            raise _Failure()
+        pos = self._skip_ws(pos + 1)
+        if msg[pos] == u'/':
+            # A comment that hasn't been read completely.
+            raise _Failure()
+        return key, pos
+
+    def _string(self, pos):
+        msg = self.msg
+        quote = msg[pos]
+        chunk = _STRING_CHUNKS[quote]
+        chunks = []
+        pos += 1
+        while True:
+            m = chunk.match(msg, pos)
+            chunks.append(m.group())
+            pos = m.end()
+            ch = msg[pos]
+            if ch == quote:
+                return u''.join(chunks), pos + 1
+            if ch != u'\\':
+                # An unescaped end of line.
+                raise _Failure()
+            ch = msg[pos + 1]
+            if ch in _ESCAPES:
+                chunks.append(_ESCAPES[ch])
+                pos += 2
+            elif ch in _HEX_ESCAPES:
+                c, pos = self._hex_escape(pos + 1)
+                chunks.append(c)
+            elif ch == u'\r' and msg.startswith(u'\n', pos + 2):
+                pos += 3
+            elif ch in _EOL_CHARS:
+                pos += 2
+            else:
+                raise _Failure()
+
+    def _hex_escape(self, pos):
+        """Decodes the `hex_esc` or `unicode_esc` starting at `pos`."""
+        n = _HEX_ESCAPES[self.msg[pos]]
+        m = _HEX.match(self.msg, pos + 1, pos + 1 + n)
+        if not m or m.end() != pos + 1 + n:
+            raise _Failure()
+        return chr(int(m.group(), base=16)), m.end()
+
+    def _ident(self, pos):
+        msg = self.msg
+        m = _ASCII_ID_START.match(msg, pos)
+        if m:
+            chars = [m.group()]
+            pos = m.end()
+        else:
+            c, pos = self._id_char(pos, _ID_START_CATEGORIES)
+            if c is None:
+                raise _Failure()
+            chars = [c]
+        while True:
+            m = _ASCII_ID_CONTINUE.match(msg, pos)
+            chars.append(m.group())
+            pos = m.end()
+            if pos == self.end or (msg[pos] < u'\x80' and msg[pos] != u'\\'):
+                break
+            c, pos = self._id_char(pos, _ID_CONTINUE_CATEGORIES)
+            if c is None:
+                break
+            chars.append(c)
+        return u''.join(chars), pos
+
+    def _id_char(self, pos, categories):
+        """Matches a single non-ASCII or escaped identifier character."""
+        msg = self.msg
+        ch = msg[pos]
+        if ch == u'\\':
+            if msg[pos + 1] != u'u':
+                return None, pos
+            try:
+                return self._hex_escape(pos + 1)
+            except _Failure:
+                return None, pos
+        if (ch == u'\u200c' or ch == u'\u200d') and (
+                categories is _ID_CONTINUE_CATEGORIES):
+            return ch, pos + 1
+        if unicodedata.category(ch) in categories:
+            return ch, pos + 1
+        return None, pos
+
+    def _is_id_start(self, pos):
+        if pos >= self.end:
+            return False
+        ch = self.msg[pos]
+        if ch < u'\x80':
+            if ch == u'\\':
+                return self._id_char(pos, _ID_START_CATEGORIES)[0] is not None
+            return ch.isalpha() or ch == u'$' or ch == u'_'
+        return unicodedata.category(ch) in _ID_START_CATEGORIES
+
+    def _num_literal(self, pos):
+        """Returns the kind of number, its text as the generated parser would
+        return it and the position after it."""
+        msg = self.msg
+        sign = u''
+        while msg[pos] == u'-':
+            sign += u'-'
+            pos += 1
+        m = _DEC_LITERAL.match(msg, pos)
+        if m and not self._is_id_start(m.end()):
+            v, exp = m.group(2, 3)
+            if exp is not None:
+                return 'float', sign + v + u'e' + exp, m.end()
+            if u'.' in v:
+                return 'float', sign + v, m.end()
+            return 'int', sign + v, m.end()
+        if msg.startswith(u'0x', pos) or msg.startswith(u'0X', pos):
+            m = _HEX.match(msg, pos + 2)
+            if m:
+                return 'hex', sign + u'0x' + m.group(), m.end()
+        for name in (u'Infinity', u'NaN'):
+            if msg.startswith(name, pos):
+                return 'constant', sign + name, pos + len(name)
+        raise _Failure()
+
+
+class StreamParser(FastParser):
+    """A `FastParser` that reads the document from a file-like object while
+    parsing it, so that only the part of the text that is being parsed is
+    kept in memory.
+
+    `fp` only needs a `read(size)` method, returning either text or bytes,
+    so it can be a buffered reader or an `mmap.mmap` as well as a text file.
+    If `fp` is seekable, errors are reported by reading the whole document
+    again and parsing it with the generated parser, just like `FastParser`
+    does. Otherwise they are reported at the start of the token that failed
+    to parse.
+    """
+
+    def __init__(self, fp, fname, encoding=None, chunk_size=65536):
+        super(StreamParser, self).__init__(u'', fname)
+        self.fp = fp
+        self.eof = False
+        self.empty = True
+        self.errpos = 0
+        self._encoding = encoding or 'utf-8'
+        self._decoder = None
+        self._chunk_size = chunk_size
+        # The line and column of self.msg[0] in the document.
+        self._line = 1
+        self._column = 1
+        try:
+            if hasattr(fp, 'seekable') and not fp.seekable():
+                self._start = None
+            else:
+                self._start = fp.tell()
+        except (AttributeError, OSError, ValueError):
+            self._start = None
+
+    def _read_more(self, keep_from):
+        if self.eof:
+            self.errpos = self._skip_ws(keep_from)
+            return False
+        dropped = self.msg[:keep_from]
+        newlines = dropped.count(u'\n')
+        if newlines:
+            self._line += newlines
+            self._column = keep_from - dropped.rindex(u'\n')
+        else:
+            self._column += keep_from
+
+        # Read at least as much as is being kept, so that scanning a long
+        # token again after every read stays linear overall.
+        chunk = self.fp.read(max(self._chunk_size, self.end - keep_from))
+        if not chunk:
+            self.eof = True
+        if not isinstance(chunk, str):
+            if self._decoder is None:
+                self._decoder = codecs.getincrementaldecoder(
+                    self._encoding)()
+            chunk = self._decoder.decode(chunk, final=self.eof)
+        if chunk:
+            self.empty = False
+        self.msg = self.msg[keep_from:] + chunk
+        self.end = len(self.msg)
+        return True
+
+    def _reference_parse(self, hook_failed=False):
+        if self._start is not None:
+            self.fp.seek(self._start)
+            msg = self.fp.read()
+            if not isinstance(msg, str):
+                msg = msg.decode(self._encoding)
+            return Parser(msg, self.fname).parse()
+        if hook_failed:
+            return None, None, None
+        return None, self._err_str(), None
+
+    def _err_str(self):
+        prefix = self.msg[:self.errpos]
+        newlines = prefix.count(u'\n')
+        if newlines:
+            colno = self.errpos - prefix.rindex(u'\n')
+        else:
+            colno = self._column + self.errpos
+        if self.errpos >= self.end:
+            thing = 'end of input'
+        else:
+            thing = '"%s"' % self.msg[self.errpos]
+        return '%s:%d Unexpected %s at column %d' % (
+            self.fname, self._line + newlines, thing, colno)
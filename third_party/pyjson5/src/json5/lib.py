@@ -12,11 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import re
 import json
 import sys
 
-from .parser import Parser
+from . import encoder
+from .fast_parser import FastParser, StreamParser
 
 
 if sys.version_info[0] < 3:
@@ -27,13 +27,23 @@ if sys.version_info[0] < 3:
 def load(fp, encoding=None, cls=None, object_hook=None, parse_float=None,
          parse_int=None, parse_constant=None, object_pairs_hook=None):
     """Deserialize ``fp`` (a ``.read()``-supporting file-like object
-    containing a JSON document) to a Python object."""
+    containing a JSON document) to a Python object.
 
-    s = fp.read()
-    return loads(s, encoding=encoding, cls=cls, object_hook=object_hook,
-                 parse_float=parse_float, parse_int=parse_int,
-                 parse_constant=parse_constant,
-                 object_pairs_hook=object_pairs_hook)
+    The document is parsed while it is being read, so the whole text is
+    never held in memory at once. ``fp`` may return text or bytes, so a
+    file opened in binary mode or an ``mmap.mmap`` can be passed as well."""
+
+    assert cls is None, 'Custom decoders are not supported'
+
+    parser = StreamParser(fp, '<string>', encoding)
+    value, err, _ = parser.parse_values(*_hooks(
+        object_hook, parse_float, parse_int, parse_constant,
+        object_pairs_hook))
+    if err:
+        if parser.empty:
+            raise ValueError('Empty strings are not legal JSON5')
+        raise ValueError(err)
+    return value
 
 
 def loads(s, encoding=None, cls=None, object_hook=None, parse_float=None,
@@ -53,107 +63,166 @@ def loads(s, encoding=None, cls=None, object_hook=None, parse_float=None,
 
     if not s:
         raise ValueError('Empty strings are not legal JSON5')
-    parser = Parser(s, '<string>')
-    ast, err, newpos = parser.parse()
+
+    parser = FastParser(s, '<string>')
+    value, err, _ = parser.parse_values(*_hooks(
+        object_hook, parse_float, parse_int, parse_constant,
+        object_pairs_hook))
     if err:
         raise ValueError(err)
+    return value
+
 
-    def _fp_constant_parser(s):
-        return float(s.replace('Infinity', 'inf').replace('NaN', 'nan'))
+def iterload(fp, encoding=None, object_hook=None, parse_float=None,
+             parse_int=None, parse_constant=None, object_pairs_hook=None):
+    """Incrementally deserialize ``fp`` (a ``.read()``-supporting file-like
+    object containing a JSON5 array or object).
 
+    Yields the elements of the top-level array, or the ``(key, value)``
+    pairs of the top-level object, as soon as each of them has been read.
+    Syntax errors are raised as ``ValueError`` when they are reached, so
+    items before them will already have been yielded."""
+
+    parser = StreamParser(fp, '<string>', encoding)
+    return parser.iter_values(*_hooks(
+        object_hook, parse_float, parse_int, parse_constant,
+        object_pairs_hook))
+
+
+def _fp_constant_parser(s):
+    return float(s.replace('Infinity', 'inf').replace('NaN', 'nan'))
+
+
+def _hooks(object_hook, parse_float, parse_int, parse_constant,
+           object_pairs_hook):
+    """Returns the hooks the parsers call to build values."""
     if object_pairs_hook:
         dictify = object_pairs_hook
     elif object_hook:
         dictify = lambda pairs: object_hook(dict(pairs))
     else:
         dictify = dict
-
-    parse_float = parse_float or float
-    parse_int = parse_int or int
-    parse_constant = parse_constant or _fp_constant_parser
-
-    return _walk_ast(ast, dictify, parse_float, parse_int, parse_constant)
+    return (dictify, parse_float or float, parse_int or int,
+            parse_constant or _fp_constant_parser)
 
 
 def _walk_ast(el, dictify, parse_float, parse_int, parse_constant):
-    if el == 'None':
-        return None
-    if el == 'True':
-        return True
-    if el == 'False':
-        return False
-    ty, v = el
-    if ty == 'number':
-        if v.startswith('0x') or v.startswith('0X'):
-            return parse_int(v, base=16)
-        elif '.' in v or 'e' in v or 'E' in v:
-            return parse_float(v)
-        elif 'Infinity' in v or 'NaN' in v:
-            return parse_constant(v)
+    # Containers are kept on an explicit stack rather than recursing, so that
+    # deeply nested documents don't hit the recursion limit. Each entry is
+    # (type, child ASTs, values of the children walked so far).
+    stack = []
+    while True:
+        if el == 'None':
+            value = None
+        elif el == 'True':
+            value = True
+        elif el == 'False':
+            value = False
         else:
-            return parse_int(v)
-    if ty == 'string':
-        return v
-    if ty == 'object':
-        pairs = []
-        for key, val_expr in v:
-            val = _walk_ast(val_expr, dictify, parse_float, parse_int,
-                            parse_constant)
-            pairs.append((key, val))
-        return dictify(pairs)
-    if ty == 'array':
-        return [_walk_ast(el, dictify, parse_float, parse_int, parse_constant)
-                for el in v]
-    raise Exception('unknown el: ' + el)  # pragma: no cover
-
-
-_notletter = re.compile('\W')
-
-
-def _dumpkey(k):
-    if _notletter.search(k):
-        return json.dumps(k)
-    else:
-        return str(k)
-
-
-def dumps(obj, compact=False, as_json=False, **kwargs):
-    """Serialize ``obj`` to a JSON5-formatted ``str``."""
-
-    if as_json or not compact:
-        return json.dumps(obj, **kwargs)
-
-    t = type(obj)
-    if obj == True:
-        return u'true'
-    elif obj == False:
-        return u'false'
-    elif obj == None:
-        return u'null'
-    elif t == type('') or t == type(u''):
-        single = "'" in obj
-        double = '"' in obj
-        if single and double:
-            return json.dumps(obj)
-        elif single:
-            return '"' + obj + '"'
+            ty, v = el
+            if ty == 'number':
+                value = _number(v, parse_float, parse_int, parse_constant)
+            elif ty == 'string':
+                value = v
+            elif ty == 'object' or ty == 'array':
+                if v:
+                    stack.append((ty, v, []))
+                    el = v[0][1] if ty == 'object' else v[0]
+                    continue
+                value = dictify([]) if ty == 'object' else []
+            else:
+                raise Exception('unknown el: ' + el)  # pragma: no cover
+
+        while stack:
+            ty, children, values = stack[-1]
+            values.append(value)
+            if len(values) < len(children):
+                el = children[len(values)]
+                if ty == 'object':
+                    el = el[1]
+                break
+            stack.pop()
+            if ty == 'object':
+                value = dictify([(key, val) for (key, _), val in
+                                 zip(children, values)])
+            else:
+                value = values
         else:
-            return "'" + obj + "'"
-    elif t is float or t is int:
-        return str(obj)
-    elif t is dict:
-        return u'{' + u','.join([
-            _dumpkey(k) + u':' + dumps(v) for k, v in obj.items()
-        ]) + '}'
-    elif t is list:
-        return u'[' + ','.join([dumps(el) for el in obj]) + u']'
-    else:  # pragma: no cover
-        return u''
-
-
-def dump(obj, fp, **kwargs):
+            return value
+
+
+def _number(v, parse_float, parse_int, parse_constant):
+    if v.lstrip('-').startswith('0x'):
+        return parse_int(v, base=16)
+    elif '.' in v or 'e' in v:
+        return parse_float(v)
+    elif 'Infinity' in v or 'NaN' in v:
+        return parse_constant(v)
+    else:
+        return parse_int(v)
+
+
+def dumps(obj, compact=False, as_json=False, as_json5=False, indent=None,
+          sort_keys=False, quote_keys=False, quote_style=None,
+          check_circular=True, **kwargs):
+    """Serialize ``obj`` to a JSON5-formatted ``str``.
+
+    By default, ``obj`` is serialized to JSON with ``json.dumps()``, which
+    is also passed ``indent``, ``sort_keys``, ``check_circular`` and any
+    other keyword arguments. ``compact`` or ``as_json5`` produce JSON5
+    instead, unless ``as_json`` is also given.
+
+    For JSON5, ``compact`` omits the spaces after separators. A non-negative
+    ``indent`` (a number of spaces or a string) puts every member and
+    element on its own line. ``sort_keys`` writes the members of objects
+    sorted by key.
+
+    Keys that are identifiers are written without quotes unless
+    ``quote_keys`` is true. Other keys are quoted with double quotes, as in
+    JSON, and strings with single quotes, or with double quotes if they
+    contain a single quote; ``quote_style`` can be 'single' or 'double' to
+    always use that quote for both. ``check_circular`` raises
+    ``ValueError`` for objects that contain themselves."""
+
+    if _writes_json(compact, as_json, as_json5, quote_keys, quote_style):
+        return json.dumps(obj, indent=indent, sort_keys=sort_keys,
+                          check_circular=check_circular, **kwargs)
+    _check_no_json_arguments(kwargs)
+    return encoder.encode(obj, compact, indent, sort_keys, quote_keys,
+                          quote_style, check_circular)
+
+
+def dump(obj, fp, compact=False, as_json=False, as_json5=False, indent=None,
+         sort_keys=False, quote_keys=False, quote_style=None,
+         check_circular=True, **kwargs):
     """Serialize ``obj`` to a JSON5-formatted stream to ``fp`` (a ``.write()``-
-    supporting file-like object)."""
+    supporting file-like object).
+
+    The output is written in chunks while it is being produced. See
+    ``dumps()`` for the other arguments."""
+
+    if _writes_json(compact, as_json, as_json5, quote_keys, quote_style):
+        chunks = json.JSONEncoder(indent=indent, sort_keys=sort_keys,
+                                  check_circular=check_circular,
+                                  **kwargs).iterencode(obj)
+    else:
+        _check_no_json_arguments(kwargs)
+        chunks = encoder.iterencode(obj, compact, indent, sort_keys,
+                                    quote_keys, quote_style, check_circular)
+    for chunk in chunks:
+        fp.write(str(chunk))
+
+
+def _writes_json(compact, as_json, as_json5, quote_keys, quote_style):
+    if not as_json and (compact or as_json5):
+        return False
+    if quote_keys or quote_style is not None:
+        raise TypeError('quote_keys and quote_style only apply to JSON5, '
+                        'pass as_json5=True')
+    return True
+
 
-    s = dumps(obj, **kwargs)
-    fp.write(str(s))
+def _check_no_json_arguments(kwargs):
+    if kwargs:
+        raise TypeError('%s only supported for JSON output' %
+                        ', '.join(sorted(kwargs)))
@@ -1,6 +1,7 @@
 # pylint: disable=line-too-long
 
 import sys
+import time
 
 
 if sys.version_info[0] < 3:
@@ -10,8 +11,52 @@ if sys.version_info[0] < 3:
     str = unicode
 
 
+# Local modifications (not generated from json5.g):
+#
+# - Rules can be memoized ("packrat parsing"). Every rule in `RULES` can be
+#   memoized; those in `MEMOIZED_RULES` are by default, as every alternative
+#   of `dec_literal` parses them again at the same position. Memoizing the
+#   other rules costs more than parsing them again, which can be checked
+#   with `benchmarks/run.py --rule-stats`. At most `max_cache_entries`
+#   results are kept: the cache is cleared when it is full, as backtracking
+#   never goes far back.
+# - `_cut_` commits to the alternative of the innermost `_choose()` it
+#   appears in: if the alternative fails after the cut, the remaining
+#   alternatives are not tried. Cuts are only placed where the remaining
+#   alternatives can't match and wouldn't fail further into the input, so
+#   they change neither the results nor the error messages.
+# - If `stats` is a dict, it is filled with a `RuleStats` per rule.
+
+RULES = (
+    'grammar', 'sp', 'ws', 'eol', 'comment', 'value', 'object', 'array',
+    'string', 'sqchar', 'dqchar', 'bslash', 'squote', 'dquote', 'esc_char',
+    'hex_esc', 'unicode_esc', 'element_list', 'member_list', 'member', 'ident',
+    'id_start', 'ascii_id_start', 'other_id_start', 'id_continue',
+    'num_literal', 'dec_literal', 'dec_int_lit', 'digit', 'nonzerodigit',
+    'hex_literal', 'hex', 'frac', 'exp',
+)
+
+MEMOIZED_RULES = ('dec_int_lit', 'frac')
+
+DEFAULT_MAX_CACHE_ENTRIES = 1024
+
+
+class RuleStats(object):
+    def __init__(self):
+        self.calls = 0
+        self.hits = 0
+        # Includes the time spent in nested calls, including nested calls of
+        # the same rule.
+        self.seconds = 0.0
+
+    @property
+    def misses(self):
+        return self.calls - self.hits
+
+
 class Parser(object):
-    def __init__(self, msg, fname):
+    def __init__(self, msg, fname, memoize=MEMOIZED_RULES,
+                 max_cache_entries=DEFAULT_MAX_CACHE_ENTRIES, stats=None):
         self.msg = str(msg)
         self.end = len(self.msg)
         self.fname = fname
@@ -21,6 +66,58 @@ class Parser(object):
         self.errpos = 0
         self._scopes = []
         self._cache = {}
+        self._max_cache_entries = max_cache_entries
+        self._committed = False
+        # Only the wrapped rules are overridden on the instance, as adding
+        # many attributes slows down the lookup of all of them.
+        for name in RULES:
+            if stats is None and name not in memoize:
+                continue
+            rule = getattr(self, '_%s_' % name)
+            rule_stats = None
+            if stats is not None:
+                rule_stats = stats[name] = RuleStats()
+            if name in memoize:
+                rule = self._memoized(name, rule, rule_stats)
+            if rule_stats is not None:
+                rule = self._timed(rule, rule_stats)
+            setattr(self, '_%s_' % name, rule)
+
+    def _memoized(self, name, rule, stats):
+        cache = self._cache
+
+        def memoized_rule():
+            key = (name, self.pos)
+            entry = cache.get(key)
+            if entry is not None:
+                self.val, self.failed, self.pos, errpos = entry
+                if errpos > self.errpos:
+                    self.errpos = errpos
+                if stats is not None:
+                    stats.hits += 1
+                return
+            # Record how far into the input the rule failed, so that a
+            # cached result updates `errpos` just like parsing again would.
+            errpos = self.errpos
+            self.errpos = 0
+            rule()
+            entry = (self.val, self.failed, self.pos, self.errpos)
+            if errpos > self.errpos:
+                self.errpos = errpos
+            if len(cache) >= self._max_cache_entries:
+                cache.clear()
+            cache[key] = entry
+
+        return memoized_rule
+
+    def _timed(self, rule, stats):
+        def timed_rule():
+            start = time.time()
+            rule()
+            stats.seconds += time.time() - start
+            stats.calls += 1
+
+        return timed_rule
 
     def parse(self):
         self._grammar_()
@@ -120,6 +217,34 @@ class Parser(object):
             self._rewind(p)
         rules[-1]()
 
+    def _choose_cut(self, rules):
+        """Like `_choose()`, but stops at an alternative that failed after
+        reaching a `_cut_`."""
+        p = self.pos
+        committed = self._committed
+        self._committed = False
+        for rule in rules[:-1]:
+            rule()
+            if not self.failed or self._committed:
+                break
+            self._rewind(p)
+        else:
+            rules[-1]()
+        self._committed = committed
+
+    def _cut_(self):
+        self._committed = True
+        self._succeed(None)
+
+    def _peek_cut(self, chars):
+        """Cuts if the next character is one of `chars`, and fails otherwise,
+        without consuming anything."""
+        p = self.pos
+        if p < self.end and self.msg[p] in chars:
+            self._cut_()
+        else:
+            self._fail()
+
     def _ch(self, ch):
         p = self.pos
         if p < self.end and self.msg[p] == ch:
@@ -229,10 +354,10 @@ class Parser(object):
         self._ch(u'\u2029')
 
     def _comment_(self):
-        self._choose([self._comment__c0_, self._comment__c1_])
+        self._choose_cut([self._comment__c0_, self._comment__c1_])
 
     def _comment__c0_(self):
-        self._seq([lambda: self._str('//', 2),
+        self._seq([lambda: self._str('//', 2), self._cut_,
                    lambda: self._star(self._comment__c0__s1_p_)])
 
     def _comment__c0__s1_p_(self):
@@ -249,9 +374,10 @@ class Parser(object):
         self._not(lambda: self._str('*/', 2))
 
     def _value_(self):
-        self._choose([self._value__c0_, self._value__c1_, self._value__c2_,
-                      self._value__c3_, self._value__c4_, self._value__c5_,
-                      self._value__c6_])
+        self._choose_cut([self._value__c0_, self._value__c1_,
+                          self._value__c2_, self._value__c3_,
+                          self._value__c4_, self._value__c5_,
+                          self._value__c6_])
 
     def _value__c0_(self):
         self._seq([lambda: self._str('null', 4), lambda: self._succeed('None')])
@@ -265,19 +391,22 @@ class Parser(object):
 
     def _value__c3_(self):
         self._push('value__c3')
-        self._seq([lambda: self._bind(self._object_, 'v'),
+        self._seq([lambda: self._peek_cut('{'),
+                   lambda: self._bind(self._object_, 'v'),
                    lambda: self._succeed(['object', self._get('v')])])
         self._pop('value__c3')
 
     def _value__c4_(self):
         self._push('value__c4')
-        self._seq([lambda: self._bind(self._array_, 'v'),
+        self._seq([lambda: self._peek_cut('['),
+                   lambda: self._bind(self._array_, 'v'),
                    lambda: self._succeed(['array', self._get('v')])])
         self._pop('value__c4')
 
     def _value__c5_(self):
         self._push('value__c5')
-        self._seq([lambda: self._bind(self._string_, 'v'),
+        self._seq([lambda: self._peek_cut('\'"'),
+                   lambda: self._bind(self._string_, 'v'),
                    lambda: self._succeed(['string', self._get('v')])])
         self._pop('value__c5')
 
@@ -288,12 +417,13 @@ class Parser(object):
         self._pop('value__c6')
 
     def _object_(self):
-        self._choose([self._object__c0_, self._object__c1_])
+        self._choose_cut([self._object__c0_, self._object__c1_])
 
     def _object__c0_(self):
         self._push('object__c0')
         self._seq([lambda: self._ch('{'), self._sp_,
-                   lambda: self._bind(self._member_list_, 'v'), self._sp_,
+                   lambda: self._bind(self._member_list_, 'v'), self._cut_,
+                   self._sp_,
                    lambda: self._ch('}'), lambda: self._succeed(self._get('v'))])
         self._pop('object__c0')
 
@@ -302,12 +432,13 @@ class Parser(object):
                    lambda: self._succeed([])])
 
     def _array_(self):
-        self._choose([self._array__c0_, self._array__c1_])
+        self._choose_cut([self._array__c0_, self._array__c1_])
 
     def _array__c0_(self):
         self._push('array__c0')
         self._seq([lambda: self._ch('['), self._sp_,
-                   lambda: self._bind(self._element_list_, 'v'), self._sp_,
+                   lambda: self._bind(self._element_list_, 'v'), self._cut_,
+                   self._sp_,
                    lambda: self._ch(']'), lambda: self._succeed(self._get('v'))])
         self._pop('array__c0')
 
@@ -316,11 +447,12 @@ class Parser(object):
                    lambda: self._succeed([])])
 
     def _string_(self):
-        self._choose([self._string__c0_, self._string__c1_])
+        self._choose_cut([self._string__c0_, self._string__c1_])
 
     def _string__c0_(self):
         self._push('string__c0')
-        self._seq([self._squote_, self._string__c0__s1_, self._squote_,
+        self._seq([self._squote_, self._cut_, self._string__c0__s1_,
+                   self._squote_,
                    lambda: self._succeed(self._join('', self._get('cs')))])
         self._pop('string__c0')
 
@@ -483,11 +615,12 @@ class Parser(object):
         self._opt(lambda: self._ch(','))
 
     def _member_(self):
-        self._choose([self._member__c0_, self._member__c1_])
+        self._choose_cut([self._member__c0_, self._member__c1_])
 
     def _member__c0_(self):
         self._push('member__c0')
-        self._seq([lambda: self._bind(self._string_, 'k'), self._sp_,
+        self._seq([lambda: self._bind(self._string_, 'k'), self._cut_,
+                   self._sp_,
                    lambda: self._ch(':'), self._sp_,
                    lambda: self._bind(self._value_, 'v'),
                    lambda: self._succeed([self._get('k'), self._get('v')])])
@@ -711,13 +844,13 @@ class Parser(object):
         self._ch(u'\u200d')
 
     def _num_literal_(self):
-        self._choose([self._num_literal__c0_, self._num_literal__c1_,
-                      self._hex_literal_, self._num_literal__c3_,
-                      self._num_literal__c4_])
+        self._choose_cut([self._num_literal__c0_, self._num_literal__c1_,
+                          self._hex_literal_, self._num_literal__c3_,
+                          self._num_literal__c4_])
 
     def _num_literal__c0_(self):
         self._push('num_literal__c0')
-        self._seq([lambda: self._ch('-'),
+        self._seq([lambda: self._ch('-'), self._cut_,
                    lambda: self._bind(self._num_literal_, 'n'),
                    lambda: self._succeed('-' + self._get('n'))])
         self._pop('num_literal__c0')
@@ -13,13 +13,21 @@
 # limitations under the License.
 
 import io
+import json
 import math
+import mmap
 import os
+import shutil
 import sys
+import tempfile
+import unicodedata
 import unittest
 
 import json5
 
+from json5.fast_parser import FastParser, StreamParser
+from json5.parser import RULES, Parser
+
 
 class TestLoads(unittest.TestCase):
     maxDiff = None
@@ -78,6 +86,9 @@ class TestLoads(unittest.TestCase):
         self.check('1.5e3', 1500.0)
         self.check('-0.5e-2', -0.005)
 
+        # hex literals may be negative
+        self.check('-0x1F', -31)
+
         # names
         self.check('Infinity', float('inf'))
         self.check('-Infinity', float('-inf'))
@@ -101,6 +112,17 @@ class TestLoads(unittest.TestCase):
     def test_identifiers_unicode(self):
         self.check(u'{\xc3: 1}', {u'\xc3': 1})
 
+    def test_nesting_is_not_limited_by_recursion_limit(self):
+        depth = sys.getrecursionlimit() * 2
+        obj = json5.loads('[' * depth + ']' * depth)
+        for _ in range(depth - 1):
+            obj = obj[0]
+        self.assertEqual(obj, [])
+        obj = json5.loads('{a:' * depth + '1' + '}' * depth)
+        for _ in range(depth):
+            obj = obj['a']
+        self.assertEqual(obj, 1)
+
     def test_null(self):
         self.check('null', None)
 
@@ -135,6 +157,10 @@ class TestLoads(unittest.TestCase):
     def test_parse_int(self):
         hook = lambda x, base=10: x
         self.assertEqual(json5.loads('1', parse_int=hook), '1')
+        self.assertEqual(json5.loads('0XaB', parse_int=hook), '0xaB')
+
+    def test_syntax_errors_take_precedence_over_hook_errors(self):
+        self.check_fail('[., 1 2]', '<string>:1 Unexpected "]" at column 8')
 
     def test_sample_file(self):
         path = os.path.join(os.path.dirname(__file__), '..', '..',
@@ -208,12 +234,237 @@ class TestLoads(unittest.TestCase):
         self.check(u'\u2029 1', 1)
 
 
+class TestFastParser(unittest.TestCase):
+    maxDiff = None
+
+    def check(self, s):
+        self.assertEqual(FastParser(s, '<string>').parse(),
+                         Parser(s, '<string>').parse())
+
+    def test_matches_reference_parser(self):
+        for s in [
+                u'{a: [1, -0x1F, .5E3, "x", null, true, Infinity, +1]}',
+                u'[1., 1e, 1e+, -NaN, --1, 0XaB, 0, 0.0e-0]',
+                u"{'a': {}, \"b\": [], c_$: [[]], d: {e: 1,},}",
+                u'/* block */ // line\n\u3000\ufeff 1 /**/',
+                u'"\\x41\\u0042\\b\\f\\n\\r\\t\\v\\\\\\\'\\"\\\r\\nc"',
+                u"'a\\\rb\\\u2028c'",
+                u'{\xe9\u0301\u0660\u200c: 1, \\u0041b: 2, a\\u0042: 3}',
+        ]:
+            self.check(s)
+
+    def test_errors_match_reference_parser(self):
+        for s in [
+                u'14d', u'01', u'0x', u'{1: 1}', u'[1 2]', u'[,]', u'{a}',
+                u'{a: 1,,}', u'"\n"', u"'\\a'", u"'\\u00j0'", u'/* 1',
+                u'1 /', u'nul', u'+Infinity', u'{\\x41: 1}', u'[1, 2',
+        ]:
+            self.check(s)
+
+    def test_values_match_walked_ast(self):
+        s = u'{a: [1, -0x1F, .5E3, "x", null, true, -Infinity], b: {c: {}}}'
+        hooks = (lambda pairs: ('object', pairs), lambda v: ('float', v),
+                 lambda v, base=10: ('int', v, base), lambda v: ('const', v))
+        ast, _, _ = Parser(s, '<string>').parse()
+        self.assertEqual(
+            FastParser(s, '<string>').parse_values(*hooks),
+            (json5.lib._walk_ast(ast, *hooks), None, len(s)))
+
+    def test_zs_characters_are_whitespace(self):
+        for c in range(0x3001):
+            if unicodedata.category(chr(c)) == 'Zs':
+                self.check(chr(c) + u'1')
+
+
+class TestParser(unittest.TestCase):
+    def test_memoization_and_cuts_do_not_change_results(self):
+        for s in [
+                u'{a: [1, -0x1F, .5E3, 1e5, 1.5, "x", null, true, -Infinity]}',
+                u"{'a': {}, \"b\": [], c_$: [[]], d: {e: 1,},} // c",
+                u'14d', u'[1 2]', u'{a: 1,,}', u"'\\a'", u'/* 1', u'-+1.5e',
+                u'{"a": 1, b: [1, 2, {c: 3 4}]}', u'[0x, 1]',
+        ]:
+            expected = Parser(s, '<string>', memoize=()).parse()
+            self.assertEqual(Parser(s, '<string>').parse(), expected)
+            self.assertEqual(Parser(s, '<string>', memoize=RULES).parse(),
+                             expected)
+            self.assertEqual(Parser(s, '<string>', memoize=RULES,
+                                    max_cache_entries=2).parse(), expected)
+
+    def test_stats(self):
+        stats = {}
+        Parser(u'[1.5, 2.5]', '<string>', stats=stats).parse()
+        self.assertEqual(set(stats), set(RULES))
+        self.assertEqual(stats['value'].calls, 3)
+        self.assertEqual(stats['value'].hits, 0)
+        self.assertGreater(stats['dec_int_lit'].hits, 0)
+        self.assertEqual(stats['dec_int_lit'].misses, 2)
+
+
+class _UnseekableStringIO(io.StringIO):
+    def seekable(self):
+        return False
+
+
+class TestLoad(unittest.TestCase):
+    maxDiff = None
+
+    def check(self, s, obj):
+        for chunk_size in (1, 2, 3, 65536):
+            for fp in (io.StringIO(s), _UnseekableStringIO(s),
+                       io.BytesIO(s.encode('utf-8'))):
+                parser = StreamParser(fp, '<string>', chunk_size=chunk_size)
+                self.assertEqual(
+                    parser.parse_values(dict, float, int, float),
+                    (obj, None, parser.end))
+
+    def test_chunk_boundaries(self):
+        self.check(u'[1, // c\n 2, /* c */ 3]', [1, 2, 3])
+        self.check(u'{a: /* c */ "b\\\r\nc", \'d\': 0x1F, e: 1.5e3}',
+                   {'a': 'bc', 'd': 31, 'e': 1500.0})
+        self.check(u'\r\n/* a */ // b\n{\xe9\u0301: [[], {}, null]} // c',
+                   {u'\xe9\u0301': [[], {}, None]})
+        self.check(u'"\u20ac\U0001f600"', u'\u20ac\U0001f600')
+
+    def test_empty(self):
+        self.assertRaises(ValueError, json5.load, io.StringIO(u' '))
+        try:
+            json5.load(io.StringIO(u''))
+            self.fail()  # pragma: no cover
+        except ValueError as e:
+            self.assertEqual('Empty strings are not legal JSON5', str(e))
+
+    def test_errors(self):
+        try:
+            json5.load(io.StringIO(u'[1,\n 2 3]'))
+            self.fail()  # pragma: no cover
+        except ValueError as e:
+            self.assertEqual('<string>:2 Unexpected "]" at column 5', str(e))
+
+        # Errors in streams that can't be read again are reported where the
+        # fast parser failed.
+        parser = StreamParser(_UnseekableStringIO(u'[1,\n 2 3]'), '<string>',
+                              chunk_size=2)
+        self.assertEqual(parser.parse_values(dict, float, int, float)[1],
+                         '<string>:2 Unexpected "3" at column 4')
+
+    def test_mmap(self):
+        path = os.path.join(os.path.dirname(__file__), '..', '..',
+                            'sample.json5')
+        with open(path, 'rb') as fp:
+            mm = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                self.assertEqual(json5.load(mm), json5.loads(fp.read()))
+            finally:
+                mm.close()
+
+
+class TestIterLoad(unittest.TestCase):
+    def test_array(self):
+        self.assertEqual(list(json5.iterload(io.StringIO(u'[1, [2], {a: 3},]'))),
+                         [1, [2], {'a': 3}])
+        self.assertEqual(list(json5.iterload(io.StringIO(u'[]'))), [])
+
+    def test_object(self):
+        self.assertEqual(
+            list(json5.iterload(io.StringIO(u'{a: 1, "b": [2]}'))),
+            [('a', 1), ('b', [2])])
+
+    def test_items_are_yielded_before_errors(self):
+        items = json5.iterload(io.StringIO(u'[1, 2 3]'))
+        self.assertEqual(next(items), 1)
+        self.assertRaises(ValueError, next, items)
+
+    def test_scalars_are_errors(self):
+        self.assertRaises(ValueError, list, json5.iterload(io.StringIO(u'1')))
+
+
+class TestParseCache(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_hits(self):
+        for fmt in json5.cache.FORMATS:
+            cache = json5.ParseCache(self.directory, fmt)
+            doc = u'{a: [1, 2.5, -Infinity, "\u00e9"], b: {c: null}}'
+            expected = json5.loads(doc)
+            self.assertEqual(cache.loads(doc), expected)
+            self.assertEqual(cache.loads(doc.encode('utf-8')), expected)
+            self.assertEqual((cache.hits, cache.misses), (1, 1))
+            self.assertEqual(list(cache.loads(doc)), ['a', 'b'])
+
+    def test_load_file(self):
+        file_name = os.path.join(self.directory, 'doc.json5')
+        with open(file_name, 'w') as f:
+            f.write(u'[1, 2]')
+        cache = json5.ParseCache(os.path.join(self.directory, 'cache'))
+        self.assertEqual(cache.load_file(file_name), [1, 2])
+        self.assertEqual(cache.load_file(file_name), [1, 2])
+        with open(file_name, 'w') as f:
+            f.write(u'[3]')
+        self.assertEqual(cache.load_file(file_name), [3])
+        self.assertEqual((cache.hits, cache.misses), (1, 2))
+
+    def test_formats_and_versions_do_not_share_entries(self):
+        json5.ParseCache(self.directory, 'json').loads(u'[1]')
+        cache = json5.ParseCache(self.directory, 'marshal')
+        cache.loads(u'[1]')
+        self.assertEqual(cache.misses, 1)
+        cache._version_key += b'x'
+        cache.loads(u'[1]')
+        self.assertEqual(cache.misses, 2)
+
+    def test_corrupt_entries(self):
+        cache = json5.ParseCache(self.directory)
+        cache.loads(u'[1]')
+        for name in os.listdir(self.directory):
+            with open(os.path.join(self.directory, name), 'wb') as f:
+                f.write(b'\xff')
+        self.assertEqual(cache.loads(u'[1]'), [1])
+        self.assertEqual(cache.misses, 2)
+
+    def test_errors_are_not_cached(self):
+        cache = json5.ParseCache(self.directory)
+        self.assertRaises(ValueError, cache.loads, u'[1 2]')
+        self.assertRaises(ValueError, cache.loads, u'[1 2]')
+        self.assertEqual(os.listdir(self.directory), [])
+
+    def test_clear(self):
+        cache = json5.ParseCache(self.directory)
+        cache.loads(u'[1]')
+        cache.clear()
+        self.assertEqual(os.listdir(self.directory), [])
+
+
 class TestDump(unittest.TestCase):
     def test_basic(self):
         sio = io.StringIO()
         json5.dump(True, sio)
         self.assertEqual('true', sio.getvalue())
 
+    def test_matches_dumps(self):
+        obj = {'a': [1, 2.5, {'b c': None, 'd': ["'", '"']}], 'e': {}}
+        for kwargs in [{}, {'indent': 2}, {'compact': True},
+                       {'as_json5': True, 'indent': 2},
+                       {'as_json5': True, 'quote_keys': True,
+                        'quote_style': 'double'}]:
+            sio = io.StringIO()
+            json5.dump(obj, sio, **kwargs)
+            self.assertEqual(sio.getvalue(), json5.dumps(obj, **kwargs))
+
+    def test_writes_chunks(self):
+        chunks = []
+        class Writer(object):
+            def write(self, s):
+                chunks.append(s)
+        obj = [list(range(10))] * 1000
+        json5.dump(obj, Writer(), as_json5=True)
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual(json5.loads(''.join(chunks)), obj)
+
 
 class TestDumps(unittest.TestCase):
     maxDiff = None
@@ -238,6 +489,95 @@ class TestDumps(unittest.TestCase):
     def test_objects(self):
         self.check({'foo': 1}, '{foo:1}')
         self.check({'foo bar': 1}, '{"foo bar":1}')
+        self.check({'$_a1': {'1a': {}}}, '{$_a1:{"1a":{}}}')
+        self.check({1: 2, 2.5: 3, False: 4, None: 5},
+                   '{"1":2,"2.5":3,false:4,null:5}')
+        self.check({'a b': 'a b', 'c': 'c'}, """{"a b":'a b',c:'c'}""")
+
+    def test_nested(self):
+        self.check({'a': [{'b': 'c'}, []]}, "{a:[{b:'c'},[]]}")
+        self.assertEqual(json5.dumps({'a': [1, 'b']}, as_json5=True),
+                         "{a: [1, 'b']}")
+
+    def test_json_by_default(self):
+        obj = {'a b': [1, 'c', None], 'd': 1.5}
+        self.assertEqual(json5.dumps(obj), json.dumps(obj))
+        self.assertEqual(json5.dumps(obj, indent=2, sort_keys=True),
+                         json.dumps(obj, indent=2, sort_keys=True))
+        self.assertEqual(json5.dumps('\u00e9', ensure_ascii=False), '"\u00e9"')
+        self.assertEqual(json5.dumps({'a': 1}, compact=True, as_json=True),
+                         '{"a": 1}')
+        self.assertRaises(TypeError, json5.dumps, obj, quote_keys=True)
+
+    def test_float_constants(self):
+        self.check([float('inf'), -float('inf'), float('nan'), 1.5],
+                   '[Infinity,-Infinity,NaN,1.5]')
+
+    def test_escapes(self):
+        self.check('a\\b\n\x00\u2028', "'a\\\\b\\n\\u0000\\u2028'")
+        self.assertEqual(json5.loads(json5.dumps('a\\b\n\x00\u2028')),
+                         'a\\b\n\x00\u2028')
+
+    def test_indent(self):
+        obj = {'a': [1, {'b': 2}], 'c': [], 'd': 'e'}
+        self.assertEqual(json5.dumps(obj, as_json5=True, indent=2),
+                         "{\n"
+                         "  a: [\n"
+                         "    1,\n"
+                         "    {\n"
+                         "      b: 2\n"
+                         "    }\n"
+                         "  ],\n"
+                         "  c: [],\n"
+                         "  d: 'e'\n"
+                         "}")
+        self.assertEqual(json5.dumps([1], as_json5=True, indent='\t'),
+                         '[\n\t1\n]')
+        self.assertEqual(json5.dumps([1], as_json5=True, indent=0),
+                         '[\n1\n]')
+
+    def test_sort_keys(self):
+        self.assertEqual(
+            json5.dumps({'b': 1, 'a': {'d': 2, 'c': 3}}, compact=True,
+                        sort_keys=True),
+            '{a:{c:3,d:2},b:1}')
+
+    def test_quotes(self):
+        obj = {'a': "it's", 'b c': 'd'}
+        self.assertEqual(json5.dumps(obj, compact=True, quote_keys=True),
+                         """{"a":"it's","b c":'d'}""")
+        self.assertEqual(json5.dumps(obj, compact=True, quote_style='double'),
+                         """{a:"it's","b c":"d"}""")
+        self.assertEqual(json5.dumps(obj, compact=True, quote_style='single'),
+                         """{a:'it\\'s','b c':'d'}""")
+        self.assertRaises(ValueError, json5.dumps, obj, compact=True,
+                          quote_style='back')
+
+    def test_circular(self):
+        obj = []
+        obj.append(obj)
+        self.assertRaises(ValueError, json5.dumps, obj)
+        self.assertRaises(ValueError, json5.dumps, obj, as_json5=True)
+        self.assertRaises(ValueError, json5.dumps, obj, as_json5=True,
+                          indent=2)
+        obj = [[]]
+        self.assertEqual(json5.dumps([obj, obj], compact=True), '[[[]],[[]]]')
+
+    def test_deep_nesting(self):
+        obj = json5.loads('[' * 5000 + ']' * 5000)
+        self.assertEqual(json5.dumps(obj, as_json5=True),
+                         '[' * 4999 + '[]' + ']' * 4999)
+
+    def test_unsupported(self):
+        self.assertRaises(TypeError, json5.dumps, set())
+        self.assertRaises(TypeError, json5.dumps, {(1, 2): 3})
+        self.assertRaises(TypeError, json5.dumps, [], as_json5=True,
+                          ensure_ascii=False)
+
+    def test_as_json(self):
+        self.assertEqual(json5.dumps({'a': [1]}, as_json=True, indent=1,
+                                     sort_keys=True),
+                         '{\n "a": [\n  1\n ]\n}')
 
     def test_strings(self):
         self.check("'single'", '"\'single\'"')
@@ -51,13 +51,33 @@ def main(argv=None, host=None):
         return 0
 
     if args.cmd:
-        inp = args.cmd
+        obj = lib.loads(args.cmd)
     else:
-        inp = ''.join(host.fileinput(args.files))
+        obj = lib.load(_LineReader(host.fileinput(args.files)))
 
-    host.print_(lib.dumps(lib.loads(inp), compact=True, as_json=args.as_json))
+    host.print_(lib.dumps(obj, compact=True, as_json=args.as_json))
     return 0
 
 
+class _LineReader(object):
+    """A file-like object reading from an iterable of lines, so that the
+    input can be parsed without joining all of it first."""
+
+    def __init__(self, lines):
+        self._lines = iter(lines)
+
+    def read(self, size):
+        # Only whole lines are returned, so this may return more than `size`
+        # characters.
+        chunks = []
+        n = 0
+        for line in self._lines:
+            chunks.append(line)
+            n += len(line)
+            if n >= size:
+                break
+        return ''.join(chunks)
+
+
 if __name__ == '__main__':  # pragma: no cover
     sys.exit(main())